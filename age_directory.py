@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Directory Age Extraction
+Extracts ages from every JSON / JSON Lines file in a directory at once:
+files are read concurrently by an asyncio pipeline and parsed in a worker
+pool, and the results are merged into one extracted_age.json-style report
+Date: October 18, 2025
+
+Examples:
+    py age_directory.py departments
+    py age_directory.py departments -o all_ages.json --name smith --max-reads 32
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from age_enrichment import enrich_ages
+from json_serializer import loads, loads_for, save_json
+from jsonl_reader import is_jsonl_file
+from people_index import normalize_name, people_from_data
+
+JSON_EXTENSIONS = ('.json', '.jsonl', '.ndjson')
+DEFAULT_MAX_READS = 16
+EXTRACTION_DATE = "2025-10-18"
+
+def list_json_files(directory: str) -> List[str]:
+    """JSON / JSON Lines files directly inside directory, sorted by name"""
+    return sorted(os.path.join(directory, entry.name) for entry in os.scandir(directory)
+                  if entry.is_file() and entry.name.lower().endswith(JSON_EXTENSIONS))
+
+def _read_bytes(filename: str) -> bytes:
+    with open(filename, 'rb') as file:
+        return file.read()
+
+def _parse(raw: bytes, filename: str) -> Any:
+    if is_jsonl_file(filename):
+        parse = loads_for(raw)
+        return [parse(line) for line in raw.splitlines() if line.strip()]
+    return loads(raw)
+
+def extract_ages(data: Any, person_name: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Age records for one parsed document, without printing
+
+    A single person with an 'age' field, a list of people or a
+    {"people": [...]} document all work; person_name keeps only names that
+    contain it (ignoring case). Records match extract_age_from_data's.
+    """
+    people = [data] if isinstance(data, dict) and 'age' in data else people_from_data(data)
+    found = [person for person in people if isinstance(person, dict) and 'age' in person]
+    if person_name:
+        key = normalize_name(person_name)
+        found = [person for person in found if key in normalize_name(person.get('name', ''))]
+
+    enriched = enrich_ages([person['age'] for person in found])
+    return [{'name': person.get('name', f'Person {i + 1}'),
+             'age': person['age'],
+             'age_numeric': enriched.age(i),
+             'category': enriched.category(i),
+             'birth_year': enriched.birth_year(i)}
+            for i, person in enumerate(found)]
+
+def extract_file_ages(raw: bytes, filename: str,
+                      person_name: Optional[str] = None) -> Dict[str, Any]:
+    """Parse one file's bytes and extract its ages (runs in the worker pool)"""
+    start = time.perf_counter()
+    try:
+        records = extract_ages(_parse(raw, filename), person_name)
+        error = None
+    except ValueError as e:  # includes UnicodeDecodeError
+        records, error = [], f"Invalid JSON format: {e}"
+    except Exception as e:
+        # One unusual file must not abort the whole directory
+        records, error = [], f"{type(e).__name__}: {e}"
+    return {'records': records, 'error': error, 'parse_seconds': time.perf_counter() - start}
+
+async def _extract_one(filename: str, person_name: Optional[str], executor: Executor,
+                       semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+    loop = asyncio.get_running_loop()
+    # The semaphore bounds the files in flight, so at most max_reads files'
+    # bytes are held in memory between reading and parsing
+    async with semaphore:
+        start = time.perf_counter()
+        try:
+            raw = await asyncio.to_thread(_read_bytes, filename)
+        except OSError as e:
+            return {'file': filename, 'error': str(e), 'records': [],
+                    'read_seconds': time.perf_counter() - start, 'parse_seconds': 0.0}
+        read_seconds = time.perf_counter() - start
+        try:
+            result = await loop.run_in_executor(executor, extract_file_ages, raw, filename, person_name)
+        except Exception as e:
+            # e.g. a worker process that died, or a result that cannot be pickled
+            result = {'records': [], 'error': f"{type(e).__name__}: {e}", 'parse_seconds': 0.0}
+    return {'file': filename, 'read_seconds': read_seconds, **result}
+
+async def extract_directory_async(filenames: List[str], person_name: Optional[str] = None,
+                                  max_reads: int = DEFAULT_MAX_READS, workers: Optional[int] = None,
+                                  use_threads: bool = False) -> List[Dict[str, Any]]:
+    """Per-file results (in filenames order) from the read -> parse pipeline
+
+    Parsing runs in a process pool by default, since the JSON parsers hold
+    the GIL; use_threads avoids the start-up cost for a handful of files.
+    """
+    semaphore = asyncio.Semaphore(max_reads)
+    pool = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+    with pool(max_workers=workers) as executor:
+        return await asyncio.gather(*(_extract_one(filename, person_name, executor, semaphore)
+                                      for filename in filenames))
+
+def build_report(directory: str, results: List[Dict[str, Any]], elapsed: float,
+                 person_name: Optional[str] = None) -> Dict[str, Any]:
+    """Merge per-file results into one report shaped like extracted_age.json"""
+    files = []
+    ages = []
+    for result in results:
+        source_file = os.path.basename(result['file'])
+        entry = {'file': source_file, 'people': len(result['records']),
+                 'read_seconds': round(result['read_seconds'], 6),
+                 'parse_seconds': round(result['parse_seconds'], 6)}
+        if result['error']:
+            entry['error'] = result['error']
+        files.append(entry)
+        ages.extend({'source_file': source_file, **record} for record in result['records'])
+
+    return {
+        "extraction_date": EXTRACTION_DATE,
+        "source_directory": directory,
+        "extracted_age_info": ages,
+        "files": files,
+        "summary": {
+            "files": len(files),
+            "failed_files": sum(1 for entry in files if 'error' in entry),
+            "people": len(ages),
+            "elapsed_seconds": round(elapsed, 6),
+        },
+        "user_request": {
+            "person_name": person_name,
+            "extraction_type": "age_information"
+        }
+    }
+
+def extract_directory(directory: str, person_name: Optional[str] = None,
+                      max_reads: int = DEFAULT_MAX_READS, workers: Optional[int] = None,
+                      use_threads: bool = False, exclude: Optional[str] = None) -> Dict[str, Any]:
+    """Extract ages from every JSON file in directory into one report
+
+    exclude: a file to leave out, e.g. the report itself when it is written
+    into the same directory. Raises FileNotFoundError for a missing directory.
+    """
+    filenames = list_json_files(directory)
+    if exclude is not None:
+        filenames = [name for name in filenames
+                     if os.path.abspath(name) != os.path.abspath(exclude)]
+    start = time.perf_counter()
+    results = asyncio.run(extract_directory_async(filenames, person_name, max_reads,
+                                                  workers, use_threads))
+    return build_report(directory, results, time.perf_counter() - start, person_name)
+
+def print_report_summary(report: Dict[str, Any]) -> None:
+    """Per-file timing table and totals"""
+    for entry in report['files']:
+        status = f"✗ {entry['error']}" if 'error' in entry else f"{entry['people']} people"
+        print(f"  {entry['file']}: {status} "
+              f"(read {entry['read_seconds'] * 1000:.1f} ms, parse {entry['parse_seconds'] * 1000:.1f} ms)")
+    summary = report['summary']
+    print(f"\n✓ {summary['people']} people from {summary['files']} files "
+          f"({summary['failed_files']} failed) in {summary['elapsed_seconds']:.2f}s")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Extract ages from a directory of JSON files from the command line"""
+    parser = argparse.ArgumentParser(description="Extract ages from every JSON file in a directory")
+    parser.add_argument("directory")
+    parser.add_argument("--output", "-o", default="extracted_age.json",
+                        help="report file (default: extracted_age.json)")
+    parser.add_argument("--name", help="only people whose name contains this")
+    parser.add_argument("--max-reads", type=int, default=DEFAULT_MAX_READS,
+                        help=f"files in flight at once (default: {DEFAULT_MAX_READS})")
+    parser.add_argument("--workers", "-w", type=int, help="parse workers (default: CPU count)")
+    parser.add_argument("--threads", action="store_true", help="parse in threads, not processes")
+    args = parser.parse_args(argv)
+
+    print("Directory Age Extraction")
+    print("="*40)
+    if args.max_reads < 1:
+        print("✗ Error: --max-reads must be >= 1")
+        return 1
+    try:
+        report = extract_directory(args.directory, args.name, args.max_reads, args.workers,
+                                   args.threads, exclude=args.output)
+    except (FileNotFoundError, NotADirectoryError):
+        print(f"✗ Error: Directory '{args.directory}' not found!")
+        return 1
+    print_report_summary(report)
+    save_json(report, args.output)
+    print(f"✓ Report saved to: {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Age Categories and Birth Years
+One vectorized step that turns a batch of ages into category codes and
+approximate birth years for all the age tools
+Date: October 18, 2025
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from person_record import MAX_AGE, MIN_AGE, parse_age
+
+REFERENCE_YEAR = 2025
+# Lowest age of every category after the first: <18 Minor, 18-64 Adult, 65+ Senior
+CATEGORY_EDGES = (18, 65)
+CATEGORY_NAMES = ("Minor", "Adult", "Senior")
+UNKNOWN_CODE = -1
+
+def category_labels(edges: Sequence[int] = CATEGORY_EDGES,
+                    names: Sequence[str] = CATEGORY_NAMES) -> List[str]:
+    """Plural labels with their age ranges, e.g. 'Adults (18-64)'"""
+    labels = [f"{names[0]}s (<{edges[0]})"]
+    labels += [f"{name}s ({low}-{high - 1})" for name, low, high in zip(names[1:], edges, edges[1:])]
+    labels.append(f"{names[-1]}s ({edges[-1]}+)")
+    return labels
+
+class EnrichedAges:
+    """Ages of a batch of people with their category codes and birth years
+
+    ages         - parsed ages (0 where the age was not valid)
+    valid        - True where the age parsed and lies in MIN_AGE..MAX_AGE
+    codes        - index into names, or UNKNOWN_CODE for invalid ages
+    birth_years  - reference_year - age (meaningless where not valid)
+    """
+
+    def __init__(self, ages: np.ndarray, valid: np.ndarray, codes: np.ndarray,
+                 birth_years: np.ndarray, names: Sequence[str]) -> None:
+        self.ages = ages
+        self.valid = valid
+        self.codes = codes
+        self.birth_years = birth_years
+        self.names = tuple(names)
+
+    def __len__(self) -> int:
+        return len(self.ages)
+
+    def age(self, i: int) -> Optional[int]:
+        return int(self.ages[i]) if self.valid[i] else None
+
+    def category(self, i: int) -> str:
+        code = int(self.codes[i])
+        return "Unknown" if code == UNKNOWN_CODE else self.names[code]
+
+    def birth_year(self, i: int) -> Optional[int]:
+        return int(self.birth_years[i]) if self.valid[i] else None
+
+    def category_counts(self) -> Dict[str, int]:
+        """People per category name, invalid ages under 'Unknown'"""
+        counts = np.bincount(self.codes[self.valid], minlength=len(self.names))
+        result = {name: int(count) for name, count in zip(self.names, counts)}
+        result["Unknown"] = int(len(self.codes) - self.valid.sum())
+        return result
+
+def categorize(ages: np.ndarray, edges: Sequence[int] = CATEGORY_EDGES) -> np.ndarray:
+    """Category code of every age: 0 below edges[0], 1 from edges[0] up to edges[1], ..."""
+    return np.digitize(ages, edges).astype(np.int8)
+
+def enrich_ages(values: Sequence[Any], reference_year: int = REFERENCE_YEAR,
+                edges: Sequence[int] = CATEGORY_EDGES,
+                names: Sequence[str] = CATEGORY_NAMES) -> EnrichedAges:
+    """Categorize a batch of ages and derive birth years in one vectorized step
+
+    values may be raw JSON values ("45", 45, "unknown", ...) or an integer
+    NumPy array of already parsed ages. Values that int() cannot convert,
+    and ages outside MIN_AGE..MAX_AGE, get category 'Unknown' and no birth year.
+    """
+    if len(names) != len(edges) + 1:
+        raise ValueError(f"Need {len(edges) + 1} category names for {len(edges)} edges, got {len(names)}")
+    if list(edges) != sorted(edges):
+        raise ValueError(f"Category edges must be increasing, got {list(edges)}")
+
+    if isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.integer):
+        valid = (values >= MIN_AGE) & (values <= MAX_AGE)
+        ages = np.where(valid, values, 0).astype(np.int64)
+    else:
+        parsed = [parse_age(value) for value in values]
+        valid = np.array([age is not None for age in parsed], dtype=bool)
+        ages = np.array([age if age is not None else 0 for age in parsed], dtype=np.int64)
+
+    codes = np.select([valid], [categorize(ages, edges)], default=UNKNOWN_CODE).astype(np.int8)
+    birth_years = reference_year - ages
+    return EnrichedAges(ages, valid, codes, birth_years, names)
+
+def main():
+    """Enrich the ages of the sample people"""
+    print("Age Categories and Birth Years")
+    print("="*40)
+
+    values = ["89", "45", "17", 32, "unknown", None, "65"]
+    enriched = enrich_ages(values)
+    for i, value in enumerate(values):
+        born = f"born ~{enriched.birth_year(i)}" if enriched.valid[i] else "invalid age"
+        print(f"{value!r:>10}: {enriched.category(i):8} {born}")
+    print(f"\n✓ {enriched.category_counts()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Age Tool Session
+Keeps one loaded file, its indexes and its statistics for a whole
+interactive session, so repeated searches only pay for the lookup.
+Columnar files (.parquet / .arrow) are queried in place instead
+Date: October 18, 2025
+"""
+
+import os
+from typing import Any, List, Optional
+
+from age_index import AgeIndex
+from age_stats import AgeStatistics
+from json_cache import Signature, file_signature
+from people_index import PeopleIndex, people_from_data
+from people_store import (PeopleStore, age_between, is_columnar_file, name_contains,
+                          name_equals, name_starts_with)
+from person_record import Person, load_people_file, to_people
+
+class AgeSession:
+    """State shared by every query of an interactive age tool run
+
+    Indexes and statistics are built the first time they are needed and
+    dropped when the file changes on disk (modification time or size). The
+    find_* methods answer the age tools' searches from the indexes, or from
+    a PeopleStore when the file is columnar (then data stays None). People are Person records,
+    each built as soon as it is parsed (load_people_file): data holds the
+    records rather than the person dictionaries, and is not kept in the
+    shared document cache.
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        self.data: Any = None
+        self.store: Optional[PeopleStore] = None
+        self._signature: Optional[Signature] = None
+        self._clear()
+
+    def _clear(self) -> None:
+        self._people: Optional[List[Any]] = None
+        self._name_index: Optional[PeopleIndex] = None
+        self._age_index: Optional[AgeIndex] = None
+        self._statistics: Optional[AgeStatistics] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.data is not None or self.store is not None
+
+    def exists(self) -> bool:
+        return os.path.exists(self.filename)
+
+    def load(self) -> bool:
+        """Load the file, or keep the current data if the file is unchanged
+
+        Returns True when new data was loaded. Raises FileNotFoundError or
+        ValueError (invalid JSON) like load_people_file.
+        """
+        # The session keeps what it loaded, so an unchanged file costs one
+        # stat even when the document is too large for the shared cache
+        signature = file_signature(self.filename)
+        if self.loaded and signature == self._signature:
+            return False
+
+        if is_columnar_file(self.filename):
+            self.store = PeopleStore(self.filename)
+            self.data = None
+        else:
+            self.data = load_people_file(self.filename)
+            self.store = None
+        self._signature = signature
+        self._clear()
+        return True
+
+    @property
+    def people(self) -> List[Any]:
+        if self._people is None:
+            self._people = to_people(people_from_data(self.data))
+        return self._people
+
+    @property
+    def name_index(self) -> PeopleIndex:
+        if self._name_index is None:
+            self._name_index = PeopleIndex(self.people)
+        return self._name_index
+
+    @property
+    def age_index(self) -> AgeIndex:
+        if self._age_index is None:
+            self._age_index = AgeIndex(self.people)
+        return self._age_index
+
+    @property
+    def statistics(self) -> AgeStatistics:
+        if self._statistics is None:
+            if self.store is not None:
+                self._statistics = self.store.statistics()
+            else:
+                self._statistics = AgeStatistics.from_index(self.age_index)
+        return self._statistics
+
+    def count(self) -> int:
+        """Number of people"""
+        return len(self.store) if self.store is not None else len(self.people)
+
+    def find_exact(self, name: str) -> List[Person]:
+        """People whose name equals name, ignoring case"""
+        if self.store is not None:
+            return self.store.records(name_equals(name))
+        return self.name_index.get(self.name_index.exact(name))
+
+    def find_partial(self, text: str) -> List[Person]:
+        """People whose name contains text, ignoring case"""
+        if self.store is not None:
+            return self.store.records(name_contains(text))
+        return self.name_index.get(self.name_index.substring(text))
+
+    def find_prefix(self, text: str) -> List[Person]:
+        """People whose name starts with text, ignoring case"""
+        if self.store is not None:
+            return self.store.records(name_starts_with(text))
+        return self.name_index.get(self.name_index.prefix(text))
+
+    def find_age_range(self, min_age: int, max_age: int) -> List[Person]:
+        """People aged min_age..max_age inclusive (invalid ages never match)"""
+        if self.store is not None:
+            return self.store.records(age_between(min_age, max_age))
+        return self.age_index.get(self.age_index.range(min_age, max_age))
+
+    def all_people(self) -> List[Person]:
+        return self.store.records() if self.store is not None else self.people
+
+    def sample_names(self, limit: int) -> List[str]:
+        """The first limit names"""
+        if self.store is not None:
+            return self.store.names(limit)
+        return [person.get('name', 'Unknown') for person in self.people[:limit]]
+
+    def invalid_age_count(self) -> int:
+        """People whose age is not a number"""
+        return self.statistics.invalid
+
+def main():
+    """Load sample.json into a session twice and show what was reused"""
+    print("Age Tool Session")
+    print("="*40)
+
+    session = AgeSession('sample.json')
+    try:
+        for attempt in range(1, 3):
+            changed = session.load()
+            print(f"Load {attempt}: {'parsed' if changed else 'unchanged, reused'}")
+    except FileNotFoundError:
+        print("✗ Error: File 'sample.json' not found!")
+        return
+    except ValueError as e:
+        print(f"✗ Error: Invalid JSON format: {e}")
+        return
+    print(f"✓ {session.count()} people, {session.statistics.count} valid ages")
+
+if __name__ == "__main__":
+    main()
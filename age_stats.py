@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Age Statistics
+Count, mean, min, max, percentiles and age categories from one vectorized
+pass over an array of ages, mergeable across chunks of a larger dataset
+Date: October 18, 2025
+"""
+
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from age_enrichment import CATEGORY_EDGES, CATEGORY_NAMES, categorize, category_labels
+from age_index import AgeIndex
+from person_record import MAX_AGE, MIN_AGE, Person, parse_age
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+class AgeStatistics:
+    """Summary of a set of ages, stored as a histogram (distinct age -> count)
+
+    Everything is derived from the histogram, so two summaries merge exactly
+    (percentiles included) and the cost after the first pass depends only on
+    the number of distinct ages.
+    """
+
+    def __init__(self, values: Optional[np.ndarray] = None, counts: Optional[np.ndarray] = None,
+                 invalid: int = 0) -> None:
+        self.values = values if values is not None else np.empty(0, dtype=np.int64)
+        self.counts = counts if counts is not None else np.empty(0, dtype=np.int64)
+        self.invalid = invalid
+        self._cumulative = np.cumsum(self.counts)
+
+    @classmethod
+    def from_ages(cls, ages: Sequence[int], invalid: int = 0) -> 'AgeStatistics':
+        """Summarize an array (or list) of integer ages
+
+        Ages outside MIN_AGE..MAX_AGE are counted as invalid, as parse_age does.
+        """
+        ages = np.asarray(ages)
+        in_range = (ages >= MIN_AGE) & (ages <= MAX_AGE)
+        invalid += int(ages.size - np.count_nonzero(in_range))
+        ages = ages[in_range].astype(np.int64)
+        if ages.size == 0:
+            return cls(invalid=invalid)
+        histogram = np.bincount(ages - MIN_AGE)
+        present = np.flatnonzero(histogram)
+        return cls(present + MIN_AGE, histogram[present], invalid)
+
+    @classmethod
+    def from_index(cls, index: AgeIndex) -> 'AgeStatistics':
+        """Summarize the ages already parsed by an AgeIndex"""
+        return cls.from_ages(index.ages, len(index.invalid))
+
+    @classmethod
+    def from_people(cls, people: Iterable[Any]) -> 'AgeStatistics':
+        """Summarize the 'age' field of a list of people (missing counts as 0)"""
+        ages: List[int] = []
+        invalid = 0
+        for person in people:
+            if isinstance(person, Person):
+                age = person.age
+            else:
+                age = parse_age(person.get('age', 0)) if isinstance(person, dict) else None
+            if age is None:
+                invalid += 1
+            else:
+                ages.append(age)
+        return cls.from_ages(ages, invalid)
+
+    def merge(self, other: 'AgeStatistics') -> 'AgeStatistics':
+        """Combined summary of both sets of ages"""
+        values = np.concatenate([self.values, other.values])
+        counts = np.concatenate([self.counts, other.counts])
+        merged_values, inverse = np.unique(values, return_inverse=True)
+        merged_counts = np.zeros(len(merged_values), dtype=np.int64)
+        np.add.at(merged_counts, inverse, counts)
+        return AgeStatistics(merged_values, merged_counts, self.invalid + other.invalid)
+
+    __add__ = merge
+
+    @property
+    def count(self) -> int:
+        return int(self._cumulative[-1]) if len(self._cumulative) else 0
+
+    @property
+    def total(self) -> int:
+        return int(np.dot(self.values, self.counts))
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    @property
+    def min(self) -> Optional[int]:
+        return int(self.values[0]) if self.count else None
+
+    @property
+    def max(self) -> Optional[int]:
+        return int(self.values[-1]) if self.count else None
+
+    def _value_at(self, rank: int) -> int:
+        """The rank-th smallest age (0-based)"""
+        return int(self.values[np.searchsorted(self._cumulative, rank, side='right')])
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q-th percentile with linear interpolation, like np.percentile"""
+        if not self.count:
+            return None
+        position = q / 100 * (self.count - 1)
+        lower = int(np.floor(position))
+        low_value = self._value_at(lower)
+        if position == lower:
+            return float(low_value)
+        high_value = self._value_at(lower + 1)
+        return low_value + (high_value - low_value) * (position - lower)
+
+    def percentiles(self, qs: Iterable[float] = (25, 50, 75)) -> Dict[float, Optional[float]]:
+        return {q: self.percentile(q) for q in qs}
+
+    def categories(self, edges: Sequence[int] = CATEGORY_EDGES,
+                   names: Sequence[str] = CATEGORY_NAMES) -> Dict[str, int]:
+        """People per age category (label -> count), youngest category first"""
+        counts = np.bincount(categorize(self.values, edges), weights=self.counts,
+                             minlength=len(names))
+        return {label: int(count) for label, count in zip(category_labels(edges, names), counts)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dictionary form, suitable for json.dump"""
+        return {
+            "count": self.count,
+            "invalid": self.invalid,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "percentiles": {str(q): value for q, value in self.percentiles().items()},
+            "categories": self.categories(),
+        }
+
+    def format(self) -> List[str]:
+        """Lines for the DATABASE STATISTICS block"""
+        if not self.count:
+            return []
+        quartiles = self.percentiles()
+        lines = [
+            f"Total people with valid ages: {self.count}",
+            f"Average age: {self.mean:.1f}",
+            f"Youngest: {self.min}",
+            f"Oldest: {self.max}",
+            f"Median age: {quartiles[50]:g} (middle half {quartiles[25]:g}-{quartiles[75]:g})",
+        ]
+        # Oldest category first, as the age tools always printed them
+        lines.extend(f"{label}: {count}" for label, count in reversed(self.categories().items()))
+        return lines
+
+def stream_age_statistics(people: Iterable[Any],
+                          chunk_size: int = DEFAULT_CHUNK_SIZE) -> AgeStatistics:
+    """Summarize people from any iterable (e.g. iter_jsonl) one chunk at a time"""
+    people = iter(people)
+    stats = AgeStatistics()
+    while True:
+        chunk = list(islice(people, chunk_size))
+        if not chunk:
+            return stats
+        stats = stats.merge(AgeStatistics.from_people(chunk))
+
+def main():
+    """Summarize a synthetic list of people, whole and in chunks"""
+    from benchmark import generate_document
+
+    print("Age Statistics")
+    print("="*40)
+
+    people = generate_document(100_000)["people"]
+    for line in AgeStatistics.from_people(people).format():
+        print(line)
+
+    chunked = stream_age_statistics(people, chunk_size=30_000)
+    print(f"\n✓ Merged from chunks: mean {chunked.mean:.1f}, median {chunked.percentile(50):g}")
+
+if __name__ == "__main__":
+    main()
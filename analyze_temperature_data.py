@@ -2,80 +2,106 @@
 """
 Temperature Data Analysis
 Demonstrates working with the generated temperature CSV data
+(files too big for memory are analyzed chunk by chunk)
 """
 
+import argparse
+import os
+
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from csv_schema import TEMPERATURE_SCHEMA, display_frame, read_typed_csv
+from temperature_stats import DEFAULT_CHUNK_ROWS, analyze_temperature_file, analyze_temperatures
+
+# Files larger than this are streamed instead of loaded whole
+STREAM_THRESHOLD_BYTES = 512 * 1024 * 1024
+
 def load_and_analyze_temperature_data():
-    """Load and analyze the temperature data CSV"""
+    """Load and analyze the temperature data CSV; returns the DataFrame (None on failure)"""
+    loaded = load_temperature_analysis()
+    return None if loaded is None else loaded[0]
+
+def load_temperature_analysis():
+    """Load and analyze the temperature data CSV, returning (df, results)
+    
+    results is the TemperatureAnalysis every later step reads from, so
+    nothing is computed twice. Returns None if the file cannot be loaded.
+    """
     
     print("Temperature Data Analysis")
     print("="*40)
     
-    # Load the CSV file
+    # Load the CSV file with declared dtypes (dates parsed while reading)
     try:
-        df = pd.read_csv('temperature_data.csv')
+        df = read_typed_csv('temperature_data.csv', TEMPERATURE_SCHEMA)
         print("✓ Successfully loaded temperature_data.csv")
     except FileNotFoundError:
         print("✗ temperature_data.csv not found. Please run generate_temperature_data.py first.")
         return
+    except ValueError as e:
+        print(f"✗ Invalid data in temperature_data.csv: {e}")
+        return
     
+    # Every metric in one pass
+    results = analyze_temperatures(df)
+    
+    # Display first few rows
+    print_analysis(results, df.head())
+    
+    return df, results
+
+def print_analysis(results, head=None):
+    """Print the analysis from a TemperatureAnalysis (head: first rows to show)"""
     # Display basic information
     print(f"\nDataset Info:")
-    print(f"- Shape: {df.shape[0]} rows, {df.shape[1]} columns")
-    print(f"- Date range: {df['Date'].iloc[0]} to {df['Date'].iloc[-1]}")
-    print(f"- Columns: {', '.join(df.columns)}")
+    print(f"- Shape: {results.rows} rows, {len(results.columns)} columns")
+    print(f"- Date range: {results.first_date} to {results.last_date}")
+    print(f"- Columns: {', '.join(results.columns)}")
     
     # Display first few rows
-    print(f"\nFirst 5 rows:")
-    print(df.head())
+    if head is not None:
+        print(f"\nFirst 5 rows:")
+        print(display_frame(head))
     
     # Basic statistics
     print(f"\nTemperature Statistics (Fahrenheit):")
-    print(f"High Temperature - Mean: {df['High_Temp_F'].mean():.1f}°F, "
-          f"Min: {df['High_Temp_F'].min()}°F, Max: {df['High_Temp_F'].max()}°F")
-    print(f"Low Temperature - Mean: {df['Low_Temp_F'].mean():.1f}°F, "
-          f"Min: {df['Low_Temp_F'].min()}°F, Max: {df['Low_Temp_F'].max()}°F")
-    print(f"Average Temperature: {df['Avg_Temp_F'].mean():.1f}°F")
-    print(f"Average Humidity: {df['Humidity_%'].mean():.1f}%")
+    print(f"High Temperature - Mean: {results.mean['High_Temp_F']:.1f}°F, "
+          f"Min: {results.min['High_Temp_F']}°F, Max: {results.max['High_Temp_F']}°F")
+    print(f"Low Temperature - Mean: {results.mean['Low_Temp_F']:.1f}°F, "
+          f"Min: {results.min['Low_Temp_F']}°F, Max: {results.max['Low_Temp_F']}°F")
+    print(f"Average Temperature: {results.mean['Avg_Temp_F']:.1f}°F")
+    print(f"Average Humidity: {results.mean['Humidity_%']:.1f}%")
     
     # Weather condition analysis
     print(f"\nWeather Conditions Analysis:")
-    condition_summary = df['Condition'].value_counts()
-    for condition, count in condition_summary.items():
-        percentage = (count / len(df)) * 100
+    for condition, count, percentage in results.condition_summary():
         print(f"- {condition}: {count} days ({percentage:.1f}%)")
     
     # Temperature trends
     print(f"\nTemperature Trends:")
-    hottest_day = df.loc[df['High_Temp_F'].idxmax()]
-    coldest_day = df.loc[df['Low_Temp_F'].idxmin()]
+    hottest_day = results.hottest
+    coldest_day = results.coldest
     print(f"Hottest day: {hottest_day['Date']} - {hottest_day['High_Temp_F']}°F ({hottest_day['Condition']})")
     print(f"Coldest day: {coldest_day['Date']} - {coldest_day['Low_Temp_F']}°F ({coldest_day['Condition']})")
     
     # Find patterns
-    rainy_days = df[df['Condition'] == 'Rainy']
-    high_humidity_days = df[df['Humidity_%'] > 80]
-    
     print(f"\nPattern Analysis:")
-    print(f"- Days with high humidity (>80%): {len(high_humidity_days)}")
-    if len(high_humidity_days) > 0:
-        print(f"  Average temperature on high humidity days: {high_humidity_days['Avg_Temp_F'].mean():.1f}°F")
+    print(f"- Days with high humidity (>80%): {results.high_humidity_days}")
+    if results.high_humidity_days > 0:
+        print(f"  Average temperature on high humidity days: {results.high_humidity_avg_temp:.1f}°F")
     
     # Temperature ranges
-    large_range_days = df[df['Temp_Range_F'] > 20]
-    print(f"- Days with large temperature range (>20°F): {len(large_range_days)}")
-    
-    return df
+    print(f"- Days with large temperature range (>20°F): {results.large_range_days}")
 
 def create_temperature_visualizations(df):
     """Create visualizations of the temperature data"""
     
     print(f"\nCreating temperature visualizations...")
     
-    # Convert Date column to datetime for better plotting
-    df['Date'] = pd.to_datetime(df['Date'])
+    # Dates are already parsed by read_typed_csv; convert only if given strings
+    if not pd.api.types.is_datetime64_any_dtype(df['Date']):
+        df['Date'] = pd.to_datetime(df['Date'])
     
     # Create a figure with multiple subplots
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
@@ -115,68 +141,88 @@ def create_temperature_visualizations(df):
     print("✓ Temperature visualization saved as 'temperature_analysis.png'")
     plt.show()
 
-def export_analysis_results(df):
-    """Export analysis results to files"""
+def export_analysis_results(df, results=None):
+    """Export analysis results to files (results: analyze_temperatures(df), reused if given)"""
     
     print(f"\nExporting analysis results...")
+    if results is None:
+        results = analyze_temperatures(df)
     
     # Create summary statistics
-    summary_stats = {
-        'Metric': [
-            'Average High Temperature (°F)',
-            'Average Low Temperature (°F)', 
-            'Highest Temperature (°F)',
-            'Lowest Temperature (°F)',
-            'Average Humidity (%)',
-            'Days with High Humidity (>80%)',
-            'Most Common Weather Condition',
-            'Temperature Range Average (°F)'
-        ],
-        'Value': [
-            f"{df['High_Temp_F'].mean():.1f}",
-            f"{df['Low_Temp_F'].mean():.1f}",
-            f"{df['High_Temp_F'].max()}",
-            f"{df['Low_Temp_F'].min()}",
-            f"{df['Humidity_%'].mean():.1f}",
-            f"{len(df[df['Humidity_%'] > 80])}",
-            f"{df['Condition'].mode().iloc[0]}",
-            f"{df['Temp_Range_F'].mean():.1f}"
-        ]
-    }
-    
-    summary_df = pd.DataFrame(summary_stats)
-    summary_df.to_csv('temperature_summary.csv', index=False)
-    print("✓ Summary statistics saved to 'temperature_summary.csv'")
+    export_summary(results)
     
-    # Export filtered data (hot days)
-    hot_days = df[df['High_Temp_F'] >= 75].copy()
-    if len(hot_days) > 0:
-        hot_days.to_csv('hot_days.csv', index=False)
-        print(f"✓ Hot days data ({len(hot_days)} days) saved to 'hot_days.csv'")
+    # Export filtered data (hot days), selected by the masks of the analysis pass
+    if results.hot_days > 0:
+        df[results.hot_mask].to_csv('hot_days.csv', index=False)
+        print(f"✓ Hot days data ({results.hot_days} days) saved to 'hot_days.csv'")
     
     # Export filtered data (high humidity days)
-    humid_days = df[df['Humidity_%'] > 80].copy()
-    if len(humid_days) > 0:
-        humid_days.to_csv('high_humidity_days.csv', index=False)
-        print(f"✓ High humidity days ({len(humid_days)} days) saved to 'high_humidity_days.csv'")
+    if results.high_humidity_days > 0:
+        df[results.humid_mask].to_csv('high_humidity_days.csv', index=False)
+        print(f"✓ High humidity days ({results.high_humidity_days} days) saved to 'high_humidity_days.csv'")
 
-def main():
-    """Main analysis function"""
-    
-    # Load and analyze data
-    df = load_and_analyze_temperature_data()
-    if df is None:
-        return
+def export_summary(results):
+    """Write temperature_summary.csv from a TemperatureAnalysis"""
+    results.summary_frame().to_csv('temperature_summary.csv', index=False)
+    print("✓ Summary statistics saved to 'temperature_summary.csv'")
+
+def stream_and_analyze_temperature_data(filename='temperature_data.csv', chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Analyze a CSV of any size chunk by chunk; returns the TemperatureAnalysis
+    
+    Only one chunk is in memory at a time: statistics are running
+    aggregates and hot_days.csv / high_humidity_days.csv are written as
+    the chunks go by.
+    """
+    print("Temperature Data Analysis (streaming)")
+    print("="*40)
     
-    # Create visualizations
     try:
-        create_temperature_visualizations(df)
-    except Exception as e:
-        print(f"Note: Visualization creation failed: {e}")
-        print("This is normal if matplotlib display is not available.")
+        results, head = analyze_temperature_file(filename, chunk_rows, 'hot_days.csv',
+                                                 'high_humidity_days.csv')
+    except FileNotFoundError:
+        print(f"✗ {filename} not found. Please run generate_temperature_data.py first.")
+        return None
+    print(f"✓ Analyzed {filename} in chunks of {chunk_rows:,} rows")
+    print_analysis(results, head)
     
-    # Export results
-    export_analysis_results(df)
+    print(f"\nExporting analysis results...")
+    export_summary(results)
+    if results.hot_days > 0:
+        print(f"✓ Hot days data ({results.hot_days} days) saved to 'hot_days.csv'")
+    if results.high_humidity_days > 0:
+        print(f"✓ High humidity days ({results.high_humidity_days} days) saved to 'high_humidity_days.csv'")
+    return results
+
+def main(argv=None):
+    """Main analysis function"""
+    parser = argparse.ArgumentParser(description="Analyze temperature_data.csv")
+    parser.add_argument("--chunk-rows", type=int,
+                        help="analyze in chunks of this many rows (automatic for files over "
+                             f"{STREAM_THRESHOLD_BYTES // (1024 * 1024)} MB)")
+    args = parser.parse_args(argv)
+    
+    filename = 'temperature_data.csv'
+    large = os.path.exists(filename) and os.path.getsize(filename) > STREAM_THRESHOLD_BYTES
+    if args.chunk_rows is not None or large:
+        # Streaming: no visualizations, they would need every row in memory
+        if stream_and_analyze_temperature_data(filename, args.chunk_rows or DEFAULT_CHUNK_ROWS) is None:
+            return
+    else:
+        # Load and analyze data
+        loaded = load_temperature_analysis()
+        if loaded is None:
+            return
+        df, results = loaded
+        
+        # Create visualizations
+        try:
+            create_temperature_visualizations(df)
+        except Exception as e:
+            print(f"Note: Visualization creation failed: {e}")
+            print("This is normal if matplotlib display is not available.")
+        
+        # Export results
+        export_analysis_results(df, results)
     
     print(f"\n" + "="*50)
     print("Temperature Data Analysis Complete!")
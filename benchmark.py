@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite
+Times the JSON extraction functions on synthetic documents of any size and
+saves the results as a baseline JSON file for comparing commits
+Date: October 18, 2025
+
+Examples:
+    py benchmark.py --people 100000 --save baseline.json
+    py benchmark.py --people 100000 --compare baseline.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import pandas as pd
+
+from csv_schema import TEMPERATURE_SCHEMA, frame_bytes, read_typed_csv
+from generate_temperature_data import write_temperature_data
+from json_columnar import ColumnarRecords
+from json_extraction_demo import find_keys_with_text, find_values_with_text
+from json_extractor import (extract_nested_value, extract_specific_keys,
+                            filter_by_criteria, search_by_value)
+from json_index import ValueIndex
+from json_serializer import dumps_bytes, loads, save_json
+from person_record import to_people
+
+FIRST_NAMES = ["John", "Sarah", "Michael", "Emma", "David", "Olivia", "James", "Sophia", "mk"]
+LAST_NAMES = ["Smith", "Johnson", "Brown", "Garcia", "Miller", "Davis", "Wilson", "Moore"]
+CITIES = ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix", "hihus"]
+HOBBIES = ["reading", "coding", "music", "hiking", "chess", "cooking", "travel"]
+STATUSES = ["completed", "in-progress", "planned"]
+CSV_DAYS = 365            # days per station in the temperature CSV benchmark
+
+def _preferences(rng: random.Random, depth: int) -> Dict[str, Any]:
+    """Nested preferences, depth levels deep"""
+    preferences = {"theme": rng.choice(["dark", "light"]), "language": rng.choice(["en", "fr", "de"])}
+    if depth > 1:
+        preferences["advanced"] = _preferences(rng, depth - 1)
+    return preferences
+
+def generate_document(people: int = 10000, depth: int = 3, width: int = 3, seed: int = 0) -> Dict[str, Any]:
+    """Synthetic document: a 'people' list of records shaped like json_extraction_demo.sample_data
+
+    depth - nesting levels under profile.preferences
+    width - number of hobbies and projects per person
+    """
+    rng = random.Random(seed)
+    records = []
+    for i in range(people):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        records.append({
+            "name": f"{first} {last}",
+            "age": str(rng.randint(1, 99)),
+            "city": rng.choice(CITIES),
+            "email": f"{first.lower()}.{last.lower()}{i}@example.com",
+            "hobbies": [rng.choice(HOBBIES) for _ in range(width)],
+            "profile": {
+                "isActive": rng.random() < 0.7,
+                "lastLogin": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                "preferences": _preferences(rng, depth),
+            },
+            "projects": [
+                {"name": f"Project {chr(65 + j % 26)}", "status": rng.choice(STATUSES),
+                 "budget": rng.randrange(1000, 10000, 500)}
+                for j in range(width)
+            ],
+        })
+    return {"people": records, "metadata": {"total_people": people, "created_date": "2025-10-18"}}
+
+def _quietly(func: Callable[[], Any]) -> Callable[[], Any]:
+    """Run func with its progress prints sent to the null device"""
+    def run():
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            return func()
+    return run
+
+def build_benchmarks(document: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
+    """name -> zero-argument callable; each one processes every person once"""
+    people = document["people"]
+    columns = ColumnarRecords.from_records(people, ["name", "age", "city"])
+    index = ValueIndex.build(document)
+    # The four fields the age tools use, as JSON Lines, for the loader benchmarks
+    lines = [dumps_bytes({key: person[key] for key in ("name", "age", "city", "email")}, compact=True)
+             for person in people]
+
+    def keys_per_record():
+        for person in people:
+            extract_specific_keys(person, ["name", "age", "city"])
+
+    def nested_per_record():
+        for person in people:
+            extract_nested_value(person, "profile.preferences.theme")
+
+    return {
+        "extract_specific_keys": _quietly(keys_per_record),
+        "extract_nested_value": _quietly(nested_per_record),
+        "search_by_value": lambda: search_by_value(document, "Chicago"),
+        "search_by_value_indexed": lambda: search_by_value(document, "Chicago", index),
+        "filter_by_criteria": lambda: filter_by_criteria(people, "city", "Chicago"),
+        "filter_by_criteria_columnar": lambda: filter_by_criteria(columns, "city", "Chicago"),
+        "find_keys_with_text": lambda: find_keys_with_text(document, "name"),
+        "find_values_with_text": lambda: find_values_with_text(document, "pro"),
+        "load_people_dicts": lambda: [loads(line) for line in lines],
+        "load_people_records": lambda: to_people(loads(line) for line in lines),
+    }
+
+def build_csv_benchmarks(filename: str) -> Dict[str, Callable[[], Any]]:
+    """name -> zero-argument callable loading the temperature CSV file whole"""
+    return {
+        "read_csv_inferred": lambda: pd.read_csv(filename),
+        "read_csv_typed": lambda: read_typed_csv(filename, TEMPERATURE_SCHEMA),
+    }
+
+def run_csv_benchmarks(rows: int, seed: int, repeat: int,
+                       only: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Write a temperature CSV of about rows rows and time loading it"""
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "temperature_data.csv")
+        benchmarks = {name: func for name, func in build_csv_benchmarks(filename).items()
+                      if not only or name in only}
+        if not benchmarks:
+            return results
+        rows = write_temperature_data(filename, days=CSV_DAYS,
+                                      stations=max(1, rows // CSV_DAYS), seed=seed)
+        print(f"✓ Generated {rows:,} temperature rows "
+              f"({os.path.getsize(filename) / 1024 ** 2:.1f} MB CSV)")
+        for name, func in benchmarks.items():
+            results[name] = measure(func, rows, repeat)
+            # pyarrow's buffers are invisible to tracemalloc, so the memory
+            # held per row is taken from the DataFrame itself
+            results[name]["bytes_per_item"] = frame_bytes(func()) / rows
+            print_result(name, results[name])
+    return results
+
+def peak_rss_mb() -> Optional[float]:
+    """Highest resident set size of this process so far (None where unsupported)
+
+    It only ever grows, so it is reported once for the whole run; each
+    benchmark's own memory is its tracemalloc peak.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def measure(func: Callable[[], Any], items: int, repeat: int = 5) -> Dict[str, Any]:
+    """Time func (best and median of repeat runs), then measure its allocations once
+
+    bytes_per_item is the memory still held by func's result per item, e.g.
+    the size of one loaded record.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+
+    # Memory is measured in a separate run: tracemalloc slows the code down
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    result = func()
+    retained_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    allocated_blocks = sys.getallocatedblocks() - blocks_before
+    del result
+
+    return {
+        "best_seconds": best,
+        "median_seconds": statistics.median(timings),
+        "items_per_second": items / best if best > 0 else None,
+        "peak_alloc_bytes": peak_bytes,
+        "retained_blocks": allocated_blocks,
+        "bytes_per_item": retained_bytes / items if items else None,
+    }
+
+def git_commit() -> Optional[str]:
+    """Current commit hash, if this is a git checkout"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_benchmarks(people: int, depth: int, width: int, seed: int, repeat: int,
+                   only: Optional[List[str]] = None, csv_rows: int = 0) -> Dict[str, Any]:
+    """Generate the document, run the benchmarks and return the report
+
+    csv_rows: rows in the temperature CSV for the CSV loading benchmarks
+    (0 skips them).
+    """
+    start = time.perf_counter()
+    document = generate_document(people, depth, width, seed)
+    print(f"✓ Generated {people} people (depth {depth}, width {width}) "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    results = {}
+    for name, func in build_benchmarks(document).items():
+        if only and name not in only:
+            continue
+        results[name] = measure(func, people, repeat)
+        print_result(name, results[name])
+    if csv_rows > 0:
+        results.update(run_csv_benchmarks(csv_rows, seed, repeat, only))
+    rss = peak_rss_mb()
+    if rss is not None:
+        print(f"Peak RSS of the whole run: {rss:.1f} MB")
+
+    return {
+        "meta": {
+            "people": people, "depth": depth, "width": width, "seed": seed, "repeat": repeat,
+            "csv_rows": csv_rows, "peak_rss_mb": rss,
+            "python": platform.python_version(), "platform": platform.platform(),
+            "commit": git_commit(), "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "results": results,
+    }
+
+def print_result(name: str, result: Dict[str, Any]) -> None:
+    rate = result["items_per_second"]
+    rate_text = f"{rate:12,.0f} items/s" if rate is not None else " " * 20
+    per_item = result.get("bytes_per_item")
+    per_item_text = f"{per_item:8.1f} B/item" if per_item is not None else ""
+    print(f"{name:30} {result['best_seconds'] * 1000:10.2f} ms {rate_text} "
+          f"{result['peak_alloc_bytes'] / 1024:10.1f} KB peak alloc {per_item_text}")
+
+def compare_reports(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> int:
+    """Print timing ratios against a baseline; returns the number of regressions"""
+    print(f"\nComparison with baseline (commit {baseline['meta'].get('commit')}, "
+          f"{baseline['meta'].get('people')} people):")
+    if baseline["meta"].get("people") != current["meta"]["people"]:
+        print("  Note: baseline used a different document size")
+
+    regressions = 0
+    for name, result in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            print(f"  {name:30} (new)")
+            continue
+        ratio = result["best_seconds"] / old["best_seconds"] if old["best_seconds"] else float('inf')
+        if ratio > 1 + threshold:
+            status = "✗ REGRESSION"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            status = "✓ faster"
+        else:
+            status = "  unchanged"
+        print(f"  {name:30} {ratio:6.2f}x time  {status}")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark suite from the command line"""
+    parser = argparse.ArgumentParser(description="Benchmark the JSON extraction functions")
+    parser.add_argument("--people", type=int, default=10000, help="records in the synthetic document")
+    parser.add_argument("--depth", type=int, default=3, help="nesting depth of profile.preferences")
+    parser.add_argument("--width", type=int, default=3, help="hobbies and projects per person")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark")
+    parser.add_argument("--only", nargs="+", help="run only these benchmarks")
+    parser.add_argument("--csv-rows", type=int, default=100000,
+                        help="temperature CSV rows for the CSV loading benchmarks (0 skips them)")
+    parser.add_argument("--save", help="write the results to this baseline JSON file")
+    parser.add_argument("--compare", help="compare against a saved baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown reported as a regression (default 0.10)")
+    args = parser.parse_args(argv)
+
+    print("JSON Extraction Benchmark")
+    print("="*40)
+    report = run_benchmarks(args.people, args.depth, args.width, args.seed, args.repeat, args.only,
+                            args.csv_rows)
+
+    if args.save:
+        save_json(report, args.save)
+        print(f"\n✓ Results saved to: {args.save}")
+
+    if args.compare:
+        try:
+            with open(args.compare, 'r', encoding='utf-8') as file:
+                baseline = json.load(file)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"✗ Error reading baseline '{args.compare}': {e}")
+            return 1
+        if compare_reports(report, baseline, args.threshold):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,26 +5,30 @@ Reads sales_revenue.csv and generates a bar chart
 Date: October 18, 2025
 """
 
-import csv
 import matplotlib.pyplot as plt
 import os
 
+from csv_schema import SALES_SCHEMA, read_typed_csv
+
 def read_csv_data(filename):
     """Read CSV file and return products and revenues as separate lists"""
-    products = []
-    revenues = []
-    
     try:
-        with open(filename, 'r', newline='') as file:
-            reader = csv.reader(file)
-            next(reader)  # Skip header row
-            
-            for row in reader:
-                if len(row) >= 2:  # Ensure row has at least 2 columns
-                    products.append(row[0])
-                    revenues.append(float(row[1]))
-                    
-        return products, revenues
+        # Typed read: Product as strings, Revenue parsed as float64 while reading
+        df = read_typed_csv(filename, SALES_SCHEMA)
+        expected = list(SALES_SCHEMA.dtypes)
+        if list(df.columns[:2]) != expected:
+            print(f"Warning: expected columns {', '.join(expected)} but found "
+                  f"{', '.join(map(str, df.columns))}; using the first two columns")
+        if df.shape[1] < 2:
+            return [], []
+        # Only the first two fields of each row are read; rows without a revenue are skipped
+        complete = df.iloc[:, 1].notna()
+        skipped = len(df) - int(complete.sum())
+        if skipped:
+            print(f"Warning: skipped {skipped} row{'s' if skipped != 1 else ''} without a revenue")
+        df = df[complete]
+        return (df.iloc[:, 0].fillna('').astype(str).tolist(),
+                df.iloc[:, 1].astype('float64').tolist())
     
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found!")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Typed CSV Schemas
+Declared column types for the project's CSV files, so pandas reads them
+straight into compact dtypes (with dates parsed) instead of inferring
+int64/object columns on every load
+Date: October 18, 2025
+"""
+
+import importlib.util
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+class CSVSchema:
+    """Column dtypes plus the columns parsed as dates
+
+    Columns missing from a file are ignored, so one schema covers both
+    single-station and multi-station temperature files. With
+    leading_columns, only the first len(dtypes) columns are read, by
+    position: rows with extra trailing fields keep their leading values
+    and short rows are padded with missing values.
+    """
+
+    def __init__(self, dtypes: Dict[str, str], dates: Sequence[str] = (),
+                 leading_columns: bool = False) -> None:
+        self.dtypes = dtypes
+        self.dates = list(dates)
+        self.leading_columns = leading_columns
+
+    def __repr__(self) -> str:
+        return (f"CSVSchema({self.dtypes}, dates={self.dates}, "
+                f"leading_columns={self.leading_columns})")
+
+    def usecols(self) -> Optional[List[int]]:
+        """Column positions to read, or None for all of them"""
+        return list(range(len(self.dtypes))) if self.leading_columns else None
+
+# temperature_data.csv (generate_temperature_data.py); °C and averages are
+# rounded to 0.1, well inside float32 precision
+TEMPERATURE_SCHEMA = CSVSchema({
+    'Station': 'category',
+    'High_Temp_F': 'int16',
+    'Low_Temp_F': 'int16',
+    'Condition': 'category',
+    'Humidity_%': 'uint8',
+    'Avg_Temp_F': 'float32',
+    'Temp_Range_F': 'int16',
+    'High_Temp_C': 'float32',
+    'Low_Temp_C': 'float32',
+    'Avg_Temp_C': 'float32',
+}, dates=['Date'])
+
+# sales_revenue.csv (csv_chart_generator.py); revenue stays float64 so
+# cents are exact, and like the chart's csv.reader loop it uses the first
+# two fields of every row, whatever follows them
+SALES_SCHEMA = CSVSchema({'Product': 'string', 'Revenue': 'float64'}, leading_columns=True)
+
+def default_engine() -> str:
+    """'pyarrow' (multi-threaded parser) when installed, else pandas' C parser"""
+    return 'pyarrow' if PYARROW_AVAILABLE else 'c'
+
+def _arrow_column_types(schema: CSVSchema) -> Dict[str, Any]:
+    import pyarrow as pa
+
+    types = {'category': pa.dictionary(pa.int32(), pa.string()), 'string': pa.string()}
+    columns = {name: types[dtype] if dtype in types else pa.from_numpy_dtype(dtype)
+               for name, dtype in schema.dtypes.items()}
+    columns.update((name, pa.timestamp('us')) for name in schema.dates)
+    return columns
+
+def _read_arrow_csv(filename: str, schema: CSVSchema) -> pd.DataFrame:
+    # pandas' pyarrow engine converts parse_dates columns after the read,
+    # which costs more than the whole parse; declaring the types to pyarrow
+    # itself parses dates and narrow numbers natively
+    import pyarrow.csv as pa_csv
+
+    options = pa_csv.ConvertOptions(column_types=_arrow_column_types(schema))
+    return pa_csv.read_csv(filename, convert_options=options).to_pandas()
+
+def read_typed_csv(filename: str, schema: CSVSchema, engine: Optional[str] = None) -> pd.DataFrame:
+    """Read a whole CSV file with the schema's dtypes and dates
+
+    Raises FileNotFoundError, or ValueError when a value does not fit
+    its declared type. pyarrow rejects rows whose field count differs from
+    the header's, so schema.leading_columns reads use pandas' C parser.
+    """
+    engine = engine or default_engine()
+    if schema.leading_columns and engine == 'pyarrow':
+        engine = 'c'
+    if engine == 'pyarrow':
+        return _read_arrow_csv(filename, schema)
+    return pd.read_csv(filename, dtype=schema.dtypes, parse_dates=schema.dates or None,
+                       usecols=schema.usecols(), engine=engine)
+
+def iter_typed_csv(filename: str, schema: CSVSchema, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """Typed chunks of chunk_rows rows (the pyarrow engine cannot read in chunks)"""
+    with pd.read_csv(filename, dtype=schema.dtypes, parse_dates=schema.dates or None,
+                     usecols=schema.usecols(), chunksize=chunk_rows) as reader:
+        yield from reader
+
+def frame_bytes(df: pd.DataFrame) -> int:
+    """Memory held by a DataFrame, strings included"""
+    return int(df.memory_usage(deep=True).sum())
+
+def display_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of a typed frame that prints like the CSV it came from
+
+    float32 columns show their shortest decimal form (18.3, not 18.299999)
+    and dates show without a time. Meant for the few rows being printed.
+    """
+    shown = df.copy()
+    for column in shown.columns:
+        values = shown[column]
+        if values.dtype == 'float32':
+            shown[column] = values.astype(str).astype('float64')
+        elif pd.api.types.is_datetime64_any_dtype(values) and (values == values.dt.normalize()).all():
+            shown[column] = values.dt.date
+    return shown
+
+def main():
+    """Compare inferred and typed loads of temperature_data.csv"""
+    print("Typed CSV Schemas")
+    print("="*40)
+
+    loads = [("inferred", lambda: pd.read_csv('temperature_data.csv')),
+             ("typed", lambda: read_typed_csv('temperature_data.csv', TEMPERATURE_SCHEMA))]
+    for name, load in loads:
+        start = time.perf_counter()
+        try:
+            df = load()
+        except FileNotFoundError:
+            print("✗ temperature_data.csv not found. Please run generate_temperature_data.py first.")
+            return
+        elapsed = time.perf_counter() - start
+        print(f"{name:10} {elapsed * 1000:8.1f} ms {frame_bytes(df) / 1024:10.1f} KB")
+
+if __name__ == "__main__":
+    main()
@@ -7,15 +7,21 @@ Practical example using the actual JSON file in the workspace
 import json
 import os
 
-def load_sample_json():
-    """Load the sample.json file"""
+from age_enrichment import enrich_ages
+from json_serializer import save_json
+from jsonl_reader import is_jsonl_file, load_jsonl
+
+def load_sample_json(filename='sample.json'):
+    """Load the sample.json file (or another JSON / JSON Lines file)"""
     try:
-        with open('sample.json', 'r') as file:
+        if is_jsonl_file(filename):
+            return load_jsonl(filename)
+        with open(filename, 'r') as file:
             return json.load(file)
     except FileNotFoundError:
-        print("Error: sample.json not found!")
+        print(f"Error: {filename} not found!")
         return None
-    except json.JSONDecodeError:
+    except ValueError:
         print("Error: Invalid JSON format!")
         return None
 
@@ -63,8 +69,7 @@ def extract_specific_info():
     print(json.dumps(extracted_data, indent=2))
     
     # Save extracted information
-    with open('extracted_info.json', 'w') as file:
-        json.dump(extracted_data, file, indent=2)
+    save_json(extracted_data, 'extracted_info.json')
     
     print("\n✓ Extracted information saved to 'extracted_info.json'")
     
@@ -94,16 +99,11 @@ def extract_specific_info():
     print(f"   Field names: {list(data.keys())}")
     
     # Try to convert age to number
-    try:
-        age_number = int(data.get('age', 0))
-        print(f"   Age as number: {age_number}")
-        if age_number >= 65:
-            print(f"   Age category: Senior")
-        elif age_number >= 18:
-            print(f"   Age category: Adult")
-        else:
-            print(f"   Age category: Minor")
-    except (ValueError, TypeError):
+    enriched = enrich_ages([data.get('age', 0)])
+    if enriched.valid[0]:
+        print(f"   Age as number: {enriched.age(0)}")
+        print(f"   Age category: {enriched.category(0)}")
+    else:
         print(f"   Age: Cannot convert to number")
     
     # Scenario 5: Create summary report
@@ -125,8 +125,7 @@ def extract_specific_info():
     print(json.dumps(summary, indent=2))
     
     # Save summary
-    with open('extraction_summary.json', 'w') as file:
-        json.dump(summary, file, indent=2)
+    save_json(summary, 'extraction_summary.json')
     
     print("\n✓ Summary saved to 'extraction_summary.json'")
 
@@ -154,8 +153,7 @@ def create_extraction_template():
         }
     }
     
-    with open('extraction_template.json', 'w') as file:
-        json.dump(template, file, indent=2)
+    save_json(template, 'extraction_template.json')
     
     print("✓ Extraction template saved to 'extraction_template.json'")
 
@@ -169,8 +167,7 @@ def main():
     if not os.path.exists('sample.json'):
         print("Creating sample.json file for demonstration...")
         sample_data = {"name": "mk", "age": "89", "city": "hihus"}
-        with open('sample.json', 'w') as file:
-            json.dump(sample_data, file, indent=2)
+        save_json(sample_data, 'sample.json')
         print("✓ Created sample.json")
     
     # Extract information
@@ -1,126 +1,382 @@
 #!/usr/bin/env python3
 """
 Temperature Data Generator
-Creates a CSV file with 2 weeks of daily temperature readings
+Creates a CSV file of daily temperature readings for any date range and
+number of stations (2 weeks from October 5, 2025 by default)
 Date: October 18, 2025
+
+Examples:
+    py generate_temperature_data.py
+    py generate_temperature_data.py --start 2015-01-01 --days 3653 --stations 100 --seed 7
+    py generate_temperature_data.py big.parquet --days 36525 --stations 3000
+    py generate_temperature_data.py archive --partitioned --stations 10000 --days 3653 --workers 8
 """
 
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pandas as pd
-import random
-from datetime import datetime, timedelta
-
-def generate_temperature_data():
-    """Generate 2 weeks of realistic daily temperature readings"""
-    
-    # Starting date (2 weeks ago from today)
-    start_date = datetime(2025, 10, 5)  # October 5, 2025
-    
-    # Generate dates for 14 days
-    dates = []
-    temperatures_high = []
-    temperatures_low = []
-    conditions = []
-    humidity = []
-    
-    # Weather conditions options
-    weather_conditions = ["Sunny", "Partly Cloudy", "Cloudy", "Rainy", "Overcast"]
-    
-    for i in range(14):
-        current_date = start_date + timedelta(days=i)
-        dates.append(current_date.strftime("%Y-%m-%d"))
-        
-        # Generate realistic temperature ranges (Fahrenheit)
-        # Simulate fall weather with some variation
-        base_high = random.randint(65, 78)  # High temperature
-        base_low = base_high - random.randint(15, 25)  # Low temperature
-        
-        # Add some weather pattern variation
-        if i in [3, 7, 10]:  # Some cooler/rainy days
-            base_high -= random.randint(8, 15)
-            base_low -= random.randint(8, 15)
-            condition = random.choice(["Rainy", "Cloudy", "Overcast"])
-            humidity_val = random.randint(75, 95)
-        else:
-            condition = random.choice(["Sunny", "Partly Cloudy", "Cloudy"])
-            humidity_val = random.randint(45, 70)
-        
-        temperatures_high.append(base_high)
-        temperatures_low.append(base_low)
-        conditions.append(condition)
-        humidity.append(humidity_val)
-    
-    # Create DataFrame
-    data = {
-        'Date': dates,
-        'High_Temp_F': temperatures_high,
-        'Low_Temp_F': temperatures_low,
-        'Condition': conditions,
-        'Humidity_%': humidity
+
+from json_serializer import save_json
+
+START_DATE = "2025-10-05"
+DEFAULT_DAYS = 14
+# Days generated from one random stream; the output only depends on the seed
+BLOCK_DAYS = 1024
+DEFAULT_CHUNK_ROWS = 1_000_000
+# Stations per partition file in partitioned mode
+DEFAULT_PARTITION_STATIONS = 100
+MANIFEST_NAME = "_manifest.json"   # "_" keeps Parquet dataset readers from treating it as data
+# Largest dataset printed in full; bigger ones are only summarized
+MAX_PRINTED_ROWS = 100
+
+# Weather conditions options (Condition codes index this list)
+WEATHER_CONDITIONS = ["Sunny", "Partly Cloudy", "Cloudy", "Rainy", "Overcast"]
+DRY_CONDITIONS = np.array([0, 1, 2], dtype=np.int8)   # Sunny, Partly Cloudy, Cloudy
+WET_CONDITIONS = np.array([3, 2, 4], dtype=np.int8)   # Rainy, Cloudy, Overcast
+
+# Seasonal model: the warmest day of the year, on average
+PEAK_DAY_OF_YEAR = 200
+
+def station_seeds(seed, stations):
+    """One child SeedSequence per station
+
+    A station's readings depend only on the seed and its number, never on
+    which process generates it or in what order.
+    """
+    return np.random.SeedSequence(seed).spawn(stations)
+
+def block_seed(station_seed, number):
+    """Child number of a station's seed (what station_seed.spawn would give, without its state)"""
+    return np.random.SeedSequence(station_seed.entropy, spawn_key=station_seed.spawn_key + (number,))
+
+def station_climate(station_seed):
+    """Long-run climate of one station (drawn from its own seed)"""
+    rng = np.random.default_rng(station_seed)
+    return {
+        'mean_high': rng.uniform(60, 75),      # °F, yearly average of daily highs
+        'seasonal_swing': rng.uniform(8, 22),  # °F between the average and the warmest day
+        'diurnal_range': rng.uniform(16, 22),  # °F between high and low on a clear day
+        'rain_chance': rng.uniform(0.15, 0.3),
     }
-    
-    df = pd.DataFrame(data)
-    
+
+def plan_blocks(days, stations, block_days=BLOCK_DAYS):
+    """(station, block number, first day, number of days) for every block, station by station
+
+    stations: a count, or a range of station numbers.
+    """
+    if isinstance(stations, int):
+        stations = range(stations)
+    return [(station, number, first, min(block_days, days - first))
+            for station in stations
+            for number, first in enumerate(range(0, days, block_days))]
+
+def generate_block(station_seed, start, block):
+    """Columns for one block of days of one station, as NumPy arrays
+
+    Highs follow a yearly cosine around the station's climate plus daily
+    noise. The diurnal range (high - low) is wider in summer and narrower
+    on wet days; wet days are more likely in winter and are cooler and
+    more humid, with rainy/cloudy/overcast conditions.
+    """
+    station, number, first, size = block
+    climate = station_climate(station_seed)
+    rng = np.random.default_rng(block_seed(station_seed, number))
+
+    dates = pd.date_range(pd.Timestamp(start) + pd.Timedelta(days=first), periods=size, freq='D')
+    season = np.cos(2 * np.pi * (dates.dayofyear.to_numpy() - PEAK_DAY_OF_YEAR) / 365.25)
+
+    wet = rng.random(size) < climate['rain_chance'] * (1 - 0.3 * season)
+    high = climate['mean_high'] + climate['seasonal_swing'] * season + rng.normal(0, 4, size)
+    high -= wet * rng.integers(8, 16, size)
+    diurnal = climate['diurnal_range'] + 3 * season + rng.normal(0, 3, size) - 4 * wet
+    high = np.rint(high).astype(np.int16)
+    low = (high - np.rint(np.clip(diurnal, 4, None))).astype(np.int16)
+
+    humidity = np.where(wet, rng.integers(75, 96, size), rng.integers(45, 71, size)).astype(np.uint8)
+    choice = rng.integers(0, 3, size)
+    condition = np.where(wet, WET_CONDITIONS[choice], DRY_CONDITIONS[choice])
+
+    return {
+        'Station': np.full(size, station, dtype=np.int32),
+        'Date': dates.to_numpy(),
+        'High_Temp_F': high,
+        'Low_Temp_F': low,
+        'Condition': condition,
+        'Humidity_%': humidity,
+    }
+
+def station_names(stations):
+    return [f"ST{station:05d}" for station in range(stations)]
+
+def build_frame(columns, stations=1):
+    """DataFrame in the temperature_data.csv layout, with the calculated columns
+
+    A categorical Station column comes first when there are several stations.
+    """
+    df = pd.DataFrame({
+        'Date': columns['Date'],
+        'High_Temp_F': columns['High_Temp_F'],
+        'Low_Temp_F': columns['Low_Temp_F'],
+        'Condition': pd.Categorical.from_codes(columns['Condition'], WEATHER_CONDITIONS),
+        'Humidity_%': columns['Humidity_%'],
+    })
+    if stations > 1:
+        df.insert(0, 'Station', pd.Categorical.from_codes(columns['Station'], station_names(stations)))
+
     # Add calculated columns
     df['Avg_Temp_F'] = (df['High_Temp_F'] + df['Low_Temp_F']) / 2
     df['Temp_Range_F'] = df['High_Temp_F'] - df['Low_Temp_F']
-    
+
     # Convert some temperatures to Celsius for comparison
     df['High_Temp_C'] = ((df['High_Temp_F'] - 32) * 5/9).round(1)
     df['Low_Temp_C'] = ((df['Low_Temp_F'] - 32) * 5/9).round(1)
     df['Avg_Temp_C'] = ((df['Avg_Temp_F'] - 32) * 5/9).round(1)
-    
     return df
 
-def main():
-    """Generate and save temperature data"""
-    print("Temperature Data Generator")
-    print("="*40)
-    
-    # Generate the data
-    print("Generating 2 weeks of temperature data...")
-    df = generate_temperature_data()
-    
-    # Display the data
-    print("\nGenerated Temperature Data:")
-    print("="*40)
-    print(df.to_string(index=False))
-    
-    # Save to CSV
-    csv_filename = "temperature_data.csv"
-    df.to_csv(csv_filename, index=False)
-    print(f"\n✓ Data saved to: {csv_filename}")
-    
-    # Display summary statistics
+def iter_station_chunks(seeds, first_station, stations, start=START_DATE, days=DEFAULT_DAYS,
+                        chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Chunks for the stations whose seeds are given, numbered from first_station
+
+    stations is the total number of stations, which names the Station
+    categories, so every partition of a dataset has the same schema.
+    """
+    pending = []
+    pending_rows = 0
+    numbers = range(first_station, first_station + len(seeds))
+    for block in plan_blocks(days, numbers):
+        pending.append(generate_block(seeds[block[0] - first_station], start, block))
+        pending_rows += block[3]
+        if pending_rows >= chunk_rows:
+            yield _merge_blocks(pending, stations)
+            pending, pending_rows = [], 0
+    if pending:
+        yield _merge_blocks(pending, stations)
+
+def iter_temperature_chunks(start=START_DATE, days=DEFAULT_DAYS, stations=1, seed=0,
+                            chunk_rows=DEFAULT_CHUNK_ROWS):
+    """DataFrames of about chunk_rows rows each, station by station then by date
+
+    Blocks are generated and glued together with NumPy; only one chunk is
+    in memory at a time. A Station column is added when stations > 1.
+    """
+    return iter_station_chunks(station_seeds(seed, stations), 0, stations, start, days, chunk_rows)
+
+def _merge_blocks(blocks, stations):
+    return build_frame({key: np.concatenate([block[key] for block in blocks]) for key in blocks[0]},
+                       stations)
+
+def generate_temperature_data(start=START_DATE, days=DEFAULT_DAYS, stations=1, seed=0):
+    """Generate realistic daily temperature readings as one DataFrame"""
+    chunks = list(iter_temperature_chunks(start, days, stations, seed, chunk_rows=max(days * stations, 1)))
+    return pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+def write_frames(filename, frames):
+    """Write DataFrame chunks to one .csv or .parquet file; returns the row count"""
+    rows = 0
+    if filename.lower().endswith('.parquet'):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("Parquet output needs the pyarrow package (pip install pyarrow)") from None
+        writer = None
+        try:
+            for df in frames:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(filename, table.schema)
+                writer.write_table(table)
+                rows += len(df)
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows
+
+    with open(filename, 'w', newline='') as file:
+        for number, df in enumerate(frames):
+            df.to_csv(file, index=False, header=(number == 0))
+            rows += len(df)
+    return rows
+
+def write_temperature_data(filename, start=START_DATE, days=DEFAULT_DAYS, stations=1, seed=0,
+                           chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Stream the generated readings to a .csv or .parquet file; returns the row count"""
+    return write_frames(filename, iter_temperature_chunks(start, days, stations, seed, chunk_rows))
+
+def write_partition(task):
+    """Generate one partition file (runs in a worker process)"""
+    filename, seeds, first_station, stations, start, days, chunk_rows = task
+    started = time.perf_counter()
+    rows = write_frames(filename, iter_station_chunks(seeds, first_station, stations,
+                                                      start, days, chunk_rows))
+    return {
+        "file": os.path.basename(filename),
+        "first_station": first_station,
+        "stations": len(seeds),
+        "rows": rows,
+        "bytes": os.path.getsize(filename),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+def write_partitioned(directory, start=START_DATE, days=DEFAULT_DAYS, stations=1, seed=0,
+                      workers=None, partition_stations=DEFAULT_PARTITION_STATIONS,
+                      file_format='parquet', chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Generate stations in parallel into partition files plus a manifest
+
+    Every station gets a SeedSequence.spawn child of the seed and the
+    partition layout depends only on partition_stations, so the files are
+    identical whatever the number of workers. Returns the manifest.
+    """
+    os.makedirs(directory, exist_ok=True)
+    seeds = station_seeds(seed, stations)
+    tasks = [(os.path.join(directory, f"part-{number:05d}.{file_format}"),
+              seeds[first:first + partition_stations], first, stations, start, days, chunk_rows)
+             for number, first in enumerate(range(0, stations, partition_stations))]
+
+    started = time.perf_counter()
+    # Never more workers than partitions; the manifest records the number used
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers == 1:
+        partitions = list(map(write_partition, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partitions = list(executor.map(write_partition, tasks))
+
+    manifest = {
+        "seed": seed,
+        "start": str(pd.Timestamp(start).date()),
+        "days": days,
+        "stations": stations,
+        "format": file_format,
+        "rows": sum(partition["rows"] for partition in partitions),
+        "workers": workers,
+        "seconds": round(time.perf_counter() - started, 3),
+        "partitions": partitions,
+    }
+    save_json(manifest, os.path.join(directory, MANIFEST_NAME))
+    return manifest
+
+def print_summary(df):
+    """Display summary statistics of generated data"""
     print("\nTemperature Summary Statistics:")
     print("="*40)
-    print(f"Date Range: {df['Date'].iloc[0]} to {df['Date'].iloc[-1]}")
+    print(f"Date Range: {df['Date'].iloc[0].date()} to {df['Date'].iloc[-1].date()}")
     print(f"Highest Temperature: {df['High_Temp_F'].max()}°F ({df['High_Temp_C'].max()}°C)")
     print(f"Lowest Temperature: {df['Low_Temp_F'].min()}°F ({df['Low_Temp_C'].min()}°C)")
     print(f"Average High: {df['High_Temp_F'].mean():.1f}°F")
     print(f"Average Low: {df['Low_Temp_F'].mean():.1f}°F")
     print(f"Average Humidity: {df['Humidity_%'].mean():.1f}%")
-    
+
     # Weather condition summary
     print(f"\nWeather Conditions:")
     condition_counts = df['Condition'].value_counts()
     for condition, count in condition_counts.items():
-        print(f"  {condition}: {count} days")
-    
+        if count:
+            print(f"  {condition}: {count} days")
+
     # Create a simple analysis
     print(f"\nTemperature Analysis:")
-    hot_days = len(df[df['High_Temp_F'] >= 75])
-    cool_days = len(df[df['High_Temp_F'] < 65])
+    hot_days = int((df['High_Temp_F'] >= 75).sum())
+    cool_days = int((df['High_Temp_F'] < 65).sum())
     print(f"  Hot days (≥75°F): {hot_days}")
     print(f"  Cool days (<65°F): {cool_days}")
-    print(f"  Moderate days: {14 - hot_days - cool_days}")
-    
-    return df
+    print(f"  Moderate days: {len(df) - hot_days - cool_days}")
+
+def main(argv=None):
+    """Generate and save temperature data
+
+    Returns the DataFrame for datasets small enough to print, else None.
+    """
+    parser = argparse.ArgumentParser(description="Generate daily temperature readings")
+    parser.add_argument("output", nargs="?", default="temperature_data.csv",
+                        help=".csv or .parquet (default: temperature_data.csv)")
+    parser.add_argument("--start", default=START_DATE, help=f"first date (default: {START_DATE})")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS,
+                        help=f"number of days (default: {DEFAULT_DAYS})")
+    parser.add_argument("--stations", type=int, default=1, help="number of weather stations")
+    parser.add_argument("--seed", type=int, help="same seed, same data (default: random)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS,
+                        help="rows generated and written at a time")
+    parser.add_argument("--partitioned", action="store_true",
+                        help="write output as a directory of partition files plus a manifest")
+    parser.add_argument("--format", choices=["parquet", "csv"], default="parquet",
+                        help="partition file format (default: parquet)")
+    parser.add_argument("--partition-stations", type=int, default=DEFAULT_PARTITION_STATIONS,
+                        help=f"stations per partition (default: {DEFAULT_PARTITION_STATIONS})")
+    parser.add_argument("--workers", "-w", type=int,
+                        help="worker processes in partitioned mode (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    print("Temperature Data Generator")
+    print("="*40)
+    if min(args.days, args.stations, args.chunk_rows, args.partition_stations) < 1:
+        print("✗ Error: days, stations, chunk rows and partition stations must be >= 1")
+        return None
+    try:
+        pd.Timestamp(args.start)
+    except ValueError:
+        print(f"✗ Error: Invalid start date '{args.start}'")
+        return None
+    seed = args.seed if args.seed is not None else np.random.SeedSequence().entropy
+    rows = args.days * args.stations
+
+    # Partitioned datasets: stations are generated in parallel, one file per partition
+    if args.partitioned:
+        print(f"Generating {rows:,} readings ({args.stations} stations x {args.days} days) "
+              f"into {args.output}/...")
+        try:
+            manifest = write_partitioned(args.output, args.start, args.days, args.stations, seed,
+                                         args.workers, args.partition_stations, args.format,
+                                         args.chunk_rows)
+        except (OSError, ValueError) as e:
+            print(f"✗ Error: {e}")
+            return None
+        print(f"✓ {len(manifest['partitions'])} partitions and {MANIFEST_NAME} saved to: "
+              f"{args.output} (seed {seed}) in {manifest['seconds']:.2f}s "
+              f"with {manifest['workers']} workers")
+        return None
+
+    # Small datasets: generate in memory and show everything
+    if rows <= MAX_PRINTED_ROWS:
+        print(f"Generating {args.days} days of temperature data...")
+        df = generate_temperature_data(args.start, args.days, args.stations, seed)
+
+        # Display the data
+        print("\nGenerated Temperature Data:")
+        print("="*40)
+        print(df.to_string(index=False))
+
+        # Save the frame just printed instead of generating it again
+        try:
+            write_frames(args.output, [df])
+        except (OSError, ValueError) as e:
+            print(f"✗ Error: {e}")
+            return None
+        print(f"\n✓ Data saved to: {args.output} (seed {seed})")
+        print_summary(df)
+        return df
+
+    # Large datasets are streamed chunk by chunk
+    print(f"Generating {rows:,} readings ({args.stations} stations x {args.days} days)...")
+    started = time.perf_counter()
+    try:
+        write_temperature_data(args.output, args.start, args.days, args.stations, seed, args.chunk_rows)
+    except (OSError, ValueError) as e:
+        print(f"✗ Error: {e}")
+        return None
+    print(f"✓ Data saved to: {args.output} (seed {seed}) in {time.perf_counter() - started:.2f}s")
+    return None
 
 if __name__ == "__main__":
     # Generate the data
     temperature_df = main()
-    
+
     # Show first few rows in a nice format
-    print(f"\nFirst 5 rows of data:")
-    print("-" * 40)
-    print(temperature_df.head().to_string(index=False))
\ No newline at end of file
+    if temperature_df is not None:
+        print(f"\nFirst 5 rows of data:")
+        print("-" * 40)
+        print(temperature_df.head().to_string(index=False))
@@ -8,17 +8,27 @@ Date: October 18, 2025
 import json
 import os
 
+from age_directory import extract_directory, print_report_summary
+from age_enrichment import enrich_ages
+from age_session import AgeSession
+from json_cache import load_cached
+from json_serializer import save_json
+from people_store import is_columnar_file
+from person_record import Person, is_person
+
+# Columns read from .parquet / .arrow files; the rest are never decoded
+AGE_COLUMNS = ['name', 'age']
+
 def load_json_file(filename):
-    """Load JSON file and return data"""
+    """Load JSON file and return data (JSON Lines files become a list of people)"""
     try:
-        with open(filename, 'r') as file:
-            data = json.load(file)
+        data = load_cached(filename)
         print(f"✓ Successfully loaded: {filename}")
         return data
     except FileNotFoundError:
         print(f"✗ Error: File '{filename}' not found!")
         return None
-    except json.JSONDecodeError:
+    except ValueError:
         print(f"✗ Error: Invalid JSON format in '{filename}'")
         return None
     except Exception as e:
@@ -44,23 +54,16 @@ def extract_age_from_data(data, person_name=None):
             print(f"  Name: {name}")
             print(f"  Age: {age_value}")
             
-            # Try to convert age to number for analysis
-            try:
-                age_num = int(age_value)
+            # Convert age to number and categorize it
+            enriched = enrich_ages([age_value])
+            if enriched.valid[0]:
+                age_num = enriched.age(0)
                 print(f"  Age as number: {age_num}")
                 
-                # Age category analysis
-                if age_num >= 65:
-                    category = "Senior"
-                elif age_num >= 18:
-                    category = "Adult"
-                else:
-                    category = "Minor"
-                
+                category = enriched.category(0)
                 print(f"  Age category: {category}")
                 
-                # Additional age analysis
-                birth_year = 2025 - age_num
+                birth_year = enriched.birth_year(0)
                 print(f"  Approximate birth year: {birth_year}")
                 
                 return {
@@ -70,8 +73,7 @@ def extract_age_from_data(data, person_name=None):
                     'category': category,
                     'birth_year': birth_year
                 }
-                
-            except ValueError:
+            else:
                 print(f"  Note: Age '{age_value}' is not a valid number")
                 return {
                     'name': name,
@@ -91,15 +93,19 @@ def extract_age_from_data(data, person_name=None):
         ages_found = []
         
         for i, item in enumerate(data):
-            if isinstance(item, dict) and 'age' in item:
+            if is_person(item) and 'age' in item:
                 name = item.get('name', f'Person {i+1}')
                 age = item['age']
                 ages_found.append({'name': name, 'age': age})
         
         if ages_found:
+            # Categorize everyone in one batch
+            enriched = enrich_ages([person['age'] for person in ages_found])
             print(f"Found {len(ages_found)} people with age information:")
-            for person in ages_found:
-                print(f"  - {person['name']}: {person['age']}")
+            for i, person in enumerate(ages_found):
+                person['category'] = enriched.category(i)
+                person['birth_year'] = enriched.birth_year(i)
+                print(f"  - {person['name']}: {person['age']} ({person['category']})")
             return ages_found
         else:
             print("✗ No age information found in the list")
@@ -109,8 +115,31 @@ def extract_age_from_data(data, person_name=None):
         print("✗ Unexpected data format - expected dictionary or list")
         return None
 
-def interactive_age_extraction():
-    """Interactive function to get user input and extract age"""
+def load_json_session(sessions, filename):
+    """Session for filename, parsing the file only if it is new or changed
+    
+    sessions maps filenames to AgeSession objects and lives as long as the
+    tool runs. Returns (session, changed), or (None, False) on errors.
+    """
+    session = sessions.get(filename)
+    if session is None:
+        session = sessions[filename] = AgeSession(filename)
+    try:
+        changed = session.load()
+    except FileNotFoundError:
+        print(f"✗ Error: File '{filename}' not found!")
+        return None, False
+    except ValueError:
+        print(f"✗ Error: Invalid JSON format in '{filename}'")
+        return None, False
+    except Exception as e:
+        print(f"✗ Error loading file: {e}")
+        return None, False
+    print(f"✓ Successfully loaded: {filename}" if changed else f"✓ Already loaded: {filename}")
+    return session, changed
+
+def extract_from_file(sessions):
+    """One round of the interactive tool; returns False if the user exited"""
     print("INTERACTIVE AGE EXTRACTION TOOL")
     print("="*50)
     
@@ -130,6 +159,9 @@ def interactive_age_extraction():
         filename = "sample.json"
     
     # Check if file exists
+    if not os.path.exists(filename) and is_columnar_file(filename):
+        print(f"\n✗ Error: File '{filename}' not found!")
+        return False
     if not os.path.exists(filename):
         print(f"\nFile '{filename}' not found.")
         create_choice = input("Create a sample file? (y/n): ").strip().lower()
@@ -143,24 +175,28 @@ def interactive_age_extraction():
                 "email": "mk@example.com"
             }
             
-            with open(filename, 'w') as file:
-                json.dump(sample_data, file, indent=2)
+            save_json(sample_data, filename)
             
             print(f"✓ Created sample file: {filename}")
         else:
             print("Exiting...")
-            return
+            return False
     
-    # Load the JSON file
+    # Load the JSON file (kept for the rest of the session)
     print(f"\nStep 2: Loading JSON file '{filename}'...")
-    data = load_json_file(filename)
+    session, changed = load_json_session(sessions, filename)
     
-    if not data:
-        return
+    if session is None or (session.store is None and not session.data):
+        return False
+    data = session.data
     
-    # Show the JSON content
-    print(f"\nJSON content:")
-    print(json.dumps(data, indent=2))
+    # Show the content the first time it is loaded (columnar files: just the schema)
+    if changed and session.store is not None:
+        print(f"\n{session.store}")
+        print(session.store.dataset.schema.to_string(show_schema_metadata=False))
+    elif changed:
+        print(f"\nJSON content:")
+        print(json.dumps(data, indent=2, default=Person.to_dict))
     
     # Ask user what they want to extract
     print(f"\nStep 3: Extract age information")
@@ -170,6 +206,13 @@ def interactive_age_extraction():
     if extract_choice == 'y':
         person_name = input("Enter person's name: ").strip()
     
+    # Columnar files are filtered while scanning and only name/age are read
+    if session.store is not None:
+        if person_name:
+            data = session.store.partial(person_name, AGE_COLUMNS)
+        else:
+            data = session.store.query(columns=AGE_COLUMNS)
+    
     # Extract age information
     result = extract_age_from_data(data, person_name)
     
@@ -194,16 +237,28 @@ def interactive_age_extraction():
             }
             
             try:
-                with open(output_filename, 'w') as file:
-                    json.dump(output_data, file, indent=2)
+                save_json(output_data, output_filename)
                 print(f"✓ Age information saved to: {output_filename}")
             except Exception as e:
                 print(f"✗ Error saving file: {e}")
+    return True
+
+def interactive_age_extraction(sessions=None):
+    """Interactive function to get user input and extract age
+    
+    Loops until the user stops; files already loaded (sessions) are reused.
+    """
+    if sessions is None:
+        sessions = {}
     
-    # Ask if user wants to continue
-    continue_choice = input("\nExtract age from another file? (y/n): ").strip().lower()
-    if continue_choice == 'y':
-        interactive_age_extraction()
+    while True:
+        if not extract_from_file(sessions):
+            return
+        
+        # Ask if user wants to continue
+        continue_choice = input("\nExtract age from another file? (y/n): ").strip().lower()
+        if continue_choice != 'y':
+            return
 
 def quick_age_extraction():
     """Quick extraction without many prompts"""
@@ -227,25 +282,55 @@ def quick_age_extraction():
             print(f"Age: {result.get('age', 'Unknown')}")
             print(f"Category: {result.get('category', 'Unknown')}")
 
+def directory_age_extraction():
+    """Extract ages from every JSON file in a directory into one report"""
+    print("DIRECTORY AGE EXTRACTION")
+    print("="*30)
+    
+    directory = input("Enter directory (default: current): ").strip() or "."
+    person_name = input("Only names containing (Enter for everyone): ").strip() or None
+    output_filename = input("Enter output filename (default: extracted_age.json): ").strip()
+    if not output_filename:
+        output_filename = "extracted_age.json"
+    
+    # Files are read concurrently and parsed in a process pool
+    try:
+        report = extract_directory(directory, person_name, exclude=output_filename)
+    except (FileNotFoundError, NotADirectoryError):
+        print(f"✗ Error: Directory '{directory}' not found!")
+        return
+    
+    print_report_summary(report)
+    try:
+        save_json(report, output_filename)
+        print(f"✓ Age information saved to: {output_filename}")
+    except Exception as e:
+        print(f"✗ Error saving file: {e}")
+
 def main():
     """Main function with menu options"""
     print("AGE EXTRACTION TOOL")
     print("Date: October 18, 2025")
     print("="*50)
     
+    sessions = {}  # files loaded so far, shared by every menu choice
+    
     while True:
         print("\nSelect an option:")
         print("1. Interactive age extraction (detailed)")
         print("2. Quick age extraction")
-        print("3. Exit")
+        print("3. Extract ages from a directory")
+        print("4. Exit")
         
-        choice = input("\nEnter choice (1-3): ").strip()
+        choice = input("\nEnter choice (1-4): ").strip()
         
         if choice == "1":
-            interactive_age_extraction()
+            interactive_age_extraction(sessions)
         elif choice == "2":
             quick_age_extraction()
         elif choice == "3":
+            directory_age_extraction()
+        elif choice == "4":
             print("Thank you for using the Age Extraction Tool!")
             break
         else:
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Parsed Document Cache
+Keeps parsed JSON documents in memory (and optionally in a binary sidecar
+file next to the source) so repeated loads skip parsing entirely
+Date: October 18, 2025
+"""
+
+import json
+import os
+import pickle
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from jsonl_reader import is_jsonl_file, load_jsonl
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+SIDECAR_SUFFIX = '.cache'
+# Parsed JSON takes about 3x (indented) to 6x (compact) its file size in memory
+MEMORY_PER_FILE_BYTE = 4
+
+# (modification time in ns, size in bytes) identifies one version of a file
+Signature = Tuple[int, int]
+
+def file_signature(filename: str) -> Signature:
+    stat = os.stat(filename)
+    return stat.st_mtime_ns, stat.st_size
+
+def estimated_memory(signature: Signature) -> int:
+    """Approximate bytes a parsed document occupies, from its file size"""
+    return signature[1] * MEMORY_PER_FILE_BYTE
+
+def parse_file(filename: str) -> Any:
+    """Parse a JSON or JSON Lines file without any caching"""
+    if is_jsonl_file(filename):
+        return load_jsonl(filename)
+    with open(filename, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+class DocumentCache:
+    """LRU cache of parsed documents keyed by path, invalidated by mtime and size
+
+    Documents are charged against max_bytes by their estimated parsed size
+    (MEMORY_PER_FILE_BYTE times the file size), so max_bytes roughly bounds
+    the memory held. A document estimated above max_bytes is not cached at
+    all: it is parsed again on every load, and a note says so. Cached
+    documents are shared between callers, so treat them as read-only.
+
+    With use_disk=True a sidecar '<file>.cache' is written after parsing and
+    reused by later runs while the source file is unchanged. Sidecars are
+    pickle (or msgpack) files: only enable this for files you trust.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, use_disk: bool = False,
+                 disk_format: str = 'pickle'):
+        if disk_format == 'msgpack' and msgpack is None:
+            raise ValueError("disk_format='msgpack' needs the msgpack package (pip install msgpack)")
+        if disk_format not in ('pickle', 'msgpack'):
+            raise ValueError(f"Unknown disk_format '{disk_format}', expected 'pickle' or 'msgpack'")
+        self.max_bytes = max_bytes
+        self.use_disk = use_disk
+        self.disk_format = disk_format
+        self._entries: 'OrderedDict[str, Tuple[Signature, Any]]' = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self, filename: str) -> Any:
+        """Return the parsed document, parsing only if the file changed
+
+        Raises the same errors as parsing the file directly
+        (FileNotFoundError, json.JSONDecodeError / ValueError).
+        """
+        key = os.path.abspath(filename)
+        signature = file_signature(key)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] == signature:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            self._remove(key)
+
+        data = self._read_sidecar(key, signature) if self.use_disk else None
+        if data is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            data = parse_file(key)
+            if self.use_disk:
+                self._write_sidecar(key, signature, data)
+
+        self._store(key, signature, data)
+        return data
+
+    def invalidate(self, filename: str) -> None:
+        """Forget one file (its sidecar is left alone; it is re-validated on use)"""
+        key = os.path.abspath(filename)
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Empty the in-memory cache"""
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size"""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "documents": len(self._entries),
+            "bytes": self.total_bytes,
+        }
+
+    def _store(self, key: str, signature: Signature, data: Any) -> None:
+        size = estimated_memory(signature)
+        if size > self.max_bytes:
+            print(f"Note: '{os.path.basename(key)}' (~{size / 1024 ** 2:.1f} MB parsed) exceeds the "
+                  f"{self.max_bytes / 1024 ** 2:.1f} MB document cache and is not cached")
+            return
+        self._entries[key] = (signature, data)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        signature, _ = self._entries.pop(key)
+        self.total_bytes -= estimated_memory(signature)
+
+    def _read_sidecar(self, key: str, signature: Signature) -> Optional[Any]:
+        """Load the sidecar if it was written for this exact version of the file"""
+        try:
+            with open(key + SIDECAR_SUFFIX, 'rb') as file:
+                if self.disk_format == 'msgpack':
+                    payload = msgpack.unpackb(file.read(), strict_map_key=False)
+                else:
+                    payload = pickle.load(file)
+        except Exception:
+            # Missing, truncated or unreadable sidecars just mean a re-parse
+            return None
+        if not isinstance(payload, dict) or tuple(payload.get("signature", ())) != signature:
+            return None
+        return payload.get("data")
+
+    def _write_sidecar(self, key: str, signature: Signature, data: Any) -> None:
+        payload = {"signature": list(signature), "data": data}
+        temp_name = f"{key}{SIDECAR_SUFFIX}.{os.getpid()}.tmp"
+        try:
+            with open(temp_name, 'wb') as file:
+                if self.disk_format == 'msgpack':
+                    file.write(msgpack.packb(payload))
+                else:
+                    pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_name, key + SIDECAR_SUFFIX)
+        except OSError as e:
+            print(f"✗ Could not write cache file for '{key}': {e}")
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+
+# Shared by all the scripts; set JSON_CACHE_DISK=1 to keep sidecars between runs
+default_cache = DocumentCache(use_disk=os.environ.get('JSON_CACHE_DISK') == '1')
+
+def load_cached(filename: str) -> Any:
+    """Load a JSON/JSON Lines file through the shared document cache"""
+    return default_cache.load(filename)
+
+def main():
+    """Load sample.json twice and show the cache statistics"""
+    print("Parsed Document Cache")
+    print("="*40)
+
+    try:
+        for _ in range(2):
+            load_cached('sample.json')
+    except FileNotFoundError:
+        print("✗ Error: File 'sample.json' not found!")
+        return
+    except ValueError as e:
+        print(f"✗ Error: Invalid JSON format: {e}")
+        return
+
+    for name, value in default_cache.stats().items():
+        print(f"{name}: {value}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Columnar Records for Fast Filtering
+Turns a list of similar dictionaries into NumPy columns once, then runs
+filters as vectorized masks instead of a Python loop per record
+Date: October 18, 2025
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# A predicate is (field, operator, value), e.g. ('age', 'between', (18, 64))
+Predicate = Tuple[str, str, Any]
+OPERATORS = ('==', '!=', '<', '<=', '>', '>=', 'between', 'in', 'prefix')
+
+_MISSING = object()
+
+class Column:
+    """One field stored as a typed NumPy array plus a 'present' mask
+
+    Strings are dictionary-encoded: codes index into a sorted array of the
+    distinct values, so string equality and ranges become integer compares.
+    """
+
+    def __init__(self, name: str, values: List[Any]):
+        self.name = name
+        self.present = np.fromiter((value is not _MISSING for value in values),
+                                   dtype=bool, count=len(values))
+        types = {type(value) for value in values if value is not _MISSING}
+        self.categories: Optional[np.ndarray] = None
+
+        if types == {str}:
+            self.kind = 'category'
+            categories = sorted({value for value in values if value is not _MISSING})
+            lookup = {value: code for code, value in enumerate(categories)}
+            self.categories = np.array(categories, dtype=object)
+            self.data = np.fromiter((lookup.get(value, -1) for value in values),
+                                    dtype=np.int32, count=len(values))
+        elif types and types <= {int, float} and self._fits(values, types):
+            self.kind = 'int' if types == {int} else 'float'
+            dtype = np.int64 if self.kind == 'int' else np.float64
+            self.data = np.array([0 if value is _MISSING else value for value in values], dtype=dtype)
+        elif types == {bool}:
+            self.kind = 'bool'
+            self.data = np.array([value is True for value in values], dtype=bool)
+        else:
+            # Mixed types, None, nested dicts/lists: compared element by element
+            self.kind = 'object'
+            self.data = np.empty(len(values), dtype=object)
+            self.data[:] = [None if value is _MISSING else value for value in values]
+
+    @staticmethod
+    def _fits(values: List[Any], types: set) -> bool:
+        """Python ints outside the int64 range have to stay as objects"""
+        if int not in types:
+            return True
+        limit = 2 ** 63
+        return all(-limit <= value < limit for value in values if type(value) is int)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def value(self, row: int) -> Any:
+        """Return the Python value stored at a row"""
+        item = self.data[row]
+        if self.kind == 'category':
+            return self.categories[item]
+        if self.kind == 'object':
+            return item
+        return item.item()
+
+    def _codes_for(self, values: Iterable[Any]) -> np.ndarray:
+        """Category codes of the given values that occur in this column"""
+        wanted = sorted({value for value in values if isinstance(value, str)})
+        if not wanted:
+            return np.array([], dtype=np.int32)
+        positions = np.searchsorted(self.categories, wanted)
+        return np.array([position for position, value in zip(positions, wanted)
+                         if position < len(self.categories) and self.categories[position] == value],
+                        dtype=np.int32)
+
+    def _category_bound(self, value: Any, side: str) -> Optional[int]:
+        """Map a string bound onto the sorted category codes"""
+        if not isinstance(value, str):
+            return None
+        return int(np.searchsorted(self.categories, value, side=side))
+
+    def mask(self, operator: str, value: Any) -> np.ndarray:
+        """Boolean mask of the rows matching 'field <operator> value'"""
+        if operator not in OPERATORS:
+            raise ValueError(f"Unknown operator '{operator}', expected one of {', '.join(OPERATORS)}")
+
+        if operator == 'between':
+            low, high = value
+            return self.mask('>=', low) & self.mask('<=', high)
+        if operator == '!=':
+            return self.present & ~self.mask('==', value)
+
+        if self.kind == 'category':
+            result = self._category_mask(operator, value)
+        elif operator == 'prefix' and self.kind != 'object':
+            result = np.zeros(len(self), dtype=bool)
+        elif operator == 'in' and self.kind == 'object':
+            result = self._in_mask(value)
+        elif operator == 'in':
+            numbers = [item for item in value if isinstance(item, (int, float))]
+            result = np.isin(self.data, numbers) if numbers else np.zeros(len(self), dtype=bool)
+        elif self.kind == 'object':
+            result = self._object_mask(operator, value)
+        else:
+            result = self._numeric_mask(operator, value)
+        return result & self.present
+
+    def _category_mask(self, operator: str, value: Any) -> np.ndarray:
+        codes = self.data
+        if operator == 'prefix':
+            if not isinstance(value, str):
+                return np.zeros(len(self), dtype=bool)
+            # Sorted categories put every string with the prefix in one block
+            start = int(np.searchsorted(self.categories, value, side='left'))
+            stop = start
+            while stop < len(self.categories) and self.categories[stop].startswith(value):
+                stop += 1
+            return (codes >= start) & (codes < stop)
+        if operator == 'in':
+            return np.isin(codes, self._codes_for(value))
+        if operator == '==':
+            return np.isin(codes, self._codes_for([value]))
+
+        side = 'right' if operator in ('<=', '>') else 'left'
+        bound = self._category_bound(value, side)
+        if bound is None:
+            return np.zeros(len(self), dtype=bool)
+        if operator in ('<', '<='):
+            return (codes >= 0) & (codes < bound)
+        return codes >= bound
+
+    def _in_mask(self, values: Iterable[Any]) -> np.ndarray:
+        result = np.zeros(len(self), dtype=bool)
+        for value in values:
+            result |= self.mask('==', value)
+        return result
+
+    def _numeric_mask(self, operator: str, value: Any) -> np.ndarray:
+        if isinstance(value, str) or value is None:
+            # Same as Python: a string never equals a number and cannot be ordered with one
+            if operator == '==':
+                return np.zeros(len(self), dtype=bool)
+            raise TypeError(f"Cannot compare column '{self.name}' with {value!r}")
+        if operator == '==':
+            return self.data == value
+        if operator == '<':
+            return self.data < value
+        if operator == '<=':
+            return self.data <= value
+        if operator == '>':
+            return self.data > value
+        return self.data >= value
+
+    def _object_mask(self, operator: str, value: Any) -> np.ndarray:
+        if operator == 'prefix':
+            # e.g. names with some None values mixed in
+            if not isinstance(value, str):
+                return np.zeros(len(self), dtype=bool)
+            return np.fromiter((isinstance(item, str) and item.startswith(value) for item in self.data),
+                               dtype=bool, count=len(self))
+        compare = {
+            '==': lambda item: item == value,
+            '<': lambda item: item < value,
+            '<=': lambda item: item <= value,
+            '>': lambda item: item > value,
+            '>=': lambda item: item >= value,
+        }[operator]
+
+        def safe(item):
+            try:
+                return bool(compare(item))
+            except TypeError:
+                return False
+        return np.fromiter((safe(item) for item in self.data), dtype=bool, count=len(self))
+
+class ColumnarRecords:
+    """A list of dictionaries stored column by column for vectorized filters
+
+    The source list is kept, so matches are returned as the original
+    records (every key, same objects) and row numbers are list positions.
+    """
+
+    def __init__(self, columns: Dict[str, Column], records: Sequence[Any]):
+        self.columns = columns
+        self.records = records
+        self.length = len(records)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __repr__(self) -> str:
+        kinds = ", ".join(f"{name}:{column.kind}" for name, column in self.columns.items())
+        return f"ColumnarRecords({self.length} rows; {kinds})"
+
+    @classmethod
+    def from_records(cls, records: Sequence[Dict[str, Any]],
+                     fields: Optional[List[str]] = None) -> 'ColumnarRecords':
+        """Convert records to columns (by default every key seen in any record)
+
+        Items that are not dictionaries get an empty row, which no predicate
+        matches, so row numbers stay aligned with the list.
+        """
+        dicts = [record if isinstance(record, dict) else {} for record in records]
+        if fields is None:
+            fields = list(dict.fromkeys(key for record in dicts for key in record))
+        columns = {field: Column(field, [record.get(field, _MISSING) for record in dicts])
+                   for field in fields}
+        return cls(columns, records)
+
+    def mask(self, predicates: Iterable[Predicate]) -> np.ndarray:
+        """AND together the masks of all predicates"""
+        result = np.ones(self.length, dtype=bool)
+        for field, operator, value in predicates:
+            column = self.columns.get(field)
+            if column is None:
+                return np.zeros(self.length, dtype=bool)
+            result &= column.mask(operator, value)
+        return result
+
+    def where(self, predicates: Iterable[Predicate]) -> np.ndarray:
+        """Row indices that match every predicate"""
+        return np.flatnonzero(self.mask(predicates))
+
+    def rows(self, indices: Iterable[int]) -> Iterator[Dict[str, Any]]:
+        """The source records at the given rows, one at a time"""
+        records = self.records
+        for row in indices:
+            yield records[row]
+
+    def filter(self, predicates: Iterable[Predicate]) -> List[Dict[str, Any]]:
+        """Matching source records, in list order"""
+        records = self.records
+        return [records[row] for row in self.where(predicates).tolist()]
+
+def main():
+    """Filter the demo projects with a few vectorized predicates"""
+    from json_extraction_demo import sample_data
+
+    print("Columnar Record Filtering")
+    print("="*40)
+
+    projects = ColumnarRecords.from_records(sample_data["projects"])
+    print(f"✓ {projects}")
+
+    queries = [
+        [('status', '==', 'completed')],
+        [('budget', 'between', (4000, 8000))],
+        [('status', 'in', {'planned', 'in-progress'}), ('budget', '<', 5000)],
+        [('name', 'prefix', 'Project')],
+    ]
+    for predicates in queries:
+        print(f"{predicates}: {projects.filter(predicates)}")
+
+if __name__ == "__main__":
+    main()
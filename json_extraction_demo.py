@@ -6,6 +6,9 @@ Shows various ways to extract specific information from JSON files
 
 import json
 
+from age_enrichment import enrich_ages
+from json_serializer import save_json
+
 # Sample JSON data for demonstration
 sample_data = {
     "name": "mk",
@@ -98,8 +101,7 @@ def demo_conditional_extraction():
     print("="*60)
     
     # Extract data based on conditions
-    age_num = int(sample_data["age"])
-    age_category = "Senior" if age_num >= 65 else "Adult" if age_num >= 18 else "Minor"
+    age_category = enrich_ages([sample_data["age"]]).category(0)
     print(f"Age Category: {age_category}")
     
     # Extract projects based on budget
@@ -132,57 +134,57 @@ def demo_data_transformation():
     print("Transformed User Summary:")
     print(json.dumps(user_summary, indent=2))
 
+def find_keys_with_text(data, search_text):
+    """Find the paths of all keys containing specific text"""
+    found = []
+    def search_recursive(obj, path=""):
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                current_path = f"{path}.{key}" if path else key
+                if search_text.lower() in key.lower():
+                    found.append(current_path)
+                if isinstance(value, (dict, list)):
+                    search_recursive(value, current_path)
+        elif isinstance(obj, list):
+            for i, item in enumerate(obj):
+                if isinstance(item, (dict, list)):
+                    search_recursive(item, f"{path}[{i}]")
+    
+    search_recursive(data)
+    return found
+
+def find_values_with_text(data, search_text):
+    """Find all string values containing specific text"""
+    found = []
+    def search_recursive(obj, path=""):
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                current_path = f"{path}.{key}" if path else key
+                if isinstance(value, str) and search_text.lower() in value.lower():
+                    found.append((current_path, value))
+                elif isinstance(value, (dict, list)):
+                    search_recursive(value, current_path)
+        elif isinstance(obj, list):
+            for i, item in enumerate(obj):
+                current_path = f"{path}[{i}]"
+                if isinstance(item, str) and search_text.lower() in item.lower():
+                    found.append((current_path, item))
+                elif isinstance(item, (dict, list)):
+                    search_recursive(item, current_path)
+    
+    search_recursive(data)
+    return found
+
 def demo_search_and_filter():
     """Demonstrate searching and filtering JSON data"""
     print("\n" + "="*60)
     print("6. SEARCH AND FILTER")
     print("="*60)
     
-    # Search for keys containing specific text
-    def find_keys_with_text(data, search_text):
-        found = []
-        def search_recursive(obj, path=""):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    current_path = f"{path}.{key}" if path else key
-                    if search_text.lower() in key.lower():
-                        found.append(current_path)
-                    if isinstance(value, (dict, list)):
-                        search_recursive(value, current_path)
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    if isinstance(item, (dict, list)):
-                        search_recursive(item, f"{path}[{i}]")
-        
-        search_recursive(data)
-        return found
-    
     # Find all keys containing "name"
     name_keys = find_keys_with_text(sample_data, "name")
     print(f"Keys containing 'name': {name_keys}")
     
-    # Find values containing specific text
-    def find_values_with_text(data, search_text):
-        found = []
-        def search_recursive(obj, path=""):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    current_path = f"{path}.{key}" if path else key
-                    if isinstance(value, str) and search_text.lower() in value.lower():
-                        found.append((current_path, value))
-                    elif isinstance(value, (dict, list)):
-                        search_recursive(value, current_path)
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    current_path = f"{path}[{i}]"
-                    if isinstance(item, str) and search_text.lower() in item.lower():
-                        found.append((current_path, item))
-                    elif isinstance(item, (dict, list)):
-                        search_recursive(item, current_path)
-        
-        search_recursive(data)
-        return found
-    
     # Find all values containing "pro"
     pro_values = find_values_with_text(sample_data, "pro")
     print(f"Values containing 'pro': {pro_values}")
@@ -219,8 +221,7 @@ def demo_export_extracted_data():
     for export_name, export_data in exports.items():
         filename = f"extracted_{export_name}.json"
         try:
-            with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            save_json(export_data, filename)
             print(f"✓ Saved: {filename}")
         except Exception as e:
             print(f"✗ Error saving {filename}: {e}")
@@ -5,17 +5,60 @@ Extracts specific information from JSON files
 Date: October 18, 2025
 """
 
+import argparse
+import glob
 import json
 import os
-from typing import Any, Dict, List, Union
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from json_cache import load_cached
+from json_columnar import ColumnarRecords
+from json_index import ValueIndex
+from json_path import compile_path
+from json_schema import Schema, infer_schema
+from json_serializer import dumps, save_json
+from jsonl_reader import is_jsonl_file, load_jsonl
+from json_stream import StreamedJSON
+
+_MISSING = object()
+
+# The streaming parser is pure Python: about 4-10 MB/s, 4-6 times slower
+# than json.load, and every query parses the file again. Only files too big
+# to load comfortably are worth that, so smaller ones are loaded whole even
+# when streaming is asked for.
+STREAM_THRESHOLD_BYTES = 512 * 1024 * 1024
+
+def load_json_file(filename: str, stream: bool = False,
+                   stream_threshold: int = STREAM_THRESHOLD_BYTES) -> Union[Dict[str, Any], StreamedJSON]:
+    """Load and parse a JSON file
+
+    Parsed documents come from the shared document cache, so loading an
+    unchanged file again costs no parsing. JSON Lines files (.jsonl/.ndjson)
+    are parsed in parallel into a list of records.
+    With stream=True a file of stream_threshold bytes or more is not parsed
+    up front; a StreamedJSON facade is returned instead and each extraction
+    reads the file incrementally, trading speed (see STREAM_THRESHOLD_BYTES)
+    for memory bounded by nesting depth. Pass stream_threshold=0 to stream
+    any file.
+    """
+    if stream and not is_jsonl_file(filename):
+        if not os.path.exists(filename):
+            print(f"✗ Error: File '{filename}' not found!")
+            return {}
+        if os.path.getsize(filename) >= stream_threshold:
+            print(f"✓ Opened JSON file for streaming: {filename}")
+            return StreamedJSON(filename)
 
-def load_json_file(filename: str) -> Dict[str, Any]:
-    """Load and parse a JSON file"""
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            data = json.load(file)
+        data = load_cached(filename)
+        if is_jsonl_file(filename):
+            print(f"✓ Successfully loaded JSON Lines file: {filename} ({len(data)} records)")
+        else:
             print(f"✓ Successfully loaded JSON file: {filename}")
-            return data
+        return data
     except FileNotFoundError:
         print(f"✗ Error: File '{filename}' not found!")
         return {}
@@ -28,6 +71,10 @@ def load_json_file(filename: str) -> Dict[str, Any]:
 
 def extract_specific_keys(data: Dict[str, Any], keys: List[str]) -> Dict[str, Any]:
     """Extract specific keys from JSON data"""
+    if isinstance(data, StreamedJSON):
+        # One streaming pass that only builds the requested keys
+        data = data.select(keys)
+
     extracted = {}
     for key in keys:
         if key in data:
@@ -38,25 +85,48 @@ def extract_specific_keys(data: Dict[str, Any], keys: List[str]) -> Dict[str, An
     return extracted
 
 def extract_nested_value(data: Dict[str, Any], path: str) -> Any:
-    """Extract nested value using dot notation (e.g., 'user.profile.name')"""
-    keys = path.split('.')
-    current = data
-    
+    """Extract nested value using a path (e.g., 'user.profile.name', 'projects[*].name')
+
+    Paths are compiled once and cached. Wildcard and recursive-descent paths
+    return a list of every match.
+    """
     try:
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                print(f"✗ Path '{path}' not found in JSON data")
-                return None
+        query = compile_path(path)
+        if isinstance(data, StreamedJSON):
+            # Only the subtree under the path is built while streaming
+            matches = data.evaluate(path)
+        elif query.is_simple:
+            current = query.get(data, _MISSING)
+            matches = [] if current is _MISSING else [current]
+        else:
+            matches = query.evaluate(data)
+
+        if not matches:
+            print(f"✗ Path '{path}' not found in JSON data")
+            return None
+        current = matches[0] if query.is_simple else matches
         print(f"✓ Found nested value at '{path}': {current}")
         return current
     except Exception as e:
         print(f"✗ Error extracting path '{path}': {e}")
         return None
 
-def search_by_value(data: Dict[str, Any], search_value: Any) -> List[str]:
-    """Find all keys that contain a specific value"""
+def search_by_value(data: Dict[str, Any], search_value: Any,
+                    index: Optional[ValueIndex] = None) -> List[str]:
+    """Find all keys that contain a specific value
+
+    With a ValueIndex the answer is a single lookup instead of a full walk.
+    The index compares type as well as value, so 89 and "89" are different,
+    and it finds NaN, which the walk cannot (NaN never equals itself).
+    A StreamedJSON is searched in one streaming pass; iterate
+    StreamedJSON.search instead to handle each path as soon as it is found.
+    """
+    if index is not None and index.can_lookup(search_value):
+        return index.lookup(search_value)
+
+    if isinstance(data, StreamedJSON):
+        return list(data.search(search_value))
+
     found_keys = []
     
     def recursive_search(obj: Any, parent_key: str = ""):
@@ -78,51 +148,84 @@ def search_by_value(data: Dict[str, Any], search_value: Any) -> List[str]:
     recursive_search(data)
     return found_keys
 
-def filter_by_criteria(data: List[Dict[str, Any]], field: str, value: Any) -> List[Dict[str, Any]]:
-    """Filter a list of objects by a specific field value"""
+def filter_by_criteria(data: Iterable[Dict[str, Any]], field: str, value: Any) -> List[Dict[str, Any]]:
+    """Filter a list of objects by a specific field value
+
+    Any iterable works, e.g. StreamedJSON.items('people') for one record at a time.
+    A ColumnarRecords table is filtered with a vectorized mask instead.
+    """
+    if isinstance(data, ColumnarRecords):
+        return data.filter([(field, '==', value)])
+
     filtered = []
     for item in data:
         if isinstance(item, dict) and field in item and item[field] == value:
             filtered.append(item)
     return filtered
 
-def display_json_structure(data: Any, indent: int = 0) -> None:
-    """Display the structure of JSON data"""
-    prefix = "  " * indent
-    
-    if isinstance(data, dict):
-        print(f"{prefix}Dictionary with {len(data)} keys:")
-        for key, value in data.items():
-            if isinstance(value, (dict, list)):
-                print(f"{prefix}  {key}: ", end="")
-                display_json_structure(value, indent + 2)
-            else:
-                print(f"{prefix}  {key}: {type(value).__name__} = {value}")
-    elif isinstance(data, list):
-        print(f"List with {len(data)} items")
-        if data:
-            print(f"{prefix}  Sample item type: {type(data[0]).__name__}")
-            if isinstance(data[0], (dict, list)):
-                display_json_structure(data[0], indent + 1)
-    else:
-        print(f"{type(data).__name__} = {data}")
+def display_json_structure(data: Any, indent: int = 0, sample_size: int = 100,
+                           time_budget: Optional[float] = 1.0) -> Schema:
+    """Display the structure of JSON data
+
+    The structure is inferred from up to sample_size items of each list, so
+    mixed-type arrays and optional keys show up, and large documents stay
+    within the time budget. The Schema object is returned for further use.
+    A StreamedJSON is inferred from the first sample_size items of each list
+    (so list lengths are capped at sample_size).
+    """
+    if isinstance(data, StreamedJSON):
+        data = data.sample(sample_size, time_budget)
+        print(f"(streamed: first {sample_size} items of each list)")
+    schema = infer_schema(data, sample_size=sample_size, time_budget=time_budget)
+    for line in schema.format(indent):
+        print(line)
+    return schema
 
-def save_extracted_data(data: Dict[str, Any], filename: str) -> None:
-    """Save extracted data to a new JSON file"""
+def save_extracted_data(data: Dict[str, Any], filename: str, compact: bool = False) -> None:
+    """Save extracted data to a new JSON file (compact=True for machine output)"""
+    if isinstance(data, StreamedJSON):
+        # Saving would build the whole document, which streaming avoids
+        print("✗ Error: a streamed file cannot be saved whole; extract keys or a path first")
+        return
     try:
-        with open(filename, 'w', encoding='utf-8') as file:
-            json.dump(data, file, indent=2, ensure_ascii=False)
+        # Non-ASCII text is written as is, as this writer always did
+        save_json(data, filename, compact, ensure_ascii=False)
         print(f"✓ Extracted data saved to: {filename}")
     except Exception as e:
         print(f"✗ Error saving to '{filename}': {e}")
 
+def build_value_index(data: Union[Dict[str, Any], StreamedJSON]) -> ValueIndex:
+    """Build the value index used to answer repeated value searches"""
+    if isinstance(data, StreamedJSON):
+        index = ValueIndex.from_stream(data)
+    else:
+        index = ValueIndex.build(data)
+    print(f"✓ Built value index: {len(index)} distinct values in "
+          f"{index.build_seconds * 1000:.1f} ms ({index.memory_bytes / 1024:.1f} KB)")
+    return index
+
+def parse_search_value(text: str) -> Any:
+    """Convert typed-in search text to int, float or bool where it looks like one"""
+    try:
+        if text.isdigit():
+            return int(text)
+        elif text.replace('.', '', 1).isdigit():
+            return float(text)
+        elif text.lower() in ['true', 'false']:
+            return text.lower() == 'true'
+    except ValueError:
+        pass
+    return text  # Keep as string
+
 def interactive_extraction(data: Dict[str, Any]) -> None:
     """Interactive mode for extracting data"""
+    index = None  # built on the first value search and reused afterwards
+
     while True:
         print("\n" + "="*50)
         print("JSON EXTRACTION OPTIONS:")
         print("1. Extract specific keys")
-        print("2. Extract nested value (dot notation)")
+        print("2. Extract nested value (path query)")
         print("3. Search by value")
         print("4. Display JSON structure")
         print("5. Save current data to file")
@@ -141,31 +244,30 @@ def interactive_extraction(data: Dict[str, Any]) -> None:
                     print(json.dumps(extracted, indent=2))
         
         elif choice == "2":
-            path = input("Enter nested path (e.g., user.profile.name): ").strip()
+            path = input("Enter nested path (e.g., user.profile.name, projects[*].name): ").strip()
             if path:
                 value = extract_nested_value(data, path)
                 if value is not None:
                     print(f"Value: {value}")
         
         elif choice == "3":
-            search_value = input("Enter value to search for: ").strip()
-            # Try to convert to appropriate type
-            try:
-                if search_value.isdigit():
-                    search_value = int(search_value)
-                elif search_value.replace('.', '', 1).isdigit():
-                    search_value = float(search_value)
-                elif search_value.lower() in ['true', 'false']:
-                    search_value = search_value.lower() == 'true'
-            except:
-                pass  # Keep as string
+            search_value = parse_search_value(input("Enter value to search for: ").strip())
             
-            found_keys = search_by_value(data, search_value)
-            if found_keys:
-                print(f"Found '{search_value}' at:")
-                for key in found_keys:
-                    print(f"  - {key}")
+            if isinstance(data, StreamedJSON):
+                # Print each path as the stream reaches it; an index would hold
+                # every value of the file in memory
+                found_keys = data.search(search_value, typed=True)
             else:
+                if index is None:
+                    index = build_value_index(data)
+                found_keys = search_by_value(data, search_value, index)
+            found = False
+            for key in found_keys:
+                if not found:
+                    print(f"Found '{search_value}' at:")
+                    found = True
+                print(f"  - {key}")
+            if not found:
                 print(f"Value '{search_value}' not found in JSON data")
         
         elif choice == "4":
@@ -184,8 +286,109 @@ def interactive_extraction(data: Dict[str, Any]) -> None:
         else:
             print("Invalid option. Please try again.")
 
-def main():
+def run_file_queries(task: Tuple[str, List[Tuple[str, str]]]) -> Dict[str, Any]:
+    """Run batch queries against one file (executed in a worker process)
+
+    Queries are (kind, text) pairs where kind is 'key', 'path' or 'value'.
+    Nothing is printed; errors are reported in the returned record.
+    """
+    filename, queries = task
+    try:
+        if is_jsonl_file(filename):
+            data = load_jsonl(filename, workers=1)
+        else:
+            with open(filename, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+    except (OSError, ValueError) as e:
+        return {"file": filename, "error": str(e)}
+
+    results: Dict[str, Any] = {}
+    index = None  # built on the first value query, as in interactive mode
+    for kind, text in queries:
+        label = f"{kind}:{text}"
+        try:
+            if kind == 'key':
+                results[label] = data.get(text) if isinstance(data, dict) else None
+            elif kind == 'path':
+                query = compile_path(text)
+                results[label] = query.get(data) if query.is_simple else query.evaluate(data)
+            else:
+                # Typed lookup, so batch and interactive searches agree on 89 vs "89"
+                if index is None:
+                    index = ValueIndex.build(data)
+                results[label] = search_by_value(data, parse_search_value(text), index)
+        except Exception as e:
+            results[label] = {"error": str(e)}
+    return {"file": filename, "results": results}
+
+def run_batch(patterns: List[str], queries: List[Tuple[str, str]], output: Optional[str] = None,
+              workers: Optional[int] = None) -> Dict[str, int]:
+    """Run queries over every file matching the glob patterns
+
+    Files are spread over a process pool and one JSON Lines record per file
+    is written (to output, or stdout) as soon as it is ready, in file order.
+    """
+    filenames = sorted({name for pattern in patterns
+                        for name in glob.glob(pattern, recursive=True) if os.path.isfile(name)})
+    workers = workers or os.cpu_count() or 1
+    tasks = [(filename, queries) for filename in filenames]
+    stats = {"files": len(filenames), "errors": 0}
+    start = time.perf_counter()
+
+    def write_records(records: Iterable[Dict[str, Any]]) -> None:
+        for record in records:
+            if "error" in record:
+                stats["errors"] += 1
+            out.write(dumps(record, compact=True) + "\n")
+
+    out = open(output, 'w', encoding='utf-8') if output else sys.stdout
+    try:
+        if workers == 1 or len(tasks) <= 1:
+            write_records(map(run_file_queries, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # Larger chunks keep per-file IPC overhead small on big directories
+                chunksize = max(1, len(tasks) // (workers * 8))
+                write_records(executor.map(run_file_queries, tasks, chunksize=chunksize))
+    finally:
+        if output:
+            out.close()
+
+    report = sys.stdout if output else sys.stderr
+    print(f"✓ Processed {stats['files']} files ({stats['errors']} errors) with {workers} "
+          f"worker(s) in {time.perf_counter() - start:.2f}s", file=report)
+    return stats
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Command line options; with no subcommand the interactive tool starts"""
+    parser = argparse.ArgumentParser(description="JSON Information Extractor")
+    parser.add_argument("--stream", action="store_true",
+                        help="Read JSON files of at least "
+                             f"{STREAM_THRESHOLD_BYTES // (1024 * 1024)} MB incrementally instead of "
+                             "loading them (slower, but memory stays flat)")
+    subparsers = parser.add_subparsers(dest="command")
+
+    batch = subparsers.add_parser("batch", help="Run queries over many files without prompts")
+    batch.add_argument("patterns", nargs="+", help="File names or glob patterns (e.g. 'data/**/*.json')")
+    batch.add_argument("--key", action="append", default=[], help="Top-level key to extract")
+    batch.add_argument("--path", action="append", default=[], help="Path query, e.g. people[*].age")
+    batch.add_argument("--value", action="append", default=[], help="Value to search for")
+    batch.add_argument("--output", "-o", help="JSON Lines output file (default: stdout)")
+    batch.add_argument("--workers", "-w", type=int, help="Worker processes (default: CPU count)")
+    return parser
+
+def main(argv: Optional[List[str]] = None):
     """Main function"""
+    args = build_arg_parser().parse_args(argv)
+    if args.command == "batch":
+        queries = ([("key", key) for key in args.key] + [("path", path) for path in args.path]
+                   + [("value", value) for value in args.value])
+        if not queries:
+            print("✗ Error: give at least one --key, --path or --value query", file=sys.stderr)
+            return
+        run_batch(args.patterns, queries, args.output, args.workers)
+        return
+
     print("JSON Information Extractor")
     print("="*50)
     
@@ -200,12 +403,15 @@ def main():
             return
     
     # Load JSON data
-    json_data = load_json_file(filename)
+    json_data = load_json_file(filename, stream=args.stream)
     if not json_data:
         return
     
-    print(f"\nLoaded JSON data from '{filename}':")
-    print(json.dumps(json_data, indent=2))
+    if isinstance(json_data, StreamedJSON):
+        print(f"\nStreaming '{filename}': each option reads the file again instead of loading it")
+    else:
+        print(f"\nLoaded JSON data from '{filename}':")
+        print(json.dumps(json_data, indent=2))
     
     # Start interactive extraction
     interactive_extraction(json_data)
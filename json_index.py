@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Inverted Value Index for JSON Data
+Maps every scalar value to the paths where it appears, so repeated
+value searches do not have to walk the whole document again
+Date: October 18, 2025
+"""
+
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Tuple
+
+from json_stream import JSONEvent, StreamedJSON, format_path
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+IndexKey = Tuple[type, Any]
+
+# NaN never equals itself, so every NaN shares this key instead
+_NAN_KEY: IndexKey = (float, 'NaN')
+
+def _typed_key(value: Any) -> IndexKey:
+    """Key that keeps 89, 89.0, "89" and True/1 apart (every NaN gets one key)"""
+    if type(value) is float and value != value:
+        return _NAN_KEY
+    return type(value), value
+
+class ValueIndex:
+    """value -> paths lookup table built once from loaded JSON data"""
+
+    def __init__(self) -> None:
+        self._paths: Dict[IndexKey, List[str]] = {}
+        self.build_seconds = 0.0
+        self.memory_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __repr__(self) -> str:
+        return (f"ValueIndex({len(self)} values, built in {self.build_seconds:.4f}s, "
+                f"{self.memory_bytes / 1024:.1f} KB)")
+
+    @classmethod
+    def build(cls, data: Any) -> 'ValueIndex':
+        """Index every scalar in a parsed document (paths match search_by_value)"""
+        index = cls()
+        start = time.perf_counter()
+
+        stack: List[Tuple[str, Any]] = [("", data)]
+        while stack:
+            parent_key, obj = stack.pop()
+            if isinstance(obj, dict):
+                children = [(f"{parent_key}.{key}" if parent_key else key, value)
+                            for key, value in obj.items()]
+            elif isinstance(obj, list):
+                children = [(f"{parent_key}[{i}]", item) for i, item in enumerate(obj)]
+            else:
+                if parent_key and isinstance(obj, _SCALAR_TYPES):
+                    index._add(obj, parent_key)
+                continue
+            # Reversed so values are visited in document order
+            stack.extend(reversed(children))
+
+        index._finish(start)
+        return index
+
+    @classmethod
+    def from_events(cls, events: Iterable[JSONEvent]) -> 'ValueIndex':
+        """Index a document from streaming events without loading it"""
+        index = cls()
+        start = time.perf_counter()
+        for path, event, value in events:
+            if event == 'value' and path:
+                index._add(value, format_path(path))
+        index._finish(start)
+        return index
+
+    @classmethod
+    def from_stream(cls, data: StreamedJSON) -> 'ValueIndex':
+        """Index a StreamedJSON file in one streaming pass"""
+        return cls.from_events(data.events())
+
+    def _add(self, value: Any, path: str) -> None:
+        key = _typed_key(value)
+        paths = self._paths.get(key)
+        if paths is None:
+            self._paths[key] = [path]
+        else:
+            paths.append(path)
+
+    def _finish(self, start: float) -> None:
+        self.build_seconds = time.perf_counter() - start
+        self.memory_bytes = self._measure()
+
+    def _measure(self) -> int:
+        """Approximate bytes held by the index (table, keys, path lists and strings)"""
+        total = sys.getsizeof(self._paths)
+        for key, paths in self._paths.items():
+            total += sys.getsizeof(key) + sys.getsizeof(key[1])
+            total += sys.getsizeof(paths) + sum(sys.getsizeof(path) for path in paths)
+        return total
+
+    def can_lookup(self, value: Any) -> bool:
+        """True if value is a scalar the index can answer for"""
+        return isinstance(value, _SCALAR_TYPES)
+
+    def lookup(self, value: Any) -> List[str]:
+        """Return the paths holding exactly this value (same type and value; NaN finds NaN)"""
+        return list(self._paths.get(_typed_key(value), ()))
+
+def main():
+    """Build an index for the demo data and run a few lookups"""
+    from json_extraction_demo import sample_data
+
+    print("Inverted Value Index")
+    print("="*40)
+
+    index = ValueIndex.build(sample_data)
+    print(f"✓ {index}")
+    for value in ["89", 89, 5000, True, "dark"]:
+        print(f"{value!r}: {index.lookup(value)}")
+
+if __name__ == "__main__":
+    main()
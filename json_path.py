@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Compiled JSON Path Queries
+Parses a path once and evaluates it against many records
+Date: October 18, 2025
+
+Supported syntax:
+    user.profile.name      dot-separated keys
+    projects[0].name       list indices (negative indices count from the end)
+    projects[*].name       wildcard over list items (or projects.*.name)
+    profile.*              wildcard over dictionary values
+    ..name                 recursive descent: 'name' at any depth
+    ["key.with.dots"]      quoted keys
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+_TOKEN = re.compile(r"""
+    (?P<descend>\.\.)
+  | (?P<dot>\.)
+  | \[\s*(?P<index>-?\d+)\s*\]
+  | \[\s*(?P<bracket_wildcard>\*)\s*\]
+  | \[\s*(?P<quote>['"])(?P<quoted>.*?)(?P=quote)\s*\]
+  | (?P<wildcard>\*)
+  | (?P<name>[^.\[\]*]+)
+""", re.VERBOSE)
+
+Step = Tuple[str, Union[str, int, None]]
+
+def _parse(path: str) -> Tuple[Step, ...]:
+    """Turn a path string into a tuple of (kind, argument) steps"""
+    steps: List[Step] = []
+    pos = 0
+    expect_selector = True   # a key or wildcard must come next (start of path or after '.')
+    descend = False
+
+    while pos < len(path):
+        match = _TOKEN.match(path, pos)
+        if match is None:
+            raise ValueError(f"Invalid path '{path}': unexpected '{path[pos]}' at position {pos}")
+        kind = match.lastgroup
+        pos = match.end()
+
+        if kind in ('dot', 'descend'):
+            if expect_selector and steps:
+                raise ValueError(f"Invalid path '{path}': empty segment at position {match.start()}")
+            expect_selector = True
+            descend = kind == 'descend'
+            continue
+
+        if kind in ('name', 'wildcard'):
+            if not expect_selector:
+                raise ValueError(f"Invalid path '{path}': missing '.' before position {match.start()}")
+
+        if descend:
+            steps.append(('descend', None))
+            descend = False
+
+        if kind == 'name':
+            steps.append(('key', match.group('name')))
+        elif kind == 'quoted':
+            steps.append(('key', match.group('quoted')))
+        elif kind == 'index':
+            steps.append(('index', int(match.group('index'))))
+        else:
+            steps.append(('wildcard', None))
+        expect_selector = False
+
+    if expect_selector and path:
+        raise ValueError(f"Invalid path '{path}': path ends with '.'")
+    return tuple(steps)
+
+def _descendants(node: Any) -> Iterator[Any]:
+    """Yield a node and everything below it in document order"""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        if isinstance(current, dict):
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
+def _make_step(kind: str, arg: Union[str, int, None]) -> Callable[[List[Any]], List[Any]]:
+    """Build the function that maps the current node list to the next one"""
+    if kind == 'key':
+        def step(nodes):
+            return [node[arg] for node in nodes if isinstance(node, dict) and arg in node]
+    elif kind == 'index':
+        def step(nodes):
+            return [node[arg] for node in nodes
+                    if isinstance(node, list) and -len(node) <= arg < len(node)]
+    elif kind == 'wildcard':
+        def step(nodes):
+            matched = []
+            for node in nodes:
+                if isinstance(node, dict):
+                    matched.extend(node.values())
+                elif isinstance(node, list):
+                    matched.extend(node)
+            return matched
+    else:
+        def step(nodes):
+            matched = []
+            for node in nodes:
+                matched.extend(_descendants(node))
+            return matched
+    return step
+
+class JsonPath:
+    """A compiled path query that can be evaluated against any number of records"""
+
+    def __init__(self, path: str, steps: Optional[Tuple[Step, ...]] = None):
+        self.path = path
+        self.steps = _parse(path) if steps is None else steps
+        self.is_simple = all(kind in ('key', 'index') for kind, _ in self.steps)
+        self._functions = [_make_step(kind, arg) for kind, arg in self.steps]
+
+    def __repr__(self) -> str:
+        return f"JsonPath({self.path!r})"
+
+    @property
+    def components(self) -> Tuple[Union[str, int], ...]:
+        """The leading run of plain keys and non-negative indices"""
+        prefix = []
+        for kind, arg in self.steps:
+            if kind not in ('key', 'index') or (kind == 'index' and arg < 0):
+                break
+            prefix.append(arg)
+        return tuple(prefix)
+
+    def remainder(self) -> 'JsonPath':
+        """The part of the query that follows components"""
+        rest = self.steps[len(self.components):]
+        return JsonPath(self.path, rest)
+
+    def get(self, data: Any, default: Any = None) -> Any:
+        """Return the first match, or default when nothing matches"""
+        if self.is_simple:
+            current = data
+            for kind, arg in self.steps:
+                if kind == 'key':
+                    if not isinstance(current, dict) or arg not in current:
+                        return default
+                elif not isinstance(current, list) or not -len(current) <= arg < len(current):
+                    return default
+                current = current[arg]
+            return current
+
+        matches = self.evaluate(data)
+        return matches[0] if matches else default
+
+    def evaluate(self, data: Any) -> List[Any]:
+        """Return every value the query matches, in document order"""
+        nodes = [data]
+        for step in self._functions:
+            nodes = step(nodes)
+            if not nodes:
+                break
+        return nodes
+
+    def get_many(self, records: Iterable[Any], default: Any = None) -> List[Any]:
+        """Return the first match (or default) for each record"""
+        get = self.get
+        return [get(record, default) for record in records]
+
+    def evaluate_many(self, records: Iterable[Any]) -> List[List[Any]]:
+        """Return the list of matches for each record"""
+        evaluate = self.evaluate
+        return [evaluate(record) for record in records]
+
+@lru_cache(maxsize=1024)
+def compile_path(path: str) -> JsonPath:
+    """Compile a path string, reusing the compiled query for repeated paths"""
+    return JsonPath(path)
+
+def main():
+    """Demonstrate compiled queries on the demo data"""
+    from json_extraction_demo import sample_data
+
+    print("Compiled JSON Path Queries")
+    print("="*40)
+
+    for path in ["profile.preferences.theme", "projects[0].name", "projects[*].budget",
+                 "profile.*", "..name", "hobbies[-1]"]:
+        query = compile_path(path)
+        print(f"{path}: {query.evaluate(sample_data)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+JSON Schema Inference
+Builds a structured schema of a JSON document by sampling list items,
+merging the types seen and counting optional keys, within a time/size budget
+Date: October 18, 2025
+"""
+
+import random
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+class SchemaNode:
+    """Everything observed at one position of the document"""
+
+    MAX_EXAMPLES = 3
+
+    def __init__(self) -> None:
+        self.count = 0                       # how many values were observed here
+        self.types: Dict[str, int] = {}      # type name -> number of observations
+        self.fields: Dict[str, 'SchemaNode'] = {}
+        self.items: Optional['SchemaNode'] = None
+        self.min_length: Optional[int] = None
+        self.max_length: Optional[int] = None
+        self.sampled_items = 0
+        self.examples: List[Any] = []
+
+    @property
+    def dict_count(self) -> int:
+        return self.types.get('dict', 0)
+
+    def is_optional(self, key: str) -> bool:
+        """True if some observed dictionaries at this position lacked the key"""
+        return self.fields[key].count < self.dict_count
+
+    def type_label(self) -> str:
+        if not self.types:
+            return "(not examined)"
+        if len(self.types) == 1:
+            return next(iter(self.types))
+        return " | ".join(f"{name} ({count})" for name, count in
+                          sorted(self.types.items(), key=lambda item: -item[1]))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dictionary form, suitable for json.dump"""
+        result: Dict[str, Any] = {"count": self.count, "types": dict(self.types)}
+        if self.fields:
+            result["fields"] = {}
+            for key, child in self.fields.items():
+                child_dict = child.to_dict()
+                child_dict["optional"] = self.is_optional(key)
+                result["fields"][key] = child_dict
+        if self.min_length is not None:
+            result["length"] = {"min": self.min_length, "max": self.max_length,
+                                "sampled": self.sampled_items}
+        if self.items is not None:
+            result["items"] = self.items.to_dict()
+        if self.examples:
+            result["examples"] = list(self.examples)
+        return result
+
+class Schema:
+    """Result of infer_schema: the root node plus how the budget was spent"""
+
+    def __init__(self, root: SchemaNode, nodes_visited: int, elapsed: float, truncated: bool):
+        self.root = root
+        self.nodes_visited = nodes_visited
+        self.elapsed = elapsed
+        self.truncated = truncated
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "schema": self.root.to_dict(),
+            "nodes_visited": self.nodes_visited,
+            "elapsed_seconds": round(self.elapsed, 6),
+            "truncated": self.truncated,
+        }
+
+    def format(self, indent: int = 0) -> List[str]:
+        """Human-readable lines describing the schema"""
+        lines: List[str] = []
+        _format_node(self.root, "root", "  " * indent, lines, optional_note="")
+        if self.truncated:
+            lines.append(f"{'  ' * indent}(budget reached after {self.nodes_visited} values - "
+                         f"schema is partial)")
+        return lines
+
+def _format_node(node: SchemaNode, label: str, prefix: str, lines: List[str],
+                 optional_note: str) -> None:
+    text = f"{prefix}{label}: {node.type_label()}{optional_note}"
+    if node.min_length is not None:
+        length = (f"{node.min_length}" if node.min_length == node.max_length
+                  else f"{node.min_length}-{node.max_length}")
+        text += f" [{length} items, {node.sampled_items} sampled]"
+    if node.examples:
+        text += f"  e.g. {', '.join(repr(example) for example in node.examples)}"
+    lines.append(text)
+
+    for key, child in node.fields.items():
+        note = f" (optional, {child.count}/{node.dict_count})" if node.is_optional(key) else ""
+        _format_node(child, key, prefix + "  ", lines, note)
+    if node.items is not None:
+        _format_node(node.items, "[item]", prefix + "  ", lines, "")
+
+def infer_schema(data: Any, sample_size: int = 100, time_budget: Optional[float] = 1.0,
+                 max_nodes: Optional[int] = 100_000, seed: int = 0) -> Schema:
+    """Infer the schema of parsed JSON data
+
+    sample_size - at most this many items of each list are examined, chosen
+                  uniformly at random (reservoir sampling)
+    time_budget - stop after this many seconds (None for no limit)
+    max_nodes   - stop after examining this many values (None for no limit)
+
+    Values are visited breadth first, so when the budget runs out it is the
+    deepest levels that are left incomplete.
+    """
+    rng = random.Random(seed)
+    root = SchemaNode()
+    queue = deque([(data, root)])
+    visited = 0
+    truncated = False
+    start = time.perf_counter()
+
+    while queue:
+        if max_nodes is not None and visited >= max_nodes:
+            truncated = True
+            break
+        if time_budget is not None and visited % 1024 == 0 and time.perf_counter() - start > time_budget:
+            truncated = True
+            break
+
+        value, node = queue.popleft()
+        visited += 1
+        node.count += 1
+        type_name = type(value).__name__
+        node.types[type_name] = node.types.get(type_name, 0) + 1
+
+        if isinstance(value, dict):
+            for key, child_value in value.items():
+                child = node.fields.get(key)
+                if child is None:
+                    child = node.fields[key] = SchemaNode()
+                queue.append((child_value, child))
+        elif isinstance(value, list):
+            length = len(value)
+            node.min_length = length if node.min_length is None else min(node.min_length, length)
+            node.max_length = length if node.max_length is None else max(node.max_length, length)
+            if node.items is None:
+                node.items = SchemaNode()
+            for item in reservoir_sample(value, sample_size, rng):
+                node.sampled_items += 1
+                queue.append((item, node.items))
+        elif len(node.examples) < SchemaNode.MAX_EXAMPLES and value not in node.examples:
+            node.examples.append(value)
+
+    return Schema(root, visited, time.perf_counter() - start, truncated)
+
+def reservoir_sample(items: Any, k: int, rng: random.Random) -> List[Any]:
+    """Uniform random sample of at most k items, in their original order
+
+    Lists are sampled by index without copying; any other iterable is read
+    once with Algorithm R, keeping only k items in memory.
+    """
+    if isinstance(items, list):
+        if len(items) <= k:
+            return items
+        return [items[i] for i in sorted(rng.sample(range(len(items)), k))]
+
+    reservoir: List[Any] = []
+    for position, item in enumerate(items):
+        if position < k:
+            reservoir.append((position, item))
+        else:
+            slot = rng.randint(0, position)
+            if slot < k:
+                reservoir[slot] = (position, item)
+    return [item for _, item in sorted(reservoir, key=lambda pair: pair[0])]
+
+def main():
+    """Show the inferred schema of the demo data"""
+    from json_extraction_demo import sample_data
+
+    print("JSON Schema Inference")
+    print("="*40)
+
+    schema = infer_schema(sample_data)
+    for line in schema.format():
+        print(line)
+    print(f"\n✓ {schema.nodes_visited} values examined in {schema.elapsed * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+JSON Serializer Backends
+One place for every JSON writer (and bulk reader) in the project: uses orjson
+or ujson when they are installed and falls back to the standard json module otherwise
+Date: October 18, 2025
+
+Every backend writes the same JSON as json.dump: the same layout,
+non-ASCII characters escaped as \\uXXXX unless ensure_ascii=False, and
+NaN/Infinity as NaN/Infinity (orjson alone would write null). Only the
+spelling of some floats differs, never their value: orjson writes 1e301
+and ujson 1e-7 where json writes 1e+301 and 1e-07.
+"""
+
+import json
+import math
+import re
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Dict, Iterable, List, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+# orjson reads integers outside the 64-bit range as floats. They have at
+# least 19 digits, so text with such a run of digits is left to the stdlib
+# parser; mapping every digit to '0' makes the check one substring search
+_DIGITS_TO_ZERO = str.maketrans('123456789', '000000000')
+_DIGITS_TO_ZERO_BYTES = bytes.maketrans(b'123456789', b'000000000')
+_LONG_NUMBER = '0' * 19
+
+_NON_ASCII = re.compile(r'[^\x00-\x7f]+')
+_ASTRAL_ESCAPE = re.compile(rb'\\U([0-9a-f]{8})')
+
+def _stdlib_dumps(data: Any, compact: bool, ensure_ascii: bool) -> bytes:
+    if compact:
+        text = json.dumps(data, separators=(',', ':'), ensure_ascii=ensure_ascii)
+    else:
+        text = json.dumps(data, indent=2, ensure_ascii=ensure_ascii)
+    return text.encode('utf-8')
+
+def _surrogate_pair(match: 're.Match[bytes]') -> bytes:
+    code = int(match.group(1), 16) - 0x10000
+    return b'\\u%04x\\u%04x' % (0xd800 + (code >> 10), 0xdc00 + (code & 0x3ff))
+
+def _escape_non_ascii(encoded: bytes) -> bytes:
+    """\\uXXXX-escape the non-ASCII characters of UTF-8 JSON, as ensure_ascii does
+
+    Outside strings JSON is pure ASCII, so every non-ASCII character is string
+    content. The backslashreplace codec writes \\xHH, \\uHHHH or \\UHHHHHHHH,
+    and the first and last are rewritten into JSON's forms. JSON never
+    contains a lone backslash followed by x or U, unless a string holds a
+    literal backslash before one; that rare text is escaped per character.
+    """
+    text = encoded.decode('utf-8')
+    if '\\\\x' in text or '\\\\U' in text:
+        return _NON_ASCII.sub(lambda match: encode_basestring_ascii(match.group())[1:-1],
+                              text).encode('ascii')
+    escaped = text.encode('ascii', 'backslashreplace').replace(b'\\x', b'\\u00')
+    if b'\\U' in escaped:
+        escaped = _ASTRAL_ESCAPE.sub(_surrogate_pair, escaped)
+    return escaped
+
+def _has_non_finite(data: Any) -> bool:
+    """True if a NaN or infinite float occurs anywhere in data"""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+def _orjson_dumps(data: Any, compact: bool, ensure_ascii: bool) -> bytes:
+    option = orjson.OPT_NON_STR_KEYS
+    if not compact:
+        option |= orjson.OPT_INDENT_2
+    try:
+        encoded = orjson.dumps(data, option=option)
+    except TypeError:
+        # e.g. integers wider than 64 bits, which only the stdlib encoder handles
+        return _stdlib_dumps(data, compact, ensure_ascii)
+    # orjson writes NaN/Infinity as null; the data is only walked when a null shows up
+    if b'null' in encoded and _has_non_finite(data):
+        return _stdlib_dumps(data, compact, ensure_ascii)
+    # orjson has no ensure_ascii option, so escape its output instead
+    if ensure_ascii and not encoded.isascii():
+        return _escape_non_ascii(encoded)
+    return encoded
+
+def _ujson_dumps(data: Any, compact: bool, ensure_ascii: bool) -> bytes:
+    try:
+        text = ujson.dumps(data, ensure_ascii=ensure_ascii, escape_forward_slashes=False,
+                           indent=0 if compact else 2)
+    except (TypeError, OverflowError):
+        return _stdlib_dumps(data, compact, ensure_ascii)
+    return text.encode('utf-8')
+
+_BACKENDS: Dict[str, Callable[[Any, bool, bool], bytes]] = {'json': _stdlib_dumps}
+if ujson is not None:
+    _BACKENDS['ujson'] = _ujson_dumps
+if orjson is not None:
+    _BACKENDS['orjson'] = _orjson_dumps
+
+_PREFERENCE = ('orjson', 'ujson', 'json')
+_backend_name = next(name for name in _PREFERENCE if name in _BACKENDS)
+
+def available_backends() -> List[str]:
+    """Names of the installed backends, fastest first"""
+    return [name for name in _PREFERENCE if name in _BACKENDS]
+
+def get_backend() -> str:
+    """Name of the backend currently used for writing"""
+    return _backend_name
+
+def use_backend(name: str) -> None:
+    """Force a specific backend ('orjson', 'ujson' or 'json')"""
+    global _backend_name
+    if name not in _BACKENDS:
+        raise ValueError(f"JSON backend '{name}' is not available "
+                         f"(installed: {', '.join(available_backends())})")
+    _backend_name = name
+
+def dumps_bytes(data: Any, compact: bool = False, ensure_ascii: bool = True) -> bytes:
+    """Serialize to UTF-8 bytes; compact=True drops indentation and spaces,
+    ensure_ascii=False writes non-ASCII characters as they are"""
+    return _BACKENDS[_backend_name](data, compact, ensure_ascii)
+
+def dumps(data: Any, compact: bool = False, ensure_ascii: bool = True) -> str:
+    """Serialize to a string; compact=True drops indentation and spaces"""
+    return dumps_bytes(data, compact, ensure_ascii).decode('utf-8')
+
+def _has_long_number(text: Union[str, bytes]) -> bool:
+    if isinstance(text, bytes):
+        return _LONG_NUMBER.encode() in text.translate(_DIGITS_TO_ZERO_BYTES)
+    return _LONG_NUMBER in text.translate(_DIGITS_TO_ZERO)
+
+def _orjson_loads(text: Union[str, bytes]) -> Any:
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        # NaN/Infinity, or invalid JSON (then json.loads raises its own error)
+        return json.loads(text)
+
+def _ujson_loads(text: Union[str, bytes]) -> Any:
+    try:
+        return ujson.loads(text)
+    except (ValueError, OverflowError):
+        return json.loads(text)
+
+def loads(text: Union[str, bytes]) -> Any:
+    """Parse JSON text or UTF-8 bytes with the fastest installed parser
+
+    The result is always what json.loads returns: text a fast parser
+    rejects (e.g. NaN/Infinity for orjson) or would round (integers wider
+    than 64 bits) is parsed by the standard json module, which also raises
+    the error for invalid JSON.
+    """
+    return loads_for(text)(text)
+
+def loads_for(block: Union[str, bytes]) -> Callable[[Union[str, bytes]], Any]:
+    """A parser that gives loads' result for any part of block, e.g. its lines
+
+    The block is checked for long integers once, instead of once per line.
+    """
+    if _backend_name == 'orjson' and not _has_long_number(block):
+        return _orjson_loads
+    if _backend_name == 'ujson':
+        return _ujson_loads
+    return json.loads
+
+def save_json(data: Any, filename: str, compact: bool = False, ensure_ascii: bool = True) -> None:
+    """Write data to a UTF-8 JSON file (indented unless compact=True)"""
+    with open(filename, 'wb') as file:
+        file.write(dumps_bytes(data, compact, ensure_ascii))
+
+class JSONListWriter:
+    """Writes a JSON array to a file one item at a time
+
+    Only the current item is ever serialized in memory, so results can be
+    written while they are being produced:
+
+        with JSONListWriter('results.json') as writer:
+            for record in records:
+                writer.write(record)
+    """
+
+    def __init__(self, filename: str, compact: bool = False,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self.filename = filename
+        self.compact = compact
+        self.count = 0
+        self._file = open(filename, 'wb', buffering=buffer_size)
+        self._file.write(b'[')
+
+    def __enter__(self) -> 'JSONListWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def write(self, item: Any) -> None:
+        """Append one item to the array"""
+        encoded = dumps_bytes(item, self.compact)
+        if self.compact:
+            self._file.write(b',' + encoded if self.count else encoded)
+        else:
+            # Indent the item's lines by one level to match indent=2 output
+            self._file.write(b',\n  ' if self.count else b'\n  ')
+            self._file.write(encoded.replace(b'\n', b'\n  '))
+        self.count += 1
+
+    def write_many(self, items: Iterable[Any]) -> int:
+        """Append every item from an iterable; returns how many were written"""
+        written = 0
+        for item in items:
+            self.write(item)
+            written += 1
+        return written
+
+    def close(self) -> None:
+        """Finish the array and close the file"""
+        if self._file.closed:
+            return
+        self._file.write(b']' if self.compact or not self.count else b'\n]')
+        self._file.close()
+
+def main():
+    """Report the active backend and write a small example"""
+    from json_extraction_demo import sample_data
+
+    print("JSON Serializer Backends")
+    print("="*40)
+    print(f"Installed backends: {', '.join(available_backends())}")
+    print(f"Using: {get_backend()}")
+
+    print("\nCompact output:")
+    print(dumps(sample_data["projects"], compact=True))
+
+    with JSONListWriter('extracted_projects_stream.json') as writer:
+        writer.write_many(sample_data["projects"])
+    print(f"\n✓ Streamed {writer.count} projects to 'extracted_projects_stream.json'")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON Loader
+Parses JSON files incrementally as a stream of path/value events
+Date: October 18, 2025
+"""
+
+import json
+import re
+import time
+from json.decoder import scanstring
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+from json_path import compile_path
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_NUMBER = re.compile(r'(-?(?:0|[1-9]\d*))(\.\d+)?([eE][-+]?\d+)?')
+_NUMBER_CHARS = re.compile(r'[-+.eE0-9]*')
+# NaN and Infinity are not JSON, but json.load accepts them, so do the same
+_LITERALS = (('true', True), ('false', False), ('null', None),
+             ('NaN', float('nan')), ('Infinity', float('inf')), ('-Infinity', float('-inf')))
+
+PathComponents = Tuple[Union[str, int], ...]
+JSONEvent = Tuple[PathComponents, str, Any]
+
+_MISSING = object()
+
+class _Lexer:
+    """Splits a text file into JSON tokens, reading one chunk at a time"""
+
+    def __init__(self, file: TextIO, chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer; False once the file is exhausted"""
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            return False
+        self.buffer += chunk
+        return True
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+    def next_token(self) -> Tuple[Optional[str], Any]:
+        """Return the next (kind, value) token, or (None, None) at end of file"""
+        # Drop already-consumed text so the buffer stays around one chunk long
+        if self.pos >= self.chunk_size:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                break
+            if not self._fill():
+                return None, None
+
+        char = self.buffer[self.pos]
+        if char in '{}[]:,':
+            self.pos += 1
+            return char, None
+
+        if char == '"':
+            while True:
+                try:
+                    value, end = scanstring(self.buffer, self.pos + 1, True)
+                except json.JSONDecodeError:
+                    # The string may continue in the next chunk
+                    if self._fill():
+                        continue
+                    raise
+                self.pos = end
+                return 'string', value
+
+        for literal, value in _LITERALS:
+            if char == literal[0]:
+                while len(self.buffer) - self.pos < len(literal) and self._fill():
+                    pass
+                if self.buffer.startswith(literal, self.pos):
+                    self.pos += len(literal)
+                    return 'value', value
+
+        if char == '-' or char.isdigit():
+            # Make sure the whole number is buffered before matching it
+            while (_NUMBER_CHARS.match(self.buffer, self.pos).end() == len(self.buffer)
+                   and self._fill()):
+                pass
+            match = _NUMBER.match(self.buffer, self.pos)
+            if match is None:
+                raise self.error("Expecting value")
+            integer, fraction, exponent = match.groups()
+            self.pos = match.end()
+            if fraction or exponent:
+                return 'value', float(integer + (fraction or '') + (exponent or ''))
+            return 'value', int(integer)
+
+        raise self.error("Expecting value")
+
+def _expect_key(lexer: _Lexer, kind: Optional[str], value: Any) -> str:
+    """Validate an object key token and consume the ':' that follows it"""
+    if kind != 'string':
+        raise lexer.error("Expecting property name enclosed in double quotes")
+    if lexer.next_token()[0] != ':':
+        raise lexer.error("Expecting ':' delimiter")
+    return value
+
+def _parse_events(lexer: _Lexer) -> Iterator[JSONEvent]:
+    """Turn a token stream into (path, event, value) tuples"""
+    path: List[Union[str, int]] = []
+    containers: List[str] = []
+    kind, value = lexer.next_token()
+
+    while True:
+        # Parse the value that starts at the current token
+        if kind == '{':
+            yield tuple(path), 'start_map', None
+            kind, value = lexer.next_token()
+            if kind != '}':
+                containers.append('map')
+                path.append(_expect_key(lexer, kind, value))
+                kind, value = lexer.next_token()
+                continue
+            yield tuple(path), 'end_map', None
+        elif kind == '[':
+            yield tuple(path), 'start_array', None
+            kind, value = lexer.next_token()
+            if kind != ']':
+                containers.append('array')
+                path.append(0)
+                continue
+            yield tuple(path), 'end_array', None
+        elif kind in ('string', 'value'):
+            yield tuple(path), 'value', value
+        else:
+            raise lexer.error("Expecting value")
+
+        # The value is complete: move to the next sibling or close containers
+        while True:
+            if not containers:
+                if lexer.next_token()[0] is not None:
+                    raise lexer.error("Extra data")
+                return
+            kind, value = lexer.next_token()
+            if kind == ',':
+                if containers[-1] == 'map':
+                    kind, value = lexer.next_token()
+                    path[-1] = _expect_key(lexer, kind, value)
+                else:
+                    path[-1] += 1
+                kind, value = lexer.next_token()
+                break
+            if kind != ('}' if containers[-1] == 'map' else ']'):
+                raise lexer.error("Expecting ',' delimiter")
+            container = containers.pop()
+            path.pop()
+            yield tuple(path), 'end_map' if container == 'map' else 'end_array', None
+
+def iter_json_events(filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[JSONEvent]:
+    """Yield (path, event, value) tuples while reading a JSON file chunk by chunk
+
+    Events are 'start_map', 'end_map', 'start_array', 'end_array' and 'value'.
+    Paths are tuples of keys and list indices, so memory use depends on the
+    nesting depth of the document rather than on its size.
+    """
+    with open(filename, 'r', encoding='utf-8') as file:
+        yield from _parse_events(_Lexer(file, chunk_size))
+
+def format_path(components: PathComponents) -> str:
+    """Format path components the same way as search_by_value (e.g. 'people[0].name')"""
+    text = ""
+    for part in components:
+        if isinstance(part, int):
+            text += f"[{part}]"
+        else:
+            text = f"{text}.{part}" if text else part
+    return text
+
+def build_value(first_event: JSONEvent, events: Iterator[JSONEvent]) -> Any:
+    """Build the Python object that starts at first_event, consuming its events"""
+    _, event, value = first_event
+    if event == 'value':
+        return value
+
+    root: Any = {} if event == 'start_map' else []
+    stack = [root]
+    for path, event, value in events:
+        if event in ('end_map', 'end_array'):
+            stack.pop()
+            if not stack:
+                return root
+            continue
+
+        if event == 'value':
+            item = value
+        else:
+            item = {} if event == 'start_map' else []
+
+        container = stack[-1]
+        if isinstance(container, dict):
+            container[path[-1]] = item
+        else:
+            container.append(item)
+        if event != 'value':
+            stack.append(item)
+
+    raise json.JSONDecodeError("Unexpected end of JSON data", "", 0)
+
+class StreamedJSON:
+    """Lazy facade over a JSON file that only builds the parts you ask for
+
+    Every method makes a fresh streaming pass over the file, so nothing is
+    kept in memory between calls.
+    """
+
+    def __init__(self, filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.filename = filename
+        self.chunk_size = chunk_size
+
+    def __repr__(self) -> str:
+        return f"StreamedJSON({self.filename!r})"
+
+    def events(self) -> Iterator[JSONEvent]:
+        """Yield the raw (path, event, value) events of the file"""
+        return iter_json_events(self.filename, self.chunk_size)
+
+    def _build_at(self, target: PathComponents, default: Any) -> Any:
+        """Build the value whose event path equals target"""
+        events = self.events()
+        for event in events:
+            if event[0] == target and not event[1].startswith('end_'):
+                return build_value(event, events)
+        return default
+
+    def get(self, path: str, default: Any = None) -> Any:
+        """Build and return only the value at a path such as 'people[0].name'
+
+        Only the subtree under the leading keys/indices of the path is built;
+        wildcards and recursive descent are applied to that subtree afterwards.
+        """
+        query = compile_path(path)
+        subtree = self._build_at(query.components, _MISSING)
+        if subtree is _MISSING:
+            return default
+        return query.remainder().get(subtree, default)
+
+    def evaluate(self, path: str) -> List[Any]:
+        """Return every value a path query matches, like JsonPath.evaluate"""
+        query = compile_path(path)
+        subtree = self._build_at(query.components, _MISSING)
+        if subtree is _MISSING:
+            return []
+        return query.remainder().evaluate(subtree)
+
+    def select(self, keys: List[str]) -> Dict[str, Any]:
+        """Build the values of several top-level keys in a single pass"""
+        targets = {(key,): key for key in keys}
+        found: Dict[str, Any] = {}
+        events = self.events()
+        for event in events:
+            if event[0] in targets and not event[1].startswith('end_'):
+                found[targets.pop(event[0])] = build_value(event, events)
+                if not targets:
+                    break
+        return found
+
+    def items(self, path: str = "") -> Iterator[Any]:
+        """Yield the elements of the list at a path one at a time
+
+        Each element is an ordinary dict/list/scalar, so the existing extraction
+        functions (filter_by_criteria, extract_specific_keys, ...) can consume it.
+        """
+        query = compile_path(path)
+        if len(query.components) != len(query.steps):
+            raise ValueError(f"items() needs a path of plain keys and indices, got '{path}'")
+        target = query.components
+        depth = len(target) + 1
+        events = self.events()
+        for event in events:
+            event_path, kind, _ = event
+            if (len(event_path) == depth and isinstance(event_path[-1], int)
+                    and event_path[:-1] == target and not kind.startswith('end_')):
+                yield build_value(event, events)
+
+    def search(self, search_value: Any, typed: bool = False) -> Iterator[str]:
+        """Yield the path of every scalar equal to search_value as soon as it is parsed
+
+        typed=True also compares types, like ValueIndex, so 89, 89.0, "89"
+        and True/1 are kept apart.
+        """
+        for path, event, value in self.events():
+            if (event == 'value' and path and value == search_value
+                    and (not typed or type(value) is type(search_value))):
+                yield format_path(path)
+
+    def sample(self, list_items: int = 100, time_budget: Optional[float] = None) -> Any:
+        """Build the document with every list cut to its first list_items items
+
+        Meant for schema inference on files too large to load: the elements
+        past the cut are parsed but not built. With a time_budget the pass
+        stops early and returns what was built so far.
+        """
+        root: Any = _MISSING
+        stack: List[Any] = []
+        skip_depth = 0   # > 0 while inside an element past a list's cut
+        start = time.perf_counter()
+        for count, (path, event, value) in enumerate(self.events()):
+            if (time_budget is not None and count % 4096 == 0 and root is not _MISSING
+                    and time.perf_counter() - start > time_budget):
+                break
+            if skip_depth:
+                if event in ('start_map', 'start_array'):
+                    skip_depth += 1
+                elif event in ('end_map', 'end_array'):
+                    skip_depth -= 1
+                continue
+            if event in ('end_map', 'end_array'):
+                stack.pop()
+                continue
+
+            item = value if event == 'value' else {} if event == 'start_map' else []
+            if not stack:
+                root = item
+            elif isinstance(stack[-1], dict):
+                stack[-1][path[-1]] = item
+            elif len(stack[-1]) < list_items:
+                stack[-1].append(item)
+            else:
+                if event != 'value':
+                    skip_depth = 1
+                continue
+            if event != 'value':
+                stack.append(item)
+        return root
+
+def main():
+    """Show the events of sample.json"""
+    print("Streaming JSON Loader")
+    print("="*40)
+
+    try:
+        for path, event, value in iter_json_events('sample.json'):
+            label = format_path(path) or "<root>"
+            if event == 'value':
+                print(f"{label}: {value!r}")
+            else:
+                print(f"{label}: {event}")
+    except FileNotFoundError:
+        print("✗ Error: File 'sample.json' not found!")
+    except json.JSONDecodeError as e:
+        print(f"✗ Error: Invalid JSON format: {e}")
+
+if __name__ == "__main__":
+    main()
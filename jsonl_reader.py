@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+JSON Lines Reader
+Reads newline-delimited JSON (one record per line) through a memory map,
+splitting the file into newline-aligned chunks that are parsed in parallel
+Date: October 18, 2025
+"""
+
+import mmap
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Iterator, List, Optional, Tuple
+
+from json_serializer import loads_for
+
+JSONL_EXTENSIONS = ('.jsonl', '.ndjson')
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+
+Chunk = Tuple[str, int, int]
+
+def is_jsonl_file(filename: str) -> bool:
+    """True for .jsonl / .ndjson files"""
+    return filename.lower().endswith(JSONL_EXTENSIONS)
+
+def split_chunks(filename: str, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> List[Chunk]:
+    """Byte ranges of roughly chunk_bytes that always end just after a newline"""
+    size = os.path.getsize(filename)
+    if size == 0:
+        return []
+
+    chunks = []
+    with open(filename, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        start = 0
+        while start < size:
+            end = data.find(b'\n', min(start + chunk_bytes, size) - 1)
+            end = size if end == -1 else end + 1
+            chunks.append((filename, start, end))
+            start = end
+    return chunks
+
+def parse_chunk(chunk: Chunk) -> List[Any]:
+    """Parse every non-blank line in one byte range (runs in a worker process)"""
+    filename, start, end = chunk
+    with open(filename, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        block = data[start:end]
+
+    records = []
+    offset = start
+    loads = loads_for(block)
+    for line in block.split(b'\n'):
+        if line.strip():
+            try:
+                records.append(loads(line))
+            except ValueError as e:
+                raise ValueError(f"Invalid JSON line at byte {offset} of '{filename}': {e}") from None
+        offset += len(line) + 1
+    return records
+
+def iter_jsonl(filename: str, workers: Optional[int] = None, ordered: bool = True,
+               chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[Any]:
+    """Yield the records of a JSON Lines file
+
+    workers  - worker processes for parsing (default: CPU count; 1 parses in-process)
+    ordered  - keep file order; with False records come out as chunks finish
+    At most two chunks per worker are in flight, so memory stays bounded
+    even when the consumer is slower than the parsers.
+    """
+    chunks = split_chunks(filename, chunk_bytes)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield from parse_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending_chunks = deque(chunks)
+        in_flight = deque()
+        limit = workers * 2
+
+        def submit_more():
+            while pending_chunks and len(in_flight) < limit:
+                in_flight.append(executor.submit(parse_chunk, pending_chunks.popleft()))
+
+        submit_more()
+        while in_flight:
+            if ordered:
+                future = in_flight.popleft()
+            else:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                in_flight.remove(future)
+            records = future.result()
+            submit_more()
+            yield from records
+
+def load_jsonl(filename: str, workers: Optional[int] = None) -> List[Any]:
+    """Read a whole JSON Lines file into a list of records"""
+    return list(iter_jsonl(filename, workers))
+
+def main():
+    """Read a JSON Lines file given on the command line and summarize it"""
+    print("JSON Lines Reader")
+    print("="*40)
+
+    if len(sys.argv) < 2:
+        print("Usage: py jsonl_reader.py <file.jsonl> [workers]")
+        return
+    filename = sys.argv[1]
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    start = time.perf_counter()
+    try:
+        count = sum(1 for _ in iter_jsonl(filename, workers))
+    except FileNotFoundError:
+        print(f"✗ Error: File '{filename}' not found!")
+        return
+    except ValueError as e:
+        print(f"✗ Error: {e}")
+        return
+    print(f"✓ Read {count} records from {filename} in {time.perf_counter() - start:.2f}s")
+
+if __name__ == "__main__":
+    main()
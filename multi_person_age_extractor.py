@@ -2,11 +2,22 @@
 """
 Multi-Person Age Extractor
 Demonstrates extracting age from JSON with multiple people
+(or from a .parquet / .arrow file made by people_store.py)
 """
 
-import json
+import argparse
 
-def create_sample_multi_person_data():
+from age_enrichment import enrich_ages
+from age_index import index_for_ages
+from age_session import AgeSession
+from json_serializer import save_json
+from jsonl_reader import is_jsonl_file
+from people_index import index_for_people
+from people_store import is_columnar_file
+
+MAX_LISTED_NAMES = 20
+
+def create_sample_multi_person_data(filename='multi_person_data.json'):
     """Create a sample JSON file with multiple people"""
     sample_data = {
         "people": [
@@ -21,10 +32,9 @@ def create_sample_multi_person_data():
         }
     }
     
-    with open('multi_person_data.json', 'w') as file:
-        json.dump(sample_data, file, indent=2)
+    save_json(sample_data, filename)
     
-    print("✓ Created multi_person_data.json with sample data")
+    print(f"✓ Created {filename} with sample data")
     return sample_data
 
 def get_user_input_for_search():
@@ -37,8 +47,9 @@ def get_user_input_for_search():
     print("2. Search by partial name")
     print("3. Show all people")
     print("4. Find people in age range")
+    print("5. Search by name prefix")
     
-    choice = input("Select option (1-4): ").strip()
+    choice = input("Select option (1-5): ").strip()
     
     if choice == "1":
         name = input("Enter exact name: ").strip()
@@ -56,19 +67,27 @@ def get_user_input_for_search():
         except ValueError:
             print("Invalid age range. Using default search.")
             return "all", None
+    elif choice == "5":
+        prefix = input("Enter start of name: ").strip()
+        return "prefix", prefix
     else:
         print("Invalid choice. Showing all people.")
         return "all", None
 
-def extract_age_by_exact_name(people_list, search_name):
-    """Extract age by exact name match"""
+def extract_age_by_exact_name(people_list, search_name, index=None):
+    """Extract age by exact name match (index: PeopleIndex for people_list)"""
+    if index is not None:
+        positions = index.exact(search_name)
+        return people_list[positions[0]] if positions else None
     for person in people_list:
         if person.get('name', '').lower() == search_name.lower():
             return person
     return None
 
-def extract_age_by_partial_name(people_list, search_name):
-    """Extract age by partial name match"""
+def extract_age_by_partial_name(people_list, search_name, index=None):
+    """Extract age by partial name match (index: PeopleIndex for people_list)"""
+    if index is not None:
+        return index.get(index.substring(search_name))
     matches = []
     for person in people_list:
         name = person.get('name', '').lower()
@@ -76,23 +95,33 @@ def extract_age_by_partial_name(people_list, search_name):
             matches.append(person)
     return matches
 
-def extract_age_by_range(people_list, age_range):
-    """Extract people within age range"""
-    min_age, max_age = age_range
-    matches = []
-    
-    for person in people_list:
-        try:
-            age = int(person.get('age', 0))
-            if min_age <= age <= max_age:
-                matches.append(person)
-        except ValueError:
-            continue  # Skip invalid ages
+def extract_age_by_name_prefix(people_list, prefix, index=None):
+    """Extract people whose name starts with prefix"""
+    if index is None:
+        index = index_for_people(people_list)
+    return index.get(index.prefix(prefix))
+
+def extract_age_by_range(people_list, age_range, index=None):
+    """Extract people within age range (people with invalid ages are skipped)
     
-    return matches
+    index: AgeIndex for people_list; ages are parsed once and the range is
+    found by binary search.
+    """
+    min_age, max_age = age_range
+    if index is None:
+        index = index_for_ages(people_list)
+    return index.get(index.range(min_age, max_age))
+
+def enrich_people(people):
+    """Categories and birth years for a whole list of people in one batch"""
+    return enrich_ages([person.get('age', 'Unknown') for person in people])
 
-def display_person_info(person):
-    """Display information for a single person"""
+def display_person_info(person, enriched=None, position=0):
+    """Display information for a single person (Person record or dictionary)
+    
+    enriched: result of enrich_people for the list the person came from,
+    with position their place in that list (computed here if not given).
+    """
     name = person.get('name', 'Unknown')
     age = person.get('age', 'Unknown')
     city = person.get('city', 'Unknown')
@@ -102,129 +131,140 @@ def display_person_info(person):
     print(f"  City: {city}")
     
     # Age analysis
-    try:
-        age_num = int(age)
-        if age_num >= 65:
-            category = "Senior"
-        elif age_num >= 18:
-            category = "Adult"
-        else:
-            category = "Minor"
-        print(f"  Category: {category}")
-        
-        birth_year = 2025 - age_num
-        print(f"  Birth Year: ~{birth_year}")
-    except ValueError:
+    if enriched is None:
+        enriched, position = enrich_people([person]), 0
+    if enriched.valid[position]:
+        print(f"  Category: {enriched.category(position)}")
+        print(f"  Birth Year: ~{enriched.birth_year(position)}")
+    else:
         print(f"  Category: Unknown (invalid age)")
 
-def main():
-    """Main function"""
-    
-    # Step 1: Get user input
-    search_type, search_value = get_user_input_for_search()
+def load_session(session):
+    """Load the session's file (creating sample data if it is missing)
     
-    # Step 2: Load or create JSON data
+    The file is only parsed again if it changed since the last search.
+    Returns False if the data cannot be used.
+    """
     try:
-        with open('multi_person_data.json', 'r') as file:
-            data = json.load(file)
-        print(f"\n✓ Loaded data from multi_person_data.json")
+        if session.load():
+            print(f"\n✓ Loaded data from {session.filename}")
     except FileNotFoundError:
-        print(f"\n✗ multi_person_data.json not found. Creating sample data...")
-        data = create_sample_multi_person_data()
-    except json.JSONDecodeError:
+        # Sample data is a JSON document, so only .json files are created
+        if is_columnar_file(session.filename) or is_jsonl_file(session.filename):
+            print(f"\n✗ {session.filename} not found!")
+            return False
+        print(f"\n✗ {session.filename} not found. Creating sample data...")
+        create_sample_multi_person_data(session.filename)
+        session.load()
+    except ValueError:
         print(f"\n✗ Invalid JSON format!")
-        return
-    
-    # Step 3: Extract people list
-    if 'people' in data:
-        people_list = data['people']
-    else:
-        # Handle single person format or list format
-        if isinstance(data, list):
-            people_list = data
-        else:
-            people_list = [data]  # Single person
+        return False
+    return True
+
+def run_search(session, search_type, search_value):
+    """Answer one search from the session's indexes (or columnar store) and statistics"""
+    total = session.count()
     
-    print(f"\nTotal people in database: {len(people_list)}")
+    print(f"\nTotal people in database: {total}")
     
-    # Step 4: Process based on search type
+    # Process based on search type
     print(f"\n" + "="*50)
     print("AGE EXTRACTION RESULTS")
     print("="*50)
     
     if search_type == "exact":
-        result = extract_age_by_exact_name(people_list, search_value)
-        if result:
+        matches = session.find_exact(search_value)
+        if matches:
             print(f"Found exact match for '{search_value}':")
-            display_person_info(result)
+            display_person_info(matches[0])
         else:
             print(f"✗ No exact match found for '{search_value}'")
             print("Available names:")
-            for person in people_list:
-                print(f"  - {person.get('name', 'Unknown')}")
+            for name in session.sample_names(MAX_LISTED_NAMES):
+                print(f"  - {name}")
+            if total > MAX_LISTED_NAMES:
+                print(f"  ... and {total - MAX_LISTED_NAMES} more")
     
     elif search_type == "partial":
-        results = extract_age_by_partial_name(people_list, search_value)
+        results = session.find_partial(search_value)
         if results:
             print(f"Found {len(results)} partial match(es) for '{search_value}':")
+            enriched = enrich_people(results)
             for i, person in enumerate(results, 1):
                 print(f"\n{i}. Match:")
-                display_person_info(person)
+                display_person_info(person, enriched, i - 1)
         else:
             print(f"✗ No partial matches found for '{search_value}'")
     
+    elif search_type == "prefix":
+        results = session.find_prefix(search_value)
+        if results:
+            print(f"Found {len(results)} name(s) starting with '{search_value}':")
+            enriched = enrich_people(results)
+            for i, person in enumerate(results, 1):
+                print(f"\n{i}. Match:")
+                display_person_info(person, enriched, i - 1)
+        else:
+            print(f"✗ No names start with '{search_value}'")
+    
     elif search_type == "range":
         min_age, max_age = search_value
-        results = extract_age_by_range(people_list, search_value)
+        results = session.find_age_range(min_age, max_age)
+        invalid = session.invalid_age_count()
+        if invalid:
+            print(f"({invalid} people with invalid ages were skipped)")
         if results:
             print(f"Found {len(results)} people aged {min_age}-{max_age}:")
+            enriched = enrich_people(results)
             for i, person in enumerate(results, 1):
                 print(f"\n{i}. Person:")
-                display_person_info(person)
+                display_person_info(person, enriched, i - 1)
         else:
             print(f"✗ No people found in age range {min_age}-{max_age}")
     
     elif search_type == "all":
         print(f"All people in database:")
+        people_list = session.all_people()
+        enriched = enrich_people(people_list)
         for i, person in enumerate(people_list, 1):
             print(f"\n{i}. Person:")
-            display_person_info(person)
+            display_person_info(person, enriched, i - 1)
     
-    # Step 5: Statistics
+    # Statistics
     print(f"\n" + "-"*50)
     print("DATABASE STATISTICS")
     print("-"*50)
     
-    ages = []
-    for person in people_list:
-        try:
-            age = int(person.get('age', 0))
-            ages.append(age)
-        except ValueError:
-            continue
+    # Computed once per session (and again only if the file changes)
+    for line in session.statistics.format():
+        print(line)
+
+def main(argv=None):
+    """Main function: one session, searched until the user stops"""
+    parser = argparse.ArgumentParser(description="Search people by name or age")
+    parser.add_argument("--data", default="multi_person_data.json",
+                        help="people .json/.jsonl, or .parquet/.arrow from people_store.py "
+                             "(default: multi_person_data.json)")
+    args = parser.parse_args(argv)
+    session = AgeSession(args.data)
     
-    if ages:
-        print(f"Total people with valid ages: {len(ages)}")
-        print(f"Average age: {sum(ages) / len(ages):.1f}")
-        print(f"Youngest: {min(ages)}")
-        print(f"Oldest: {max(ages)}")
+    while True:
+        # Step 1: Get user input
+        search_type, search_value = get_user_input_for_search()
         
-        # Age categories
-        seniors = sum(1 for age in ages if age >= 65)
-        adults = sum(1 for age in ages if 18 <= age < 65)
-        minors = sum(1 for age in ages if age < 18)
+        # Step 2: Load or create JSON data (reused while the file is unchanged)
+        if not load_session(session):
+            return
         
-        print(f"Seniors (65+): {seniors}")
-        print(f"Adults (18-64): {adults}")
-        print(f"Minors (<18): {minors}")
-    
-    # Step 6: Ask if user wants to try again
-    print(f"\n" + "-"*50)
-    try_again = input("Search again? (y/n): ").strip().lower()
-    if try_again == 'y':
-        main()  # Restart
-    else:
-        print("Thank you for using the Multi-Person Age Extractor!")
+        # Step 3: Search and show statistics
+        run_search(session, search_type, search_value)
+        
+        # Step 4: Ask if user wants to try again
+        print(f"\n" + "-"*50)
+        try_again = input("Search again? (y/n): ").strip().lower()
+        if try_again != 'y':
+            print("Thank you for using the Multi-Person Age Extractor!")
+            break
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+People Dataset Generator
+Generates any number of synthetic people (name, age, city, email) in the
+format of multi_person_data.json, streamed to JSON, JSON Lines or Parquet
+Date: October 18, 2025
+
+Examples:
+    py people_generator.py 1000000                          # multi_person_data.json
+    py people_generator.py 100000000 people.jsonl --workers 8
+    py people_generator.py 10000000 people.parquet --seed 42
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from json_serializer import dumps_bytes
+from jsonl_reader import is_jsonl_file
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+DEFAULT_BLOCK_SIZE = 100_000
+CREATED_DATE = "2025-10-18"
+
+FIRST_NAMES = ["James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+               "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+               "Thomas", "Sarah", "Charles", "Karen", "Daniel", "Emma", "Matthew", "Olivia",
+               "Anthony", "Sophia", "Mark", "Ava", "Steven", "Mia", "Andrew", "Isabella",
+               "Joshua", "Emily", "Kevin", "Grace", "Brian", "Chloe", "George", "mk"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+              "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+              "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson",
+              "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson"]
+# City -> population in thousands, used as sampling weights
+CITIES = {"New York": 8336, "Los Angeles": 3822, "Chicago": 2665, "Houston": 2302,
+          "Phoenix": 1644, "Philadelphia": 1567, "San Antonio": 1472, "San Diego": 1381,
+          "Dallas": 1299, "San Jose": 983, "Austin": 974, "Jacksonville": 954,
+          "Seattle": 749, "Denver": 713, "Boston": 650, "hihus": 12}
+EMAIL_DOMAINS = {"example.com": 50, "mail.com": 25, "inbox.org": 15, "company.net": 10}
+MAX_AGE = 100
+
+def _zipf_weights(count: int, exponent: float = 0.8) -> np.ndarray:
+    """Popular names first: weight ~ 1 / rank^exponent"""
+    weights = 1.0 / np.arange(1, count + 1) ** exponent
+    return weights / weights.sum()
+
+def _age_weights() -> np.ndarray:
+    """Roughly flat population up to 60, then thinning out towards 100"""
+    ages = np.arange(MAX_AGE + 1)
+    weights = np.where(ages < 60, 1.0, np.clip(1.0 - (ages - 60) / 42, 0.02, None))
+    return weights / weights.sum()
+
+def _normalized(weights: Dict[str, int]) -> np.ndarray:
+    values = np.array(list(weights.values()), dtype=float)
+    return values / values.sum()
+
+FIRST_WEIGHTS = _zipf_weights(len(FIRST_NAMES))
+LAST_WEIGHTS = _zipf_weights(len(LAST_NAMES))
+AGE_WEIGHTS = _age_weights()
+CITY_NAMES = list(CITIES)
+CITY_WEIGHTS = _normalized(CITIES)
+DOMAIN_NAMES = list(EMAIL_DOMAINS)
+DOMAIN_WEIGHTS = _normalized(EMAIL_DOMAINS)
+
+# (seed, block number, first person id, number of people)
+Block = Tuple[int, int, int, int]
+
+def plan_blocks(count: int, seed: int = 0, block_size: int = DEFAULT_BLOCK_SIZE) -> List[Block]:
+    """Split count people into fixed-size blocks
+
+    Each block has its own random stream derived from (seed, block number),
+    so the output is the same however many processes generate it.
+    """
+    return [(seed, number, start, min(block_size, count - start))
+            for number, start in enumerate(range(0, count, block_size))]
+
+def generate_columns(block: Block) -> Dict[str, Any]:
+    """One block of people as columns: codes/arrays plus the built strings"""
+    seed, number, start, size = block
+    rng = np.random.default_rng([seed, number])
+    first = rng.choice(len(FIRST_NAMES), size=size, p=FIRST_WEIGHTS)
+    last = rng.choice(len(LAST_NAMES), size=size, p=LAST_WEIGHTS)
+    ages = rng.choice(MAX_AGE + 1, size=size, p=AGE_WEIGHTS).astype(np.int16)
+    cities = rng.choice(len(CITY_NAMES), size=size, p=CITY_WEIGHTS).astype(np.int32)
+    domains = rng.choice(len(DOMAIN_NAMES), size=size, p=DOMAIN_WEIGHTS)
+
+    lower_first = [name.lower() for name in FIRST_NAMES]
+    lower_last = [name.lower() for name in LAST_NAMES]
+    names = [f"{FIRST_NAMES[f]} {LAST_NAMES[l]}" for f, l in zip(first.tolist(), last.tolist())]
+    emails = [f"{lower_first[f]}.{lower_last[l]}{person_id}@{DOMAIN_NAMES[d]}"
+              for f, l, d, person_id in zip(first.tolist(), last.tolist(), domains.tolist(),
+                                             range(start, start + size))]
+    return {"name": names, "age": ages, "city": cities, "email": emails}
+
+def generate_people(block: Block) -> List[Dict[str, str]]:
+    """One block of people as dictionaries shaped like multi_person_data.json"""
+    columns = generate_columns(block)
+    return [{"name": name, "age": str(age), "city": CITY_NAMES[city], "email": email}
+            for name, age, city, email in zip(columns["name"], columns["age"].tolist(),
+                                              columns["city"].tolist(), columns["email"])]
+
+def encode_block(block: Block) -> bytes:
+    """One block as comma-separated compact JSON objects (no brackets)"""
+    return b",".join(dumps_bytes(person, compact=True) for person in generate_people(block))
+
+def encode_jsonl_block(block: Block) -> bytes:
+    """One block as JSON Lines"""
+    return b"".join(dumps_bytes(person, compact=True) + b"\n" for person in generate_people(block))
+
+def arrow_block(block: Block) -> 'pa.Table':
+    """One block as an Arrow table (typed age, dictionary-encoded city)"""
+    columns = generate_columns(block)
+    return pa.table({
+        "name": pa.array(columns["name"], type=pa.string()),
+        "age": pa.array(columns["age"], type=pa.int16()),
+        "city": pa.DictionaryArray.from_arrays(pa.array(columns["city"], type=pa.int32()),
+                                               pa.array(CITY_NAMES, type=pa.string())),
+        "email": pa.array(columns["email"], type=pa.string()),
+    })
+
+def _produce(func, blocks: List[Block], workers: int) -> Iterator[Any]:
+    """func(block) for every block, in order, with at most workers*2 blocks in flight"""
+    if workers == 1 or len(blocks) <= 1:
+        yield from map(func, blocks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque(blocks)
+        in_flight = deque()
+        while pending or in_flight:
+            while pending and len(in_flight) < workers * 2:
+                in_flight.append(executor.submit(func, pending.popleft()))
+            yield in_flight.popleft().result()
+
+def write_people(filename: str, count: int, seed: int = 0, workers: Optional[int] = None,
+                 block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+    """Generate count people into filename (.json, .jsonl/.ndjson or .parquet)
+
+    Only a few blocks are in memory at any time, whatever the count.
+    """
+    blocks = plan_blocks(count, seed, block_size)
+    workers = workers or os.cpu_count() or 1
+
+    if filename.lower().endswith('.parquet'):
+        if pa is None:
+            raise ValueError("Parquet output needs the pyarrow package (pip install pyarrow)")
+        schema = arrow_block((seed, 0, 0, 0)).schema
+        with pq.ParquetWriter(filename, schema) as writer:
+            for table in _produce(arrow_block, blocks, workers):
+                writer.write_table(table)
+        return
+
+    with open(filename, 'wb') as file:
+        if is_jsonl_file(filename):
+            for chunk in _produce(encode_jsonl_block, blocks, workers):
+                file.write(chunk)
+            return
+
+        file.write(b'{"people":[')
+        for number, chunk in enumerate(_produce(encode_block, blocks, workers)):
+            if number and chunk:
+                file.write(b',')
+            file.write(chunk)
+        metadata = {"total_people": count, "created_date": CREATED_DATE, "seed": seed}
+        file.write(b'],"metadata":' + dumps_bytes(metadata, compact=True) + b'}')
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Generate a people dataset from the command line"""
+    parser = argparse.ArgumentParser(description="Generate a synthetic people dataset")
+    parser.add_argument("count", type=int, help="number of people")
+    parser.add_argument("output", nargs="?", default="multi_person_data.json",
+                        help=".json, .jsonl/.ndjson or .parquet (default: multi_person_data.json)")
+    parser.add_argument("--seed", type=int, default=0, help="same seed, same people")
+    parser.add_argument("--workers", "-w", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE,
+                        help="people per block; changing it changes the output")
+    args = parser.parse_args(argv)
+
+    print("People Dataset Generator")
+    print("="*40)
+    if args.count < 0 or args.block_size < 1:
+        print("✗ Error: count must be >= 0 and block size >= 1")
+        return 1
+
+    start = time.perf_counter()
+    try:
+        write_people(args.output, args.count, args.seed, args.workers, args.block_size)
+    except (OSError, ValueError) as e:
+        print(f"✗ Error: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+    size_mb = os.path.getsize(args.output) / (1024 * 1024)
+    print(f"✓ Wrote {args.count:,} people to {args.output} ({size_mb:.1f} MB) in {elapsed:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+People Name Index
+Answers exact, prefix and substring name searches over a list of people
+without rescanning or re-lowercasing every name on each query
+Date: October 18, 2025
+"""
+
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+from person_record import is_person
+
+NGRAM = 3
+
+def normalize_name(name: Any) -> str:
+    """Case-insensitive form of a name (casefold also handles e.g. 'ß' vs 'SS')
+
+    A missing (None) name is '', as for a Person record, so it is never
+    found by searching for "none".
+    """
+    return '' if name is None else str(name).casefold()
+
+def _array_type(size: int) -> str:
+    """Smallest unsigned array typecode holding positions and ids below size"""
+    return 'I' if size < 2 ** 32 else 'Q'
+
+class PeopleIndex:
+    """Name lookup tables built once per loaded list of people
+
+    Every method returns positions into the original list, in list order.
+    Distinct names are stored once, so datasets with many repeated names
+    stay small:
+
+    - exact      casefolded name -> name id (hash map)
+    - prefix     distinct names in sorted order (binary search)
+    - substring  3-gram -> ids of the names containing it; queries shorter
+                 than 3 characters scan the distinct names instead
+    Positions per name id are kept in one flat array (CSR layout) of
+    4-byte integers, or 8-byte ones for lists of 2**32 items or more.
+    Items that are not dictionaries or Person records are never matched.
+    """
+
+    def __init__(self, people: Sequence[Any]) -> None:
+        start = time.perf_counter()
+        self.people = people
+        self.source_length = len(people)
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        typecode = _array_type(len(people) + 1)
+
+        # Pass 1: give every distinct casefolded name an id
+        person_positions = array(typecode)
+        person_ids = array(typecode)
+        for position, person in enumerate(people):
+            if not is_person(person):
+                continue
+            key = normalize_name(person.get('name', ''))
+            name_id = self._ids.get(key)
+            if name_id is None:
+                name_id = self._ids[key] = len(self._names)
+                self._names.append(key)
+            person_positions.append(position)
+            person_ids.append(name_id)
+
+        # Pass 2: group positions by name id (counting sort keeps list order)
+        counts = array(typecode, bytes(person_ids.itemsize * (len(self._names) + 1)))
+        for name_id in person_ids:
+            counts[name_id + 1] += 1
+        for i in range(1, len(counts)):
+            counts[i] += counts[i - 1]
+        self._starts = counts
+        self._positions = array(typecode, bytes(person_ids.itemsize * len(person_ids)))
+        cursor = array(typecode, counts)
+        for position, name_id in zip(person_positions, person_ids):
+            self._positions[cursor[name_id]] = position
+            cursor[name_id] += 1
+
+        self._sorted_ids = array(typecode, sorted(range(len(self._names)), key=self._names.__getitem__))
+        self._sorted_names = [self._names[name_id] for name_id in self._sorted_ids]
+
+        self._grams: Dict[str, array] = {}
+        for name_id, key in enumerate(self._names):
+            for gram in {key[i:i + NGRAM] for i in range(len(key) - NGRAM + 1)}:
+                ids = self._grams.get(gram)
+                if ids is None:
+                    self._grams[gram] = array(typecode, [name_id])
+                else:
+                    ids.append(name_id)
+
+        self.build_seconds = time.perf_counter() - start
+        self.memory_bytes = self._measure()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __repr__(self) -> str:
+        return (f"PeopleIndex({len(self)} people, {len(self._names)} distinct names, "
+                f"built in {self.build_seconds:.4f}s, {self.memory_bytes / 1024:.1f} KB)")
+
+    def _measure(self) -> int:
+        """Approximate bytes held by the index"""
+        total = sum(sys.getsizeof(part) for part in
+                    (self._ids, self._names, self._starts, self._positions,
+                     self._sorted_ids, self._sorted_names, self._grams))
+        total += sum(sys.getsizeof(name) for name in self._names)
+        total += sum(sys.getsizeof(gram) + sys.getsizeof(ids) for gram, ids in self._grams.items())
+        return total
+
+    def _expand(self, name_ids: List[int]) -> List[int]:
+        """Positions of everyone with one of these names, in list order"""
+        if len(name_ids) == 1:
+            name_id = name_ids[0]
+            return list(self._positions[self._starts[name_id]:self._starts[name_id + 1]])
+        positions: List[int] = []
+        for name_id in name_ids:
+            positions.extend(self._positions[self._starts[name_id]:self._starts[name_id + 1]])
+        positions.sort()
+        return positions
+
+    def exact(self, name: str) -> List[int]:
+        """Positions whose name equals name, ignoring case"""
+        name_id = self._ids.get(normalize_name(name))
+        return [] if name_id is None else self._expand([name_id])
+
+    def prefix(self, text: str) -> List[int]:
+        """Positions whose name starts with text, ignoring case"""
+        text = normalize_name(text)
+        name_ids = []
+        i = bisect_left(self._sorted_names, text)
+        while i < len(self._sorted_names) and self._sorted_names[i].startswith(text):
+            name_ids.append(self._sorted_ids[i])
+            i += 1
+        return self._expand(name_ids)
+
+    def substring(self, text: str) -> List[int]:
+        """Positions whose name contains text, ignoring case"""
+        text = normalize_name(text)
+        if len(text) < NGRAM:
+            candidates: Sequence[int] = range(len(self._names))
+        else:
+            grams = {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+            postings = [self._grams.get(gram) for gram in grams]
+            if any(ids is None for ids in postings):
+                return []
+            # Every match contains all the grams, so the rarest one bounds the work
+            candidates = min(postings, key=len)
+        return self._expand([name_id for name_id in candidates if text in self._names[name_id]])
+
+    def contained_in(self, text: str) -> List[int]:
+        """Positions whose whole name appears somewhere inside text, ignoring case"""
+        text = normalize_name(text)
+        name_ids = {self._ids[part] for part in
+                    {text[i:j] for i in range(len(text) + 1) for j in range(i, len(text) + 1)}
+                    if part in self._ids}
+        return self._expand(list(name_ids))
+
+    def get(self, positions: List[int]) -> List[Dict[str, Any]]:
+        """The people at the given positions"""
+        return [self.people[position] for position in positions]
+
+def people_from_data(data: Any) -> List[Any]:
+    """The people in a loaded document: data['people'], a list, or a single person"""
+    if isinstance(data, dict) and isinstance(data.get('people'), list):
+        return data['people']
+    if isinstance(data, list):
+        return data
+    return [data]
+
+_last_index: Optional[PeopleIndex] = None
+
+def index_for_people(people: Sequence[Any]) -> PeopleIndex:
+    """Index for this list of people, reusing the previous one if it is the same list
+
+    The shared document cache returns the same list for an unchanged file,
+    so repeated searches on one file only build the index once.
+    """
+    global _last_index
+    if (_last_index is None or _last_index.people is not people
+            or _last_index.source_length != len(people)):
+        _last_index = PeopleIndex(people)
+    return _last_index
+
+def main():
+    """Index a synthetic list of people and time a few lookups"""
+    from benchmark import generate_document
+
+    print("People Name Index")
+    print("="*40)
+
+    people = generate_document(100_000)["people"]
+    index = PeopleIndex(people)
+    print(f"✓ {index}")
+    for method, text in [("exact", "JOHN SMITH"), ("prefix", "sarah"),
+                         ("substring", "ia ga"), ("contained_in", "mk ultra")]:
+        start = time.perf_counter()
+        positions = getattr(index, method)(text)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{method}({text!r}): {len(positions)} people in {elapsed:.3f} ms")
+
+if __name__ == "__main__":
+    main()
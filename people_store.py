@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Columnar People Store
+Imports people JSON into a typed Parquet / Arrow file and answers the age
+tools' searches from it, reading only the columns and row groups needed
+Date: October 18, 2025
+
+Examples:
+    py people_store.py import multi_person_data.json people.parquet
+    py people_store.py import people.jsonl people.arrow
+"""
+
+import os
+import sys
+import time
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from age_stats import AgeStatistics
+from json_cache import load_cached
+from jsonl_reader import is_jsonl_file, iter_jsonl
+from people_index import people_from_data
+from person_record import MAX_AGE, MIN_AGE, Person, parse_age
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pc = ds = pq = None
+
+PARQUET_EXTENSIONS = ('.parquet',)
+ARROW_EXTENSIONS = ('.arrow', '.feather')
+DEFAULT_BATCH_SIZE = 100_000
+# What the age tools display; email is only read when asked for
+DISPLAY_COLUMNS = ['name', 'age', 'city']
+
+def is_columnar_file(filename: str) -> bool:
+    """True for .parquet / .arrow / .feather files"""
+    return filename.lower().endswith(PARQUET_EXTENSIONS + ARROW_EXTENSIONS)
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ValueError("Columnar people files need the pyarrow package (pip install pyarrow)")
+
+def people_schema() -> 'pa.Schema':
+    """name/email strings, int16 age (null when invalid, see parse_age), dictionary-encoded city"""
+    _require_pyarrow()
+    return pa.schema([("name", pa.string()), ("age", pa.int16()),
+                      ("city", pa.dictionary(pa.int32(), pa.string())), ("email", pa.string())])
+
+def _text(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+def people_table(people: List[Any], cities: Optional[Dict[str, int]] = None) -> 'pa.Table':
+    """Arrow table for a batch of people dictionaries (other items are skipped)
+
+    cities: city -> dictionary code, shared by every batch of one file. New
+    cities are appended, so earlier batches' codes stay valid; an Arrow IPC
+    file accepts such dictionary deltas but not a different dictionary
+    per batch.
+    """
+    if cities is None:
+        cities = {}
+    people = [person for person in people if isinstance(person, dict)]
+    # parse_age keeps every valid age inside int16; a missing age counts as 0, like AgeIndex
+    ages = [parse_age(person.get('age', 0)) for person in people]
+    codes = [None if city is None else cities.setdefault(city, len(cities))
+             for city in (_text(person.get('city')) for person in people)]
+    return pa.table({
+        "name": pa.array([_text(person.get('name')) for person in people], type=pa.string()),
+        "age": pa.array(ages, type=pa.int16()),
+        "city": pa.DictionaryArray.from_arrays(pa.array(codes, type=pa.int32()),
+                                               pa.array(list(cities), type=pa.string())),
+        "email": pa.array([_text(person.get('email')) for person in people], type=pa.string()),
+    }, schema=people_schema())
+
+def _iter_people(source: str) -> Iterable[Any]:
+    if is_jsonl_file(source):
+        return iter_jsonl(source)
+    return people_from_data(load_cached(source))
+
+def import_people(source: str, target: str, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Convert a people JSON / JSON Lines file to .parquet or .arrow; returns the row count
+
+    JSON Lines sources are streamed; every batch becomes one row group, so
+    age range queries can skip whole groups using their min/max statistics.
+    If the import fails, the partly written target is removed.
+    """
+    _require_pyarrow()
+    if not is_columnar_file(target):
+        raise ValueError(f"Target '{target}' must end in .parquet, .arrow or .feather")
+
+    people = iter(_iter_people(source))
+    schema = people_schema()
+    cities: Dict[str, int] = {}
+    rows = 0
+    if target.lower().endswith(PARQUET_EXTENSIONS):
+        writer = pq.ParquetWriter(target, schema)
+    else:
+        writer = pa.ipc.new_file(target, schema,
+                                 options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True))
+    try:
+        try:
+            while True:
+                batch = list(islice(people, batch_size))
+                if not batch:
+                    break
+                table = people_table(batch, cities)
+                writer.write_table(table)
+                rows += table.num_rows
+        finally:
+            writer.close()
+    except BaseException:
+        if os.path.exists(target):
+            os.remove(target)
+        raise
+    return rows
+
+def name_equals(name: str) -> 'ds.Expression':
+    """Scan condition: name equals name, ignoring case"""
+    return pc.utf8_lower(ds.field('name')) == name.lower()
+
+def name_contains(text: str) -> 'ds.Expression':
+    """Scan condition: name contains text, ignoring case"""
+    return pc.match_substring(ds.field('name'), text, ignore_case=True)
+
+def name_starts_with(text: str) -> 'ds.Expression':
+    """Scan condition: name starts with text, ignoring case"""
+    return pc.starts_with(ds.field('name'), text, ignore_case=True)
+
+def age_between(min_age: int, max_age: int) -> 'ds.Expression':
+    """Scan condition: age in min_age..max_age inclusive"""
+    age = ds.field('age')
+    return (age >= min_age) & (age <= max_age)
+
+class PeopleStore:
+    """Searches over a columnar people file without loading all of it
+
+    Every query names the columns it needs (projection) and passes its
+    condition to the scanner (predicate pushdown), so only those columns
+    are decoded and Parquet row groups that cannot match are skipped.
+    Results are lists of dictionaries like the JSON people records, or
+    Person records from records().
+    """
+
+    def __init__(self, filename: str) -> None:
+        _require_pyarrow()
+        self.filename = filename
+        file_format = 'parquet' if filename.lower().endswith(PARQUET_EXTENSIONS) else 'ipc'
+        self.dataset = ds.dataset(filename, format=file_format)
+
+    def __len__(self) -> int:
+        return self.dataset.count_rows()
+
+    def __repr__(self) -> str:
+        return f"PeopleStore('{self.filename}', {len(self)} people)"
+
+    def query(self, condition: Optional['ds.Expression'] = None,
+              columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Rows matching condition, with only the given columns (default DISPLAY_COLUMNS)"""
+        table = self.dataset.to_table(columns=columns or DISPLAY_COLUMNS, filter=condition)
+        return table.to_pylist()
+
+    def records(self, condition: Optional['ds.Expression'] = None) -> List[Person]:
+        """Rows matching condition as Person records, built straight from the columns"""
+        table = self.dataset.to_table(columns=DISPLAY_COLUMNS, filter=condition)
+        return [Person(name or '', age, city) for name, age, city in
+                zip(*(table.column(column).to_pylist() for column in DISPLAY_COLUMNS))]
+
+    def exact(self, name: str, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """People whose name equals name, ignoring case"""
+        return self.query(name_equals(name), columns)
+
+    def partial(self, text: str, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """People whose name contains text, ignoring case"""
+        return self.query(name_contains(text), columns)
+
+    def prefix(self, text: str, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """People whose name starts with text, ignoring case"""
+        return self.query(name_starts_with(text), columns)
+
+    def age_range(self, min_age: int, max_age: int,
+                  columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """People aged min_age..max_age inclusive"""
+        return self.query(age_between(min_age, max_age), columns)
+
+    def names(self, limit: int) -> List[str]:
+        """The first limit names (reads only as much of the name column as needed)"""
+        return self.dataset.head(limit, columns=['name']).column('name').to_pylist()
+
+    def invalid_ages(self) -> int:
+        """People whose age was not a number when imported"""
+        return self.dataset.count_rows(filter=ds.field('age').is_null())
+
+    def ages(self) -> np.ndarray:
+        """All valid ages, reading only the age column"""
+        column = self.dataset.to_table(columns=['age'], filter=ds.field('age').is_valid()).column('age')
+        return column.to_numpy().astype(np.int64)
+
+    def statistics(self) -> AgeStatistics:
+        """Age statistics from the age column alone"""
+        return AgeStatistics.from_ages(self.ages(), self.invalid_ages())
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Import a people file, or summarize an already imported one"""
+    argv = sys.argv[1:] if argv is None else argv
+    print("Columnar People Store")
+    print("="*40)
+
+    if len(argv) == 3 and argv[0] == "import":
+        source, target = argv[1], argv[2]
+        start = time.perf_counter()
+        try:
+            rows = import_people(source, target)
+        except FileNotFoundError:
+            print(f"✗ Error: File '{source}' not found!")
+            return 1
+        except ValueError as e:
+            print(f"✗ Error: {e}")
+            return 1
+        size_mb = os.path.getsize(target) / (1024 * 1024)
+        print(f"✓ Imported {rows:,} people into {target} ({size_mb:.1f} MB) "
+              f"in {time.perf_counter() - start:.2f}s")
+        invalid = PeopleStore(target).invalid_ages()
+        if invalid:
+            print(f"  {invalid:,} people have an invalid age (not a number or outside "
+                  f"{MIN_AGE}-{MAX_AGE}) and are stored without one")
+        return 0
+
+    if len(argv) == 1:
+        try:
+            store = PeopleStore(argv[0])
+        except (FileNotFoundError, ValueError) as e:
+            print(f"✗ Error: {e}")
+            return 1
+        print(f"✓ {store}")
+        for line in store.statistics().format():
+            print(line)
+        return 0
+
+    print("Usage: py people_store.py import <people.json|.jsonl> <people.parquet|.arrow>")
+    print("       py people_store.py <people.parquet|.arrow>")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
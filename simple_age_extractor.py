@@ -2,9 +2,24 @@
 """
 Simple Age Extractor with User Input
 Asks user for input and extracts age from JSON
+
+Bulk mode looks up a whole file of names in one pass:
+    py simple_age_extractor.py --names names.txt --data people.json -o ages.csv
 """
 
+import argparse
+import csv
 import json
+import time
+
+from age_enrichment import enrich_ages
+from age_session import AgeSession
+from json_cache import load_cached
+from json_serializer import dumps
+from jsonl_reader import is_jsonl_file
+from name_matcher import match_names
+from people_index import index_for_people, people_from_data
+from person_record import Person, is_person
 
 def get_user_input():
     """Get user input for person's name"""
@@ -20,8 +35,12 @@ def get_user_input():
     
     return person_name
 
-def extract_age_by_name(data, search_name):
-    """Extract age for a specific person by name"""
+def extract_age_by_name(data, search_name, index=None):
+    """Extract age for a specific person by name
+    
+    A name matches if either one contains the other, ignoring case.
+    For a list of people the lookup goes through a PeopleIndex.
+    """
     
     if isinstance(data, dict):
         # Single person data
@@ -31,11 +50,11 @@ def extract_age_by_name(data, search_name):
     
     elif isinstance(data, list):
         # Multiple people data
-        for person in data:
-            if isinstance(person, dict):
-                stored_name = person.get('name', '').lower()
-                if search_name.lower() in stored_name or stored_name in search_name.lower():
-                    return person.get('age')
+        if index is None:
+            index = index_for_people(data)
+        matches = index.substring(search_name) + index.contained_in(search_name)
+        if matches:
+            return data[min(matches)].get('age')
     
     return None
 
@@ -47,34 +66,108 @@ def extract_any_age(data):
     
     elif isinstance(data, list):
         for person in data:
-            if isinstance(person, dict) and 'age' in person:
+            if is_person(person) and 'age' in person:
                 return person['age'], person.get('name', 'Unknown')
     
     return None, None
 
-def main():
-    """Main function"""
+def print_age_analysis(age, show_birth_year=False):
+    """Print the numeric age, its category and optionally the birth year"""
+    enriched = enrich_ages([age])
+    if not enriched.valid[0]:
+        print(f"Age '{age}' is not a valid number")
+        return
+    print(f"Age as number: {enriched.age(0)}")
+    print(f"Age category: {enriched.category(0)}")
+    if show_birth_year:
+        print(f"Approximate birth year: {enriched.birth_year(0)}")
+
+def read_names_file(filename):
+    """Names to look up, one per line (blank lines are skipped)"""
+    with open(filename, 'r', encoding='utf-8') as file:
+        return [line.strip() for line in file if line.strip()]
+
+def bulk_extract_ages(data, names):
+    """Look up every name in one pass over the data; one result row per name
+    
+    Uses the same matching rule as extract_age_by_name (either name
+    contains the other, ignoring case, first person wins).
+    """
+    people = people_from_data(data)
+    positions = match_names(people, names)
+    ages = [people[position].get('age') if position is not None else None
+            for position in positions]
+    enriched = enrich_ages(ages)
+    
+    rows = []
+    for i, (name, position) in enumerate(zip(names, positions)):
+        found = position is not None
+        rows.append({
+            'query': name,
+            'name': people[position].get('name') if found else None,
+            'age': ages[i],
+            'category': enriched.category(i) if found else None,
+            'birth_year': enriched.birth_year(i) if found else None,
+        })
+    return rows
+
+def write_bulk_results(rows, filename):
+    """Write result rows as CSV (.csv) or JSON Lines (.jsonl / .ndjson)"""
+    if is_jsonl_file(filename):
+        with open(filename, 'w', encoding='utf-8') as file:
+            for row in rows:
+                file.write(dumps(row, compact=True) + "\n")
+    elif filename.lower().endswith('.csv'):
+        with open(filename, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=['query', 'name', 'age', 'category', 'birth_year'])
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        raise ValueError(f"Output file '{filename}' must end in .csv, .jsonl or .ndjson")
+
+def run_bulk_lookup(names_file, data_file, output):
+    """Bulk mode: resolve every name in names_file and write the results"""
+    print("BULK AGE EXTRACTION")
+    print("="*30)
     
-    # Step 1: Get user input
-    search_name = get_user_input()
+    if not (is_jsonl_file(output) or output.lower().endswith('.csv')):
+        print(f"✗ Output file '{output}' must end in .csv, .jsonl or .ndjson")
+        return
     
-    # Step 2: Load JSON data
     try:
-        with open('sample.json', 'r') as file:
-            data = json.load(file)
-        print(f"\n✓ Loaded data from sample.json")
-    except FileNotFoundError:
-        print("\n✗ sample.json not found!")
+        names = read_names_file(names_file)
+        data = load_cached(data_file)
+    except FileNotFoundError as e:
+        print(f"✗ File not found: {e.filename}")
         return
-    except json.JSONDecodeError:
-        print("\n✗ Invalid JSON format!")
+    except ValueError:
+        print(f"✗ Invalid JSON format in '{data_file}'!")
         return
     
-    # Step 3: Display original data
-    print(f"\nOriginal JSON data:")
-    print(json.dumps(data, indent=2))
+    start = time.perf_counter()
+    rows = bulk_extract_ages(data, names)
+    elapsed = time.perf_counter() - start
+    found = sum(1 for row in rows if row['name'] is not None)
+    print(f"✓ Matched {found} of {len(rows)} names in {elapsed:.2f}s")
     
-    # Step 4: Extract age based on user input
+    try:
+        write_bulk_results(rows, output)
+    except (OSError, ValueError) as e:
+        print(f"✗ Error saving results: {e}")
+        return
+    print(f"✓ Results saved to: {output}")
+
+def build_arg_parser():
+    """Command line options; without --names the interactive tool starts"""
+    parser = argparse.ArgumentParser(description="Simple Age Extractor")
+    parser.add_argument("--names", help="Text file of names to look up, one per line (bulk mode)")
+    parser.add_argument("--data", default="sample.json", help="JSON / JSON Lines file of people (default: sample.json)")
+    parser.add_argument("--output", "-o", default="name_ages.csv",
+                        help="Bulk results file, .csv or .jsonl (default: name_ages.csv)")
+    return parser
+
+def show_age_results(data, search_name, index=None):
+    """Extract and display the age for one search (index: PeopleIndex for list data)"""
     print(f"\n" + "="*40)
     print("AGE EXTRACTION RESULTS")
     print("="*40)
@@ -82,29 +175,13 @@ def main():
     if search_name:
         # Search for specific person
         print(f"Searching for: {search_name}")
-        age = extract_age_by_name(data, search_name)
+        age = extract_age_by_name(data, search_name, index)
         
         if age:
             print(f"✓ Found age for {search_name}: {age}")
             
             # Additional analysis
-            try:
-                age_num = int(age)
-                print(f"Age as number: {age_num}")
-                
-                if age_num >= 65:
-                    category = "Senior"
-                elif age_num >= 18:
-                    category = "Adult"
-                else:
-                    category = "Minor"
-                
-                print(f"Age category: {category}")
-                birth_year = 2025 - age_num
-                print(f"Approximate birth year: {birth_year}")
-                
-            except ValueError:
-                print(f"Age '{age}' is not a valid number")
+            print_age_analysis(age, show_birth_year=True)
         else:
             print(f"✗ No age found for {search_name}")
             print("Extracting any available age...")
@@ -124,31 +201,50 @@ def main():
             print(f"Found age for {name}: {age}")
             
             # Additional analysis
-            try:
-                age_num = int(age)
-                print(f"Age as number: {age_num}")
-                
-                if age_num >= 65:
-                    category = "Senior"
-                elif age_num >= 18:
-                    category = "Adult"
-                else:
-                    category = "Minor"
-                
-                print(f"Age category: {category}")
-                
-            except ValueError:
-                print(f"Age '{age}' is not a valid number")
+            print_age_analysis(age)
         else:
             print("No age information found in the data")
+
+def main(argv=None):
+    """Main function"""
+    args = build_arg_parser().parse_args(argv)
+    if args.names:
+        run_bulk_lookup(args.names, args.data, args.output)
+        return
     
-    # Step 5: Ask if user wants to try again
-    print(f"\n" + "-"*40)
-    try_again = input("Try with another name? (y/n): ").strip().lower()
-    if try_again == 'y':
-        main()  # Restart the process
-    else:
-        print("Thank you for using the Age Extractor!")
+    # The loaded data and its name index are kept for every search
+    session = AgeSession(args.data)
+    
+    while True:
+        # Step 1: Get user input
+        search_name = get_user_input()
+        
+        # Step 2: Load JSON data (parsed again only if the file changed)
+        try:
+            changed = session.load()
+        except FileNotFoundError:
+            print(f"\n✗ {session.filename} not found!")
+            return
+        except ValueError:
+            print("\n✗ Invalid JSON format!")
+            return
+        
+        # Step 3: Display original data when it is new
+        if changed:
+            print(f"\n✓ Loaded data from {session.filename}")
+            print(f"\nOriginal JSON data:")
+            print(json.dumps(session.data, indent=2, default=Person.to_dict))
+        
+        # Step 4: Extract age based on user input
+        index = session.name_index if isinstance(session.data, list) else None
+        show_age_results(session.data, search_name, index)
+        
+        # Step 5: Ask if user wants to try again
+        print(f"\n" + "-"*40)
+        try_again = input("Try with another name? (y/n): ").strip().lower()
+        if try_again != 'y':
+            print("Thank you for using the Age Extractor!")
+            break
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,6 +6,8 @@ Demonstrates extracting specific information from the sample.json file
 
 import json
 
+from json_serializer import save_json
+
 def extract_from_sample_json():
     """Extract specific information from sample.json"""
     
@@ -54,8 +56,7 @@ def extract_from_sample_json():
         print(json.dumps(filtered_data, indent=2))
         
         # Save filtered data to a new file
-        with open('filtered_info.json', 'w') as file:
-            json.dump(filtered_data, file, indent=2)
+        save_json(filtered_data, 'filtered_info.json')
         
         print("\nFiltered data saved to 'filtered_info.json'")
         
@@ -94,8 +95,7 @@ def extract_from_sample_json():
         print(json.dumps(summary, indent=2))
         
         # Save summary
-        with open('summary_report.json', 'w') as file:
-            json.dump(summary, file, indent=2)
+        save_json(summary, 'summary_report.json')
         
         print("Summary report saved to 'summary_report.json'")
         
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Temperature Aggregation Engine
+Computes every metric of the temperature analysis and its exports in one
+pass over the columns, into a results object they all read from. Files of
+any size can be analyzed chunk by chunk with mergeable running aggregates
+Date: October 18, 2025
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from csv_schema import TEMPERATURE_SCHEMA, iter_typed_csv, read_typed_csv
+
+# Columns summarized by mean, min and max
+STAT_COLUMNS = ['High_Temp_F', 'Low_Temp_F', 'Avg_Temp_F', 'Humidity_%', 'Temp_Range_F']
+HOT_DAY_F = 75            # High_Temp_F >= this
+HIGH_HUMIDITY = 80        # Humidity_% > this
+LARGE_RANGE_F = 20        # Temp_Range_F > this
+RAINY = 'Rainy'
+DEFAULT_CHUNK_ROWS = 1_000_000
+HEAD_ROWS = 5
+
+def _scalar(value: Any) -> Any:
+    """NumPy scalar -> Python int/float and midnight Timestamp -> date, so values print as in the CSV"""
+    if isinstance(value, pd.Timestamp) and value == value.normalize():
+        return value.date()
+    return value.item() if isinstance(value, np.generic) else value
+
+class TemperatureAnalysis:
+    """Results of one analysis pass over temperature readings
+
+    Per column of STAT_COLUMNS: mean, std, min and max. Plus the hottest and
+    coldest rows, condition counts, threshold counts and, for in-memory
+    data, the hot_mask / humid_mask row selections used by the exports.
+    """
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.columns: List[str] = []
+        self.first_date: Any = None
+        self.last_date: Any = None
+        self.mean: Dict[str, float] = {}
+        self.std: Dict[str, float] = {}
+        self.min: Dict[str, Any] = {}
+        self.max: Dict[str, Any] = {}
+        self.hottest: Dict[str, Any] = {}
+        self.coldest: Dict[str, Any] = {}
+        self.condition_counts: Dict[str, int] = {}
+        self.hot_days = 0
+        self.high_humidity_days = 0
+        self.high_humidity_avg_temp: Optional[float] = None
+        self.large_range_days = 0
+        self.rainy_days = 0
+        self.hot_mask: Optional[np.ndarray] = None
+        self.humid_mask: Optional[np.ndarray] = None
+
+    def __repr__(self) -> str:
+        return f"TemperatureAnalysis({self.rows} rows, {self.first_date} to {self.last_date})"
+
+    @property
+    def most_common_condition(self) -> Optional[str]:
+        """Same as Condition.mode().iloc[0]: the most frequent, alphabetically first on ties"""
+        if not self.condition_counts:
+            return None
+        top = max(self.condition_counts.values())
+        return min(name for name, count in self.condition_counts.items() if count == top)
+
+    def condition_summary(self) -> List[Tuple[str, int, float]]:
+        """(condition, days, percentage), most frequent first"""
+        return [(name, count, count / self.rows * 100) for name, count in self.condition_counts.items()]
+
+    def summary_rows(self) -> List[Tuple[str, str]]:
+        """(Metric, Value) rows of temperature_summary.csv"""
+        return [
+            ('Average High Temperature (°F)', f"{self.mean['High_Temp_F']:.1f}"),
+            ('Average Low Temperature (°F)', f"{self.mean['Low_Temp_F']:.1f}"),
+            ('Highest Temperature (°F)', f"{self.max['High_Temp_F']}"),
+            ('Lowest Temperature (°F)', f"{self.min['Low_Temp_F']}"),
+            ('Average Humidity (%)', f"{self.mean['Humidity_%']:.1f}"),
+            ('Days with High Humidity (>80%)', f"{self.high_humidity_days}"),
+            ('Most Common Weather Condition', f"{self.most_common_condition}"),
+            ('Temperature Range Average (°F)', f"{self.mean['Temp_Range_F']:.1f}"),
+        ]
+
+    def summary_frame(self) -> pd.DataFrame:
+        rows = self.summary_rows()
+        return pd.DataFrame({'Metric': [metric for metric, _ in rows],
+                             'Value': [value for _, value in rows]})
+
+class RunningStats:
+    """Count, mean, variance, min and max of a stream of values
+
+    Each batch is reduced with NumPy and folded in with the parallel form
+    of Welford's update (Chan et al.), so merging two RunningStats gives
+    the same result as one pass over all their values.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0          # sum of squared differences from the mean
+        self.min: Any = None
+        self.max: Any = None
+
+    def update(self, values: np.ndarray) -> 'RunningStats':
+        if len(values):
+            batch = RunningStats()
+            batch.count = len(values)
+            # float64 accumulators, also for the float32 / int16 columns
+            batch.mean = float(values.mean(dtype=np.float64))
+            batch.m2 = float(np.square(values - batch.mean, dtype=np.float64).sum())
+            batch.min = _scalar(values.min())
+            batch.max = _scalar(values.max())
+            self.merge(batch)
+        return self
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """Fold other into this one (in place) and return self"""
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1, like pandas)"""
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+def _row(df: pd.DataFrame, position: int, columns: List[str]) -> Dict[str, Any]:
+    return {column: _scalar(df[column].iat[position]) for column in columns}
+
+class TemperatureAccumulator:
+    """Mergeable running aggregates behind a TemperatureAnalysis
+
+    Feed chunks of readings in file order with update(); accumulators of
+    consecutive parts of a file can be combined with merge(), earlier part
+    first (that order decides the date range and ties for hottest/coldest).
+    """
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.columns: List[str] = []
+        self.first_date: Any = None
+        self.last_date: Any = None
+        self.stats = {column: RunningStats() for column in STAT_COLUMNS}
+        self.hottest: Dict[str, Any] = {}
+        self.coldest: Dict[str, Any] = {}
+        self.condition_counts: Dict[str, int] = {}
+        self.hot_days = 0
+        self.large_range_days = 0
+        self.humid = RunningStats()     # Avg_Temp_F on high humidity days
+
+    def update(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Add one chunk; returns its (hot_mask, humid_mask) for filtered exports"""
+        arrays = {column: df[column].to_numpy() for column in STAT_COLUMNS}
+        hot_mask = arrays['High_Temp_F'] >= HOT_DAY_F
+        humid_mask = arrays['Humidity_%'] > HIGH_HUMIDITY
+        if not len(df):
+            return hot_mask, humid_mask
+
+        if not self.rows:
+            self.columns = list(df.columns)
+            self.first_date = _scalar(df['Date'].iat[0])
+        self.last_date = _scalar(df['Date'].iat[-1])
+        self.rows += len(df)
+
+        for column, values in arrays.items():
+            self.stats[column].update(values)
+
+        # argmax/argmin return the first occurrence, like idxmax/idxmin;
+        # a later chunk only wins with a strictly hotter/colder day
+        position = int(arrays['High_Temp_F'].argmax())
+        if not self.hottest or arrays['High_Temp_F'][position] > self.hottest['High_Temp_F']:
+            self.hottest = _row(df, position, ['Date', 'High_Temp_F', 'Condition'])
+        position = int(arrays['Low_Temp_F'].argmin())
+        if not self.coldest or arrays['Low_Temp_F'][position] < self.coldest['Low_Temp_F']:
+            self.coldest = _row(df, position, ['Date', 'Low_Temp_F', 'Condition'])
+
+        # Added in order of first appearance, so tied counts rank the same
+        # however the file is split into chunks
+        counts = df['Condition'].value_counts()
+        for name in df['Condition'].dropna().unique():
+            self.condition_counts[str(name)] = self.condition_counts.get(str(name), 0) + int(counts[name])
+
+        self.hot_days += int(hot_mask.sum())
+        self.large_range_days += int((arrays['Temp_Range_F'] > LARGE_RANGE_F).sum())
+        self.humid.update(arrays['Avg_Temp_F'][humid_mask])
+        return hot_mask, humid_mask
+
+    def merge(self, other: 'TemperatureAccumulator') -> 'TemperatureAccumulator':
+        """Fold in the aggregates of the part of the data that follows this one"""
+        if not other.rows:
+            return self
+        if not self.rows:
+            self.columns, self.first_date = other.columns, other.first_date
+        self.last_date = other.last_date
+        self.rows += other.rows
+        for column in STAT_COLUMNS:
+            self.stats[column].merge(other.stats[column])
+        if not self.hottest or other.hottest['High_Temp_F'] > self.hottest['High_Temp_F']:
+            self.hottest = other.hottest
+        if not self.coldest or other.coldest['Low_Temp_F'] < self.coldest['Low_Temp_F']:
+            self.coldest = other.coldest
+        for name, count in other.condition_counts.items():
+            self.condition_counts[name] = self.condition_counts.get(name, 0) + count
+        self.hot_days += other.hot_days
+        self.large_range_days += other.large_range_days
+        self.humid.merge(other.humid)
+        return self
+
+    def result(self) -> TemperatureAnalysis:
+        result = TemperatureAnalysis()
+        result.rows, result.columns = self.rows, self.columns
+        result.first_date, result.last_date = self.first_date, self.last_date
+        if not self.rows:
+            return result
+        for column, stats in self.stats.items():
+            result.mean[column] = stats.mean
+            result.std[column] = stats.std
+            result.min[column] = stats.min
+            result.max[column] = stats.max
+        result.hottest, result.coldest = self.hottest, self.coldest
+        # Most frequent first; ties keep the order they were first seen in
+        result.condition_counts = dict(sorted(self.condition_counts.items(), key=lambda item: -item[1]))
+        result.rainy_days = result.condition_counts.get(RAINY, 0)
+        result.hot_days = self.hot_days
+        result.high_humidity_days = self.humid.count
+        if self.humid.count:
+            result.high_humidity_avg_temp = self.humid.mean
+        result.large_range_days = self.large_range_days
+        return result
+
+def analyze_temperatures(df: pd.DataFrame) -> TemperatureAnalysis:
+    """Every metric of the analysis and exports, reading each column once
+
+    Each column is pulled out as one NumPy array and reduced in place;
+    the threshold masks are built once and shared by the counts, the
+    high-humidity average and the filtered exports.
+    """
+    accumulator = TemperatureAccumulator()
+    hot_mask, humid_mask = accumulator.update(df)
+    result = accumulator.result()
+    result.columns = list(df.columns)
+    result.hot_mask, result.humid_mask = hot_mask, humid_mask
+    return result
+
+class _CSVAppender:
+    """Writes filtered chunks to one CSV file, created with its header on the first non-empty chunk"""
+
+    def __init__(self, filename: Optional[str]) -> None:
+        self.filename = filename
+        self.file = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self.filename is None or not len(df):
+            return
+        if self.file is None:
+            self.file = open(self.filename, 'w', newline='', encoding='utf-8')
+            df.to_csv(self.file, index=False)
+        else:
+            df.to_csv(self.file, index=False, header=False)
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+
+def analyze_chunks(chunks: Iterable[pd.DataFrame], hot_output: Optional[str] = None,
+                   humid_output: Optional[str] = None) -> Tuple[TemperatureAnalysis, Optional[pd.DataFrame]]:
+    """Analyze readings chunk by chunk, streaming the filtered exports
+
+    Memory stays at one chunk whatever the total size. hot_output /
+    humid_output receive the hot and high-humidity rows (files are only
+    created if there are any). Returns (results, first HEAD_ROWS rows).
+    """
+    accumulator = TemperatureAccumulator()
+    hot_file, humid_file = _CSVAppender(hot_output), _CSVAppender(humid_output)
+    head = None
+    try:
+        for df in chunks:
+            if head is None:
+                head = df.head(HEAD_ROWS)
+            elif len(head) < HEAD_ROWS:
+                head = pd.concat([head, df.head(HEAD_ROWS - len(head))])
+            hot_mask, humid_mask = accumulator.update(df)
+            hot_file.write(df[hot_mask])
+            humid_file.write(df[humid_mask])
+    finally:
+        hot_file.close()
+        humid_file.close()
+    return accumulator.result(), head
+
+def analyze_temperature_file(filename: str, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                             hot_output: Optional[str] = None,
+                             humid_output: Optional[str] = None) -> Tuple[TemperatureAnalysis, Optional[pd.DataFrame]]:
+    """analyze_chunks over a CSV file read chunk_rows rows at a time, typed by TEMPERATURE_SCHEMA"""
+    return analyze_chunks(iter_typed_csv(filename, TEMPERATURE_SCHEMA, chunk_rows),
+                          hot_output, humid_output)
+
+def main():
+    """Analyze temperature_data.csv and show the results object"""
+    print("Temperature Aggregation Engine")
+    print("="*40)
+    try:
+        df = read_typed_csv('temperature_data.csv', TEMPERATURE_SCHEMA)
+    except FileNotFoundError:
+        print("✗ temperature_data.csv not found. Please run generate_temperature_data.py first.")
+        return
+    result = analyze_temperatures(df)
+    print(f"✓ {result}")
+    for metric, value in result.summary_rows():
+        print(f"  {metric}: {value}")
+
+if __name__ == "__main__":
+    main()
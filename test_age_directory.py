@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for directory age extraction and its per-file failure report
+"""
+
+import json
+
+import pytest
+
+import age_directory
+from age_directory import extract_directory, main
+
+PEOPLE = [{"name": "Ann Smith", "age": "34"}, {"name": "Bo", "age": 70}, {"name": "Cy"}]
+
+@pytest.fixture
+def directory(tmp_path):
+    (tmp_path / 'a_people.json').write_text(json.dumps({"people": PEOPLE}), encoding='utf-8')
+    (tmp_path / 'b_lines.jsonl').write_text("".join(json.dumps(person) + "\n" for person in PEOPLE),
+                                            encoding='utf-8')
+    (tmp_path / 'c_broken.json').write_text('{"people": [', encoding='utf-8')
+    (tmp_path / 'd_binary.json').write_bytes(b'\xff\xfe{}')
+    (tmp_path / 'e_single.json').write_text(json.dumps({"name": "Di Smith", "age": 5}), encoding='utf-8')
+    (tmp_path / 'notes.txt').write_text("not JSON", encoding='utf-8')
+    return tmp_path
+
+def test_failed_files_are_reported_and_the_rest_processed(directory):
+    report = extract_directory(str(directory), use_threads=True)
+    files = {entry['file']: entry for entry in report['files']}
+    assert list(files) == ['a_people.json', 'b_lines.jsonl', 'c_broken.json', 'd_binary.json',
+                           'e_single.json']
+    assert [files[name]['people'] for name in files] == [2, 2, 0, 0, 1]
+    assert files['c_broken.json']['error'].startswith("Invalid JSON format")
+    assert files['d_binary.json']['error'].startswith("Invalid JSON format")
+    assert not any('error' in files[name] for name in ('a_people.json', 'b_lines.jsonl', 'e_single.json'))
+    assert report['summary'] == {**report['summary'], 'files': 5, 'failed_files': 2, 'people': 5}
+    assert [record['source_file'] for record in report['extracted_age_info']] == [
+        'a_people.json', 'a_people.json', 'b_lines.jsonl', 'b_lines.jsonl', 'e_single.json']
+
+def test_unexpected_errors_do_not_abort_the_run(directory, monkeypatch):
+    extract_ages = age_directory.extract_ages
+    read_bytes = age_directory._read_bytes
+
+    def failing_extract(data, person_name=None):
+        if isinstance(data, dict) and data.get('name') == "Di Smith":
+            raise TypeError("unexpected shape")
+        return extract_ages(data, person_name)
+
+    def failing_read(filename):
+        if filename.endswith('b_lines.jsonl'):
+            raise PermissionError(13, "Permission denied", filename)
+        return read_bytes(filename)
+
+    monkeypatch.setattr(age_directory, 'extract_ages', failing_extract)
+    monkeypatch.setattr(age_directory, '_read_bytes', failing_read)
+    report = extract_directory(str(directory), use_threads=True)
+    files = {entry['file']: entry for entry in report['files']}
+    assert files['e_single.json']['error'] == "TypeError: unexpected shape"
+    assert "Permission denied" in files['b_lines.jsonl']['error']
+    assert files['a_people.json']['people'] == 2
+    assert report['summary']['failed_files'] == 4
+
+def test_worker_failures_are_reported(directory, monkeypatch):
+    def broken_worker(raw, filename, person_name=None):
+        raise RuntimeError("worker died")
+
+    monkeypatch.setattr(age_directory, 'extract_file_ages', broken_worker)
+    report = extract_directory(str(directory), use_threads=True)
+    assert {entry['error'] for entry in report['files']} == {"RuntimeError: worker died"}
+
+def test_name_filter_and_report_file(directory, monkeypatch):
+    monkeypatch.chdir(directory)
+    assert main(['.', '--name', 'SMITH', '--threads']) == 0
+    report = json.loads((directory / 'extracted_age.json').read_text(encoding='utf-8'))
+    assert [record['name'] for record in report['extracted_age_info']] == ['Ann Smith', 'Ann Smith', 'Di Smith']
+    # Running again must not read the previous report as input
+    assert main(['.', '--threads']) == 0
+    report = json.loads((directory / 'extracted_age.json').read_text(encoding='utf-8'))
+    assert report['summary']['files'] == 5
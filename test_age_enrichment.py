@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized age categories and birth years
+"""
+
+import numpy as np
+import pytest
+
+from age_enrichment import REFERENCE_YEAR, enrich_ages
+
+VALUES = ["89", "45", "17", 32, "18", 65, "64", "0", "unknown", None, "99999999999999999999", -3, 151]
+
+def loop_category(value):
+    """Reference: the per-person categorization of the original age tools"""
+    try:
+        age = int(value)
+    except (TypeError, ValueError):
+        return "Unknown", None
+    if not 0 <= age <= 150:
+        return "Unknown", None
+    if age >= 65:
+        return "Senior", REFERENCE_YEAR - age
+    if age >= 18:
+        return "Adult", REFERENCE_YEAR - age
+    return "Minor", REFERENCE_YEAR - age
+
+def test_categories_and_birth_years_match_loop():
+    enriched = enrich_ages(VALUES)
+    result = [(enriched.category(i), enriched.birth_year(i)) for i in range(len(VALUES))]
+    assert result == [loop_category(value) for value in VALUES]
+    assert enriched.category_counts() == {"Minor": 2, "Adult": 4, "Senior": 2, "Unknown": 5}
+
+def test_integer_arrays_are_bounded_like_raw_values():
+    ages = np.array([17, 2 ** 62, -1, 150], dtype=np.int64)
+    enriched = enrich_ages(ages)
+    assert [enriched.category(i) for i in range(len(ages))] == ["Minor", "Unknown", "Unknown", "Senior"]
+    assert [enriched.age(i) for i in range(len(ages))] == [17, None, None, 150]
+
+def test_invalid_category_setup_raises():
+    with pytest.raises(ValueError):
+        enrich_ages([1], edges=(18, 65), names=("Minor", "Adult"))
+    with pytest.raises(ValueError):
+        enrich_ages([1], edges=(65, 18))
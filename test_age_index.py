@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Tests for the sorted age index and age parsing
+"""
+
+import pytest
+
+from age_index import AgeIndex
+from person_record import MAX_AGE, parse_age, to_people
+
+PEOPLE = [
+    {"name": "Ann", "age": "34"},
+    {"name": "Bob", "age": 67},
+    {"name": "Cy", "age": "old"},
+    {"name": "Di"},
+    {"name": "Ed", "age": "99999999999999999999"},
+    {"name": "Flo", "age": -3},
+    {"name": "Gus", "age": 34.9},
+    {"name": "Hal", "age": [1]},
+    "not a person",
+    {"name": "Ivy", "age": str(MAX_AGE)},
+]
+
+def loop_range(people, min_age, max_age):
+    """Reference: the original per-person scan"""
+    found = []
+    for person in people:
+        if isinstance(person, dict):
+            age = parse_age(person.get('age', 0))
+            if age is not None and min_age <= age <= max_age:
+                found.append(person)
+    return found
+
+@pytest.mark.parametrize("value, expected", [
+    ("34", 34), (34.9, 34), ("0", 0), (MAX_AGE, MAX_AGE), (MAX_AGE + 1, None), (-1, None),
+    ("99999999999999999999", None), (float('inf'), None), ("old", None), (None, None), ([1], None),
+])
+def test_parse_age(value, expected):
+    assert parse_age(value) == expected
+
+@pytest.mark.parametrize("min_age, max_age", [(0, 150), (30, 40), (34, 34), (68, 200), (-10, 10**30)])
+@pytest.mark.parametrize("records", [False, True])
+def test_range_matches_loop(min_age, max_age, records):
+    people = to_people(PEOPLE) if records else PEOPLE
+    index = AgeIndex(people)
+    expected = loop_range(PEOPLE, min_age, max_age)
+    found = index.get(index.range(min_age, max_age))
+    assert [person.get('name') for person in found] == [person['name'] for person in expected]
+
+def test_huge_and_negative_ages_are_invalid():
+    index = AgeIndex(PEOPLE)
+    assert sorted(index.invalid.tolist()) == [2, 4, 5, 7, 8]
+    assert index.ages.max() == MAX_AGE
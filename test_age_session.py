@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the age tool session's change detection
+"""
+
+import json
+import os
+
+import pytest
+
+from age_session import AgeSession
+
+PEOPLE = [
+    {"name": "Ann", "age": 34, "city": "Oslo", "email": "ann@example.com"},
+    {"name": "Bob", "age": "41", "city": "Oslo"},
+    {"name": "Cy", "age": "old", "team": "red"},
+    {"name": "Di"},
+    {"age": 7},
+]
+
+def write_people(path, people, shift_ns=0):
+    """Write a people file, moving its modification time by shift_ns"""
+    path.write_text(json.dumps({"people": people}), encoding='utf-8')
+    if shift_ns:
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + shift_ns))
+
+def test_load_only_when_the_file_changes(tmp_path):
+    path = tmp_path / 'people.json'
+    write_people(path, PEOPLE)
+    session = AgeSession(str(path))
+    assert session.load() is True
+    assert session.load() is False
+    assert [person.name for person in session.find_exact('ann')] == ["Ann"]
+
+    write_people(path, PEOPLE + [{"name": "Ann", "age": 60}], shift_ns=10 ** 9)
+    assert session.load() is True
+    assert session.count() == len(PEOPLE) + 1
+    assert [person.age for person in session.find_exact('ann')] == [34, 60]
+    assert session.load() is False
+
+def test_same_size_rewrite_is_detected(tmp_path):
+    path = tmp_path / 'people.json'
+    write_people(path, [{"name": "Ann", "age": 34}])
+    session = AgeSession(str(path))
+    session.load()
+    assert session.find_age_range(30, 40)
+
+    # Same length, only the modification time tells the versions apart
+    write_people(path, [{"name": "Ann", "age": 54}], shift_ns=10 ** 9)
+    assert session.load() is True
+    assert not session.find_age_range(30, 40)
+    assert session.find_age_range(50, 60)
+
+def test_missing_file_raises(tmp_path):
+    session = AgeSession(str(tmp_path / 'missing.json'))
+    assert not session.exists()
+    with pytest.raises(FileNotFoundError):
+        session.load()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized age statistics against the original loop
+"""
+
+import numpy as np
+import pytest
+
+from age_stats import AgeStatistics, stream_age_statistics
+from person_record import parse_age, to_people
+
+PEOPLE = [{"name": f"p{i}", "age": str(age)} for i, age in
+          enumerate([5, 17, 18, 34, 34, 64, 65, 89, 120, 0])]
+PEOPLE += [{"name": "huge", "age": "99999999999999999999"}, {"name": "bad", "age": "old"},
+           {"name": "negative", "age": -4}, {"name": "missing"}, "not a person"]
+
+def loop_statistics(people):
+    """Reference: the DATABASE STATISTICS loop of multi_person_age_extractor"""
+    ages = [age for age in (parse_age(person.get('age', 0)) for person in people
+                            if isinstance(person, dict)) if age is not None]
+    return {
+        "count": len(ages),
+        "mean": sum(ages) / len(ages),
+        "min": min(ages),
+        "max": max(ages),
+        "seniors": sum(1 for age in ages if age >= 65),
+        "adults": sum(1 for age in ages if 18 <= age < 65),
+        "minors": sum(1 for age in ages if age < 18),
+        "median": float(np.percentile(ages, 50)),
+    }
+
+@pytest.mark.parametrize("records", [False, True])
+def test_statistics_match_loop(records):
+    stats = AgeStatistics.from_people(to_people(PEOPLE) if records else PEOPLE)
+    expected = loop_statistics(PEOPLE)
+    assert (stats.count, stats.min, stats.max) == (expected["count"], expected["min"], expected["max"])
+    assert stats.mean == pytest.approx(expected["mean"])
+    assert stats.percentile(50) == expected["median"]
+    assert list(stats.categories().values()) == [expected["minors"], expected["adults"], expected["seniors"]]
+    # "huge", "bad", "negative" and the non-dictionary item
+    assert stats.invalid == 4
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 100])
+def test_merged_chunks_match_one_pass(chunk_size):
+    whole = AgeStatistics.from_people(PEOPLE)
+    merged = stream_age_statistics(iter(PEOPLE), chunk_size)
+    assert merged.to_dict() == whole.to_dict()
+
+def test_out_of_range_ages_in_arrays_are_invalid():
+    stats = AgeStatistics.from_ages(np.array([30, -1, 151, 30000], dtype=np.int16), invalid=2)
+    assert (stats.count, stats.invalid, stats.max) == (1, 5, 30)
+    assert AgeStatistics.from_ages([10 ** 30]).invalid == 1
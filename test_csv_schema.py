@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Tests for the typed CSV reads of the sales file
+"""
+
+import pytest
+
+from csv_schema import SALES_SCHEMA, default_engine, read_typed_csv
+
+SALES = "Product,Revenue\nLaptop,1200.5,note\nMouse\n\nDesk,300,a,b\n,4.25\nLamp,\n"
+
+@pytest.fixture
+def sales_file(tmp_path):
+    path = tmp_path / 'sales_revenue.csv'
+    path.write_text(SALES, encoding='utf-8')
+    return str(path)
+
+@pytest.mark.parametrize("engine", sorted({'c', default_engine()}))
+def test_sales_rows_keep_their_first_two_fields(sales_file, engine):
+    df = read_typed_csv(sales_file, SALES_SCHEMA, engine=engine)
+    assert list(df.columns) == ['Product', 'Revenue']
+    assert df['Revenue'].dtype == 'float64'
+    assert df['Product'].fillna('').tolist() == ['Laptop', 'Mouse', 'Desk', '', 'Lamp']
+    assert df['Revenue'].fillna(-1).tolist() == [1200.5, -1, 300.0, 4.25, -1]
+
+def test_read_csv_data_skips_rows_without_revenue(sales_file, capsys):
+    pytest.importorskip('matplotlib')
+    from csv_chart_generator import read_csv_data
+
+    assert read_csv_data(sales_file) == (['Laptop', 'Desk', ''], [1200.5, 300.0, 4.25])
+    assert "skipped 2 rows without a revenue" in capsys.readouterr().out
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for the temperature data generator
+"""
+
+import json
+
+import pandas as pd
+
+import generate_temperature_data as generator
+from generate_temperature_data import MANIFEST_NAME, generate_temperature_data, main, write_partitioned
+
+def test_small_dataset_is_written_as_printed(tmp_path, monkeypatch):
+    calls = []
+    original = generator.iter_temperature_chunks
+    monkeypatch.setattr(generator, 'iter_temperature_chunks',
+                        lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs))
+    output = str(tmp_path / 'temperature_data.csv')
+    df = main([output, '--days', '10', '--stations', '2', '--seed', '3'])
+    assert len(calls) == 1
+    saved = pd.read_csv(output)
+    assert len(saved) == 20 and saved['High_Temp_F'].tolist() == df['High_Temp_F'].tolist()
+
+def test_chunked_output_matches_one_frame(tmp_path):
+    df = generate_temperature_data(days=30, stations=3, seed=5)
+    output = str(tmp_path / 'big.csv')
+    assert generator.write_temperature_data(output, days=30, stations=3, seed=5, chunk_rows=7) == 90
+    saved = pd.read_csv(output)
+    assert saved['Low_Temp_F'].tolist() == df['Low_Temp_F'].tolist()
+
+def test_manifest_records_the_workers_used(tmp_path):
+    manifest = write_partitioned(str(tmp_path / 'one'), days=5, stations=3, seed=1, workers=8,
+                                 partition_stations=10, file_format='csv')
+    assert manifest['workers'] == 1 and len(manifest['partitions']) == 1
+    manifest = write_partitioned(str(tmp_path / 'two'), days=5, stations=3, seed=1, workers=8,
+                                 partition_stations=2, file_format='csv')
+    assert manifest['workers'] == 2
+    with open(tmp_path / 'two' / MANIFEST_NAME, encoding='utf-8') as file:
+        assert json.load(file)['rows'] == 15
+    # The files do not depend on the partition layout or the worker count
+    one = pd.read_csv(tmp_path / 'one' / 'part-00000.csv')
+    two = pd.concat([pd.read_csv(tmp_path / 'two' / name) for name in ('part-00000.csv', 'part-00001.csv')],
+                    ignore_index=True)
+    assert one.equals(two)
+
+def test_partitions_are_identical_for_any_worker_count(tmp_path):
+    manifests = [write_partitioned(str(tmp_path / f'w{workers}'), days=40, stations=7, seed=9,
+                                   workers=workers, partition_stations=3, file_format='csv')
+                 for workers in (1, 3)]
+    names = [partition['file'] for partition in manifests[0]['partitions']]
+    assert names == ['part-00000.csv', 'part-00001.csv', 'part-00002.csv']
+    assert [partition['stations'] for partition in manifests[0]['partitions']] == [3, 3, 1]
+    for name in names:
+        assert (tmp_path / 'w1' / name).read_bytes() == (tmp_path / 'w3' / name).read_bytes()
+    assert manifests[0]['rows'] == manifests[1]['rows'] == 280
+
+    # Together the partitions hold exactly the single-file dataset
+    single = tmp_path / 'single.csv'
+    generator.write_temperature_data(str(single), days=40, stations=7, seed=9)
+    parts = pd.concat([pd.read_csv(tmp_path / 'w1' / name) for name in names], ignore_index=True)
+    assert parts.equals(pd.read_csv(single))
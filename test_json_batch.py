@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for json_extractor's non-interactive batch mode
+"""
+
+import json
+
+import pytest
+
+from json_extractor import main, run_batch, run_file_queries
+
+QUERIES = [("key", "name"), ("path", "people[*].age"), ("path", "people[0].name"), ("value", "34")]
+
+@pytest.fixture
+def files(tmp_path):
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'a.json').write_text(json.dumps(
+        {"name": "A", "people": [{"name": "Ann", "age": 34}, {"name": "Bo", "age": "34"}]}), encoding='utf-8')
+    (tmp_path / 'sub' / 'b.json').write_text(json.dumps({"name": "B", "people": []}), encoding='utf-8')
+    (tmp_path / 'c.jsonl').write_text('{"age": 34}\n{"age": 1}\n', encoding='utf-8')
+    (tmp_path / 'd_bad.json').write_text('{"name": ', encoding='utf-8')
+    return tmp_path
+
+def read_records(path):
+    return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+def test_file_queries(files):
+    record = run_file_queries((str(files / 'a.json'), QUERIES))
+    assert record["results"] == {"key:name": "A", "path:people[*].age": [34, "34"],
+                                 "path:people[0].name": "Ann", "value:34": ["people[0].age"]}
+    record = run_file_queries((str(files / 'c.jsonl'), QUERIES))
+    assert record["results"]["key:name"] is None and record["results"]["value:34"] == ["[0].age"]
+    assert "error" in run_file_queries((str(files / 'd_bad.json'), QUERIES))
+    assert "error" in run_file_queries((str(files / 'missing.json'), QUERIES))
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_batch_writes_one_record_per_file_in_order(files, workers):
+    output = files / f'out_{workers}.jsonl'
+    patterns = [str(files / '**' / '*.json'), str(files / '*.jsonl'), str(files / 'a.json')]
+    stats = run_batch(patterns, QUERIES, str(output), workers)
+    assert stats == {"files": 4, "errors": 1}
+    records = read_records(output)
+    assert [record["file"] for record in records] == sorted(
+        str(files / name) for name in ('a.json', 'sub/b.json', 'c.jsonl', 'd_bad.json'))
+    assert records == [run_file_queries((record["file"], QUERIES)) for record in records]
+
+def test_batch_command_line(files, capsys):
+    output = files / 'out.jsonl'
+    main(["batch", str(files / 'a.json'), "--path", "people[*].name", "--value", "Bo",
+          "-o", str(output), "-w", "1"])
+    assert read_records(output)[0]["results"] == {"path:people[*].name": ["Ann", "Bo"],
+                                                  "value:Bo": ["people[1].name"]}
+    main(["batch", str(files / 'a.json')])
+    assert "give at least one" in capsys.readouterr().err
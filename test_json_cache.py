@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for the parsed document cache
+"""
+
+import json
+import os
+
+from json_cache import MEMORY_PER_FILE_BYTE, DocumentCache
+
+def touch(path, document):
+    """Rewrite a file with a new modification time"""
+    path.write_text(json.dumps(document), encoding='utf-8')
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+def test_cache_hits_and_invalidates_on_change(tmp_path):
+    path = tmp_path / 'a.json'
+    touch(path, {"v": 1})
+    cache = DocumentCache()
+    first = cache.load(str(path))
+    assert cache.load(str(path)) is first
+    assert cache.stats()['hits'] == 1
+
+    touch(path, {"v": 2})
+    assert cache.load(str(path)) == {"v": 2}
+    assert cache.stats()['misses'] == 2
+
+    cache.invalidate(str(path))
+    assert len(cache) == 0 and cache.total_bytes == 0
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    paths = []
+    for name in 'abc':
+        paths.append(tmp_path / f'{name}.json')
+        touch(paths[-1], {"name": name})
+    size = os.path.getsize(paths[0]) * MEMORY_PER_FILE_BYTE
+    cache = DocumentCache(max_bytes=2 * size)
+    cache.load(str(paths[0]))
+    cache.load(str(paths[1]))
+    cache.load(str(paths[0]))        # a is now the most recent
+    cache.load(str(paths[2]))        # evicts b
+    assert cache.stats()['evictions'] == 1
+    hits = cache.hits
+    cache.load(str(paths[0]))
+    assert cache.hits == hits + 1
+    cache.load(str(paths[1]))
+    assert cache.misses == 4
+    assert cache.total_bytes <= cache.max_bytes
+
+def test_cache_skips_documents_larger_than_the_limit(tmp_path, capsys):
+    path = tmp_path / 'big.json'
+    touch(path, {"values": list(range(100))})
+    cache = DocumentCache(max_bytes=10)
+    assert cache.load(str(path)) == {"values": list(range(100))}
+    assert len(cache) == 0 and cache.total_bytes == 0
+    assert "is not cached" in capsys.readouterr().out
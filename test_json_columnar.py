@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the columnar record filters against the per-record loop
+"""
+
+import operator as op
+
+import pytest
+
+from json_columnar import ColumnarRecords
+
+RECORDS = [
+    {"name": "Alice", "age": 30, "score": 1.5, "active": True, "team": "red"},
+    {"name": "alex", "age": 25, "score": 2, "active": False},
+    {"name": None, "age": "30", "score": 3.5, "active": True, "team": "blue"},
+    "not a record",
+    {"name": "Bob", "age": 41, "active": False, "team": "red", "extra": [1]},
+    {"age": 30, "score": None, "team": "green"},
+    {"name": "Alan", "age": 2 ** 70, "score": 0.5, "active": True, "team": "red"},
+]
+
+COMPARE = {'<': op.lt, '<=': op.le, '>': op.gt, '>=': op.ge}
+
+def loop_filter(records, predicates):
+    """Reference: the per-record Python loop the columns replace"""
+    def matches(item, field, operator, value):
+        if not isinstance(item, dict) or field not in item:
+            return False
+        actual = item[field]
+        try:
+            if operator == '==':
+                return actual == value
+            if operator == '!=':
+                return actual != value
+            if operator == 'in':
+                return any(actual == candidate for candidate in value)
+            if operator == 'prefix':
+                return isinstance(actual, str) and isinstance(value, str) and actual.startswith(value)
+            if operator == 'between':
+                return value[0] <= actual <= value[1]
+            return COMPARE[operator](actual, value)
+        except TypeError:
+            return False
+    return [item for item in records
+            if all(matches(item, *predicate) for predicate in predicates)]
+
+@pytest.mark.parametrize("predicates", [
+    [('team', '==', 'red')],
+    [('team', '!=', 'red')],
+    [('team', 'in', {'red', 'green', 7})],
+    [('team', '<', 'green')],
+    [('team', '>=', 'green')],
+    [('name', 'prefix', 'Al')],
+    [('name', 'prefix', None)],
+    [('name', '==', None)],
+    [('age', '==', 30)],
+    [('age', 'between', (25, 41))],
+    [('score', '>', 1)],
+    [('score', 'between', (0.5, 2))],
+    [('active', '==', True)],
+    [('active', '==', 1)],
+    [('team', '==', 'red'), ('active', '==', False)],
+    [('missing', '==', 1)],
+])
+def test_columnar_filter_matches_loop(predicates):
+    table = ColumnarRecords.from_records(RECORDS)
+    result = table.filter(predicates)
+    assert result == loop_filter(RECORDS, predicates)
+    # Matches are the source records themselves, extra keys included
+    assert all(any(item is record for record in RECORDS) for item in result)
+
+def test_columnar_rows_line_up_with_the_source_list():
+    table = ColumnarRecords.from_records(RECORDS)
+    assert len(table) == len(RECORDS)
+    rows = table.where([('team', '==', 'red')]).tolist()
+    assert rows == [0, 4, 6]
+    assert list(table.rows(rows)) == [RECORDS[0], RECORDS[4], RECORDS[6]]
+
+def test_columnar_rejects_unknown_operator():
+    table = ColumnarRecords.from_records(RECORDS)
+    with pytest.raises(ValueError):
+        table.filter([('age', '~', 1)])
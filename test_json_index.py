@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for the inverted value index against the linear search_by_value walk
+"""
+
+import json
+
+import pytest
+
+from json_extractor import run_file_queries, search_by_value
+from json_index import ValueIndex
+from json_stream import StreamedJSON
+
+DOCUMENT = {
+    "name": "Ann",
+    "city": "Oslo",
+    "people": [
+        {"name": "Bo", "city": "Oslo", "tags": ["x", "y", "x"], "active": True, "score": 2.5},
+        {"name": "Ann", "city": None, "tags": [], "active": False, "score": 7},
+    ],
+    "matrix": [[10, 20], [30, [40.5, "deep"]]],
+}
+# Values that equal each other across types, where only the index tells them apart
+MIXED = {"int": 89, "str": "89", "float": 89.0, "true": True, "one": 1, "list": [1, 89]}
+
+def scalars(obj):
+    if isinstance(obj, dict):
+        obj = list(obj.values())
+    if isinstance(obj, list):
+        for item in obj:
+            yield from scalars(item)
+    else:
+        yield obj
+
+@pytest.mark.parametrize("value", list(scalars(DOCUMENT)), ids=repr)
+def test_lookup_matches_linear_search(value):
+    index = ValueIndex.build(DOCUMENT)
+    assert index.can_lookup(value)
+    assert search_by_value(DOCUMENT, value, index) == search_by_value(DOCUMENT, value)
+
+def test_lookup_of_missing_value_is_empty():
+    assert ValueIndex.build(DOCUMENT).lookup("nobody") == []
+
+def test_index_keeps_types_apart():
+    index = ValueIndex.build(MIXED)
+    assert search_by_value(MIXED, 89) == ['int', 'float', 'list[1]']
+    assert index.lookup(89) == ['int', 'list[1]']
+    assert index.lookup(89.0) == ['float']
+    assert index.lookup("89") == ['str']
+    assert index.lookup(True) == ['true']
+    assert index.lookup(1) == ['one', 'list[0]']
+
+def test_streamed_index_matches_built_index(tmp_path):
+    path = tmp_path / 'doc.json'
+    path.write_text(json.dumps(DOCUMENT), encoding='utf-8')
+    streamed = ValueIndex.from_stream(StreamedJSON(str(path), chunk_size=7))
+    built = ValueIndex.build(DOCUMENT)
+    for value in scalars(DOCUMENT):
+        assert streamed.lookup(value) == built.lookup(value)
+
+def test_batch_value_queries_use_the_typed_index(tmp_path):
+    path = tmp_path / 'mixed.json'
+    path.write_text(json.dumps(MIXED), encoding='utf-8')
+    record = run_file_queries((str(path), [("value", "89"), ("value", "true")]))
+    assert record["results"] == {"value:89": ['int', 'list[1]'], "value:true": ['true']}
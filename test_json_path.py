@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Tests for compiled JSON path queries
+"""
+
+import pytest
+
+from json_path import compile_path
+
+@pytest.mark.parametrize("path", ['a..', 'a.', 'a..b.', 'a[0', 'a]', 'a.[0]x', 'a[0]b', 'a[x]', '.a..'])
+def test_invalid_paths_raise_value_error(path):
+    with pytest.raises(ValueError):
+        compile_path(path)
+
+def test_path_evaluation():
+    data = {"users": [{"name": "a", "p": {"x": 1}}, {"name": "b", "p": {"x": 2}}],
+            "key.with.dots": 5}
+    assert compile_path('users[-1].name').get(data) == "b"
+    assert compile_path('users[*].p.x').evaluate(data) == [1, 2]
+    assert compile_path('..x').evaluate(data) == [1, 2]
+    assert compile_path('["key.with.dots"]').get(data) == 5
+    assert compile_path('users[9].name').get(data, 'none') == 'none'
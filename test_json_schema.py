@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for sampled JSON schema inference
+"""
+
+import random
+
+from json_schema import infer_schema, reservoir_sample
+
+DOCUMENT = {
+    "people": [
+        {"name": "Ann", "age": 34, "tags": ["a"]},
+        {"name": "Bo", "age": "old"},
+        {"name": "Cy", "age": None, "tags": []},
+    ],
+    "mixed": [1, "two", 3.0, [4]],
+    "meta": {"version": 2},
+}
+
+def test_types_and_optional_keys():
+    schema = infer_schema(DOCUMENT, time_budget=None)
+    people = schema.root.fields["people"]
+    assert (people.min_length, people.max_length, people.sampled_items) == (3, 3, 3)
+    person = people.items
+    assert person.types == {"dict": 3} and not person.is_optional("name")
+    assert person.is_optional("tags") and person.fields["tags"].count == 2
+    assert person.fields["age"].types == {"int": 1, "str": 1, "NoneType": 1}
+    assert schema.root.fields["mixed"].items.types == {"int": 1, "str": 1, "float": 1, "list": 1}
+    assert not schema.truncated
+
+def test_to_dict_and_format():
+    schema = infer_schema(DOCUMENT)
+    as_dict = schema.to_dict()
+    assert as_dict["schema"]["fields"]["people"]["items"]["fields"]["tags"]["optional"] is True
+    assert as_dict["nodes_visited"] == schema.nodes_visited
+    text = "\n".join(schema.format())
+    assert "tags: list (optional, 2/3)" in text
+    assert "age: int (1) | str (1) | NoneType (1)" in text
+
+def test_large_lists_are_sampled():
+    data = {"values": list(range(10_000))}
+    schema = infer_schema(data, sample_size=50)
+    values = schema.root.fields["values"]
+    assert (values.max_length, values.sampled_items, values.items.count) == (10_000, 50, 50)
+    assert schema.nodes_visited == 52
+
+def test_node_budget_truncates_the_deepest_levels():
+    data = {"a": [{"b": [{"c": 1}] * 10}] * 10}
+    schema = infer_schema(data, max_nodes=15)
+    assert schema.truncated and schema.nodes_visited == 15
+    assert "budget reached after 15 values" in schema.format()[-1]
+    # Breadth first: the top level is complete even though the budget ran out
+    assert schema.root.fields["a"].sampled_items == 10
+
+def test_reservoir_sample_is_uniform_and_ordered():
+    rng = random.Random(1)
+    assert reservoir_sample([1, 2, 3], 5, rng) == [1, 2, 3]
+    for items in (list(range(100)), iter(range(100))):
+        sample = reservoir_sample(items, 10, rng)
+        assert len(sample) == 10 and sample == sorted(sample) and len(set(sample)) == 10
+    counts = [0] * 20
+    for _ in range(4000):
+        for item in reservoir_sample(iter(range(20)), 5, rng):
+            counts[item] += 1
+    # Every item is picked about 4000 * 5 / 20 = 1000 times
+    assert all(850 < count < 1150 for count in counts)
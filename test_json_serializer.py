@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for the JSON serializer backends against json.dumps
+"""
+
+import json
+import math
+
+import pytest
+
+import json_serializer
+from json_extractor import save_extracted_data
+from json_serializer import JSONListWriter, dumps, dumps_bytes, save_json
+
+DATA = {
+    "name": "Zoë 😀 \x85  ",
+    "quote": "say \"hi\" \\ / \n",
+    "nested": [{"a": 1, "b": [True, False, None]}, [], {}],
+    "numbers": [0, -1, 2 ** 63 - 1, 0.5, -2.25],
+    "ünïcode kéy": "value",
+    "backslashes": ["\\é", "\\😀", "\\\\x\u0142", "ł"],
+}
+# A literal backslash before x or U must not be mistaken for an escape
+LITERAL_ESCAPES = {"text": ["\\xab é", "\\U0001f600 😀", "\\\\xab"]}
+FLOATS = [1e301, 1e-7, 1e16, 0.1, 123456789.0, -0.0]
+
+@pytest.fixture(params=json_serializer.available_backends())
+def backend(request):
+    previous = json_serializer.get_backend()
+    json_serializer.use_backend(request.param)
+    yield request.param
+    json_serializer.use_backend(previous)
+
+def stdlib(data, compact, ensure_ascii=True):
+    if compact:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=ensure_ascii)
+    return json.dumps(data, indent=2, ensure_ascii=ensure_ascii)
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+@pytest.mark.parametrize("data", [DATA, LITERAL_ESCAPES])
+def test_output_matches_json_dumps(backend, compact, ensure_ascii, data):
+    assert dumps(data, compact, ensure_ascii) == stdlib(data, compact, ensure_ascii)
+    assert dumps_bytes(data, compact, ensure_ascii).isascii() == ensure_ascii
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_floats_keep_their_value(backend, compact):
+    # The spelling may differ (1e301 / 1e+301), the parsed value may not
+    text = dumps(FLOATS, compact)
+    assert json.loads(text) == FLOATS
+    assert math.copysign(1, json.loads(text)[-1]) == -1
+
+def test_non_finite_floats_and_wide_integers(backend):
+    data = {"values": [float('nan'), float('inf'), -float('inf')], "id": 2 ** 70, "none": None}
+    assert dumps(data) == stdlib(data, False)
+
+def test_list_writer_matches_json_dump(backend, tmp_path):
+    items = [DATA, 1, "two", [3]]
+    for compact in (False, True):
+        path = tmp_path / f'items_{compact}.json'
+        with JSONListWriter(str(path), compact=compact) as writer:
+            writer.write_many(items)
+        assert path.read_text(encoding='utf-8') == stdlib(items, compact)
+    path = tmp_path / 'empty.json'
+    JSONListWriter(str(path)).close()
+    assert path.read_text(encoding='utf-8') == "[]"
+
+def test_save_extracted_data_keeps_non_ascii_text(backend, tmp_path):
+    path = tmp_path / 'extracted.json'
+    save_extracted_data(DATA, str(path))
+    assert path.read_text(encoding='utf-8') == json.dumps(DATA, indent=2, ensure_ascii=False)
+    save_json(DATA, str(path))
+    assert path.read_text(encoding='utf-8') == json.dumps(DATA, indent=2)
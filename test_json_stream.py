@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming JSON loader against json.load
+"""
+
+import json
+
+import pytest
+
+from json_extractor import load_json_file, search_by_value
+from json_index import ValueIndex
+from json_stream import StreamedJSON, build_value, iter_json_events
+
+DOCUMENTS = [
+    {"people": [{"name": "Ann", "age": 34, "tags": ["a", "b"]}, {"name": "Bo", "age": None}]},
+    [1, -2.5, 3e10, "x\"y\\z", "café 😀", True, False, None, [], {}],
+    {"nested": {"deep": [[[{"k": [0, 1.25e-3]}]]]}, "empty": "", "unicode": "☃"},
+    "just a string",
+    42,
+]
+
+def write_json(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+def stream_load(filename, chunk_size):
+    """json.load through the event stream (read to the end, so trailing data is an error)"""
+    events = iter_json_events(filename, chunk_size)
+    value = build_value(next(events), events)
+    for _ in events:
+        pass
+    return value
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 65536])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_stream_matches_json_load(tmp_path, document, chunk_size, indent):
+    # Small chunks put token boundaries inside strings, numbers and literals
+    filename = write_json(tmp_path, 'doc.json', json.dumps(document, indent=indent))
+    with open(filename, encoding='utf-8') as file:
+        expected = json.load(file)
+    assert stream_load(filename, chunk_size) == expected
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 65536])
+def test_stream_accepts_nan_and_infinity(tmp_path, chunk_size):
+    filename = write_json(tmp_path, 'doc.json', '[NaN, Infinity, -Infinity, -1]')
+    values = stream_load(filename, chunk_size)
+    assert values[0] != values[0]
+    assert values[1:] == [float('inf'), float('-inf'), -1]
+
+@pytest.mark.parametrize("text", ['{"a": 1', '[1, 2', '{"a" 1}', '{"a": 1,}', '[1 2]',
+                                  '[1] [2]', '{1: 2}', '[tru]', ''])
+def test_stream_rejects_what_json_load_rejects(tmp_path, text):
+    filename = write_json(tmp_path, 'bad.json', text)
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(text)
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_events(filename, 2))
+    with pytest.raises(json.JSONDecodeError):
+        stream_load(filename, 2)
+
+def test_streamed_json_queries(tmp_path):
+    document = DOCUMENTS[0]
+    filename = write_json(tmp_path, 'doc.json', json.dumps(document))
+    streamed = StreamedJSON(filename, chunk_size=5)
+    assert streamed.get('people[0].tags') == ["a", "b"]
+    assert streamed.get('people[5].name', 'missing') == 'missing'
+    assert streamed.evaluate('people[*].name') == ["Ann", "Bo"]
+    assert list(streamed.items('people')) == document['people']
+    assert list(streamed.search(34)) == ['people[0].age']
+    # Every list is cut, nested ones included
+    assert streamed.sample(list_items=1) == {"people": [{"name": "Ann", "age": 34, "tags": ["a"]}]}
+
+def test_only_large_files_are_streamed(tmp_path):
+    document = DOCUMENTS[0]
+    filename = write_json(tmp_path, 'doc.json', json.dumps(document))
+    assert load_json_file(filename, stream=True) == document
+    assert isinstance(load_json_file(filename, stream=True, stream_threshold=0), StreamedJSON)
+    assert load_json_file(filename, stream=False, stream_threshold=0) == document
+
+def test_value_index_finds_nan(tmp_path):
+    text = '{"a": NaN, "b": [1, NaN], "c": "NaN"}'
+    filename = write_json(tmp_path, 'nan.json', text)
+    for index in (ValueIndex.from_stream(StreamedJSON(filename)), ValueIndex.build(json.loads(text))):
+        assert search_by_value({}, float('nan'), index) == ['a', 'b[1]']
+        assert index.lookup("NaN") == ['c']
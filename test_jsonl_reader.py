@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the JSON Lines reader and the parsers behind it
+"""
+
+import json
+
+import pytest
+
+import json_serializer
+from jsonl_reader import iter_jsonl, load_jsonl, split_chunks
+
+LINES = [
+    '{"id": 12345678901234567890123}',
+    '{"id": -9223372036854775809, "n": 1234567890123456789}',
+    '{"values": [NaN, Infinity, -Infinity]}',
+    '{"name": "café", "big": 1e400, "small": 0.1}',
+    '[1, 2.5, "x", null, true]',
+]
+
+@pytest.fixture(params=json_serializer.available_backends())
+def backend(request):
+    previous = json_serializer.get_backend()
+    json_serializer.use_backend(request.param)
+    yield request.param
+    json_serializer.use_backend(previous)
+
+def same(a, b):
+    """Equal including types, with NaN equal to itself"""
+    return json.dumps(a) == json.dumps(b) and repr(a) == repr(b)
+
+@pytest.mark.parametrize("line", LINES)
+def test_loads_matches_json_loads(backend, line):
+    assert same(json_serializer.loads(line), json.loads(line))
+    assert same(json_serializer.loads(line.encode()), json.loads(line))
+
+def test_loads_raises_json_errors(backend):
+    with pytest.raises(json.JSONDecodeError):
+        json_serializer.loads(b'{"a": ')
+
+def test_lines_parse_like_json_loads(tmp_path, backend):
+    path = tmp_path / 'mixed.jsonl'
+    path.write_text("\n".join(LINES) + "\n\n", encoding='utf-8')
+    assert same(load_jsonl(str(path), workers=1), [json.loads(line) for line in LINES])
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_order_is_kept_across_workers(tmp_path, workers):
+    path = tmp_path / 'people.jsonl'
+    records = [{"id": i, "name": f"person {i}"} for i in range(2000)]
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding='utf-8')
+    # Small chunks, so every worker parses many of them
+    assert len(split_chunks(str(path), 1024)) > 10
+    assert list(iter_jsonl(str(path), workers=workers, chunk_bytes=1024)) == records
+    unordered = list(iter_jsonl(str(path), workers=workers, ordered=False, chunk_bytes=1024))
+    assert sorted(unordered, key=lambda record: record["id"]) == records
+
+def test_chunks_end_on_line_boundaries(tmp_path):
+    path = tmp_path / 'lines.jsonl'
+    path.write_bytes(b'{"a": 1}\n{"b": 22}\n{"c": 333}')
+    chunks = split_chunks(str(path), 3)
+    assert [end for _, _, end in chunks] == [9, 19, 29]
+
+def test_invalid_line_reports_its_byte_offset(tmp_path):
+    path = tmp_path / 'bad.jsonl'
+    path.write_text('{"a": 1}\n{broken\n', encoding='utf-8')
+    with pytest.raises(ValueError, match="at byte 9"):
+        load_jsonl(str(path), workers=1)
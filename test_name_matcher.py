@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk name matching against the one-name-at-a-time substring loop
+"""
+
+import csv
+import random
+
+import pytest
+
+from name_matcher import AhoCorasick, match_names
+from simple_age_extractor import bulk_extract_ages, extract_age_by_name, write_bulk_results
+
+def loop_match(people, query):
+    """Reference: the original loop (either name contains the other, first person wins)"""
+    query = query.lower()
+    for position, person in enumerate(people):
+        if isinstance(person, dict):
+            stored_name = person.get('name', '').lower()
+            if query in stored_name or stored_name in query:
+                return position
+    return None
+
+def random_people(rng, count):
+    # A tiny alphabet, so names and queries overlap in every possible way
+    return [{"name": "".join(rng.choice("abAB ") for _ in range(rng.randint(1, 6))),
+             "age": rng.randint(0, 99)} for _ in range(count)]
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_equal_the_loop(seed):
+    rng = random.Random(seed)
+    people = random_people(rng, rng.randint(0, 30)) + ["not a person", {"age": 3}]
+    rng.shuffle(people)
+    queries = ["".join(rng.choice("abAB ") for _ in range(rng.randint(0, 8))) for _ in range(50)]
+    assert match_names(people, queries) == [loop_match(people, query) for query in queries]
+
+def test_single_lookup_agrees_with_bulk():
+    rng = random.Random(99)
+    people = random_people(rng, 40)
+    for query in ["ab", "BA a", "bbbbbbbb", "A"]:
+        position = match_names(people, [query])[0]
+        expected = None if position is None else people[position]["age"]
+        assert extract_age_by_name(people, query) == expected
+
+def test_automaton_finds_every_occurrence():
+    patterns = ["he", "she", "his", "hers", "e"]
+    text = "ushers and hishe"
+    found = sorted(AhoCorasick(patterns).find(text))
+    expected = sorted(pattern_id for pattern_id, pattern in enumerate(patterns)
+                      for start in range(len(text)) if text.startswith(pattern, start))
+    assert found == expected
+
+def test_bulk_rows_and_csv_output(tmp_path):
+    people = [{"name": "Ann Smith", "age": "34"}, {"name": "Bo", "age": "old"}, {"name": "Cy", "age": 70}]
+    rows = bulk_extract_ages({"people": people}, ["ann", "BO", "zed", "cy jones"])
+    assert [(row["name"], row["category"]) for row in rows] == [
+        ("Ann Smith", "Adult"), ("Bo", "Unknown"), (None, None), ("Cy", "Senior")]
+    path = tmp_path / 'ages.csv'
+    write_bulk_results(rows, str(path))
+    with open(path, newline='', encoding='utf-8') as file:
+        assert [row["query"] for row in csv.DictReader(file)] == ["ann", "BO", "zed", "cy jones"]
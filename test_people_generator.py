@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for the synthetic people dataset generator
+"""
+
+import json
+
+import pytest
+
+from people_generator import CITY_NAMES, MAX_AGE, generate_people, plan_blocks, write_people
+
+def read_people(path):
+    if str(path).endswith('.jsonl'):
+        return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    return json.loads(path.read_text(encoding='utf-8'))["people"]
+
+def read_people_written(tmp_path, name, workers):
+    path = tmp_path / name
+    write_people(str(path), 53, seed=11, workers=workers, block_size=10)
+    return read_people(path)
+
+@pytest.mark.parametrize("count", [0, 1, 7, 25])
+def test_json_document_shape(tmp_path, count):
+    path = tmp_path / 'people.json'
+    write_people(str(path), count, seed=3, workers=1, block_size=10)
+    document = json.loads(path.read_text(encoding='utf-8'))
+    assert len(document["people"]) == count
+    assert document["metadata"]["total_people"] == count
+    for person in document["people"]:
+        assert set(person) == {"name", "age", "city", "email"}
+        assert 0 <= int(person["age"]) <= MAX_AGE and person["city"] in CITY_NAMES
+    assert len({person["email"] for person in document["people"]}) == count
+
+def test_output_does_not_depend_on_workers_or_format(tmp_path):
+    expected = read_people_written(tmp_path, 'one.json', workers=1)
+    assert read_people_written(tmp_path, 'three.json', workers=3) == expected
+    assert read_people_written(tmp_path, 'lines.jsonl', workers=2) == expected
+    assert [person for block in plan_blocks(53, 11, 10) for person in generate_people(block)] == expected
+
+def test_seeds_give_different_people():
+    assert generate_people((1, 0, 0, 20)) != generate_people((2, 0, 0, 20))
+    assert generate_people((1, 0, 0, 20)) == generate_people((1, 0, 0, 20))
+
+def test_parquet_matches_json(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    expected = read_people_written(tmp_path, 'people.json', workers=1)
+    path = tmp_path / 'people.parquet'
+    write_people(str(path), 53, seed=11, workers=2, block_size=10)
+    rows = pq.read_table(str(path)).to_pylist()
+    assert [{**row, "age": str(row["age"])} for row in rows] == expected
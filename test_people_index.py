@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Tests for the people name index
+"""
+
+import pytest
+
+from people_index import PeopleIndex, _array_type, normalize_name
+from person_record import Person, to_people
+
+PEOPLE = [
+    {"name": "Anne Smith"},
+    {"name": None},
+    {"name": "ANNE SMITH"},
+    "not a person",
+    {"city": "Oslo"},
+    {"name": "Straße"},
+    {"name": "Jonas"},
+]
+
+@pytest.fixture(params=["dicts", "records"])
+def people(request):
+    return PEOPLE if request.param == "dicts" else to_people(PEOPLE)
+
+def test_missing_names_normalize_to_empty():
+    assert normalize_name(None) == normalize_name(Person(None).get('name', '')) == ''
+
+@pytest.mark.parametrize("query", ["non", "one", "none", "None"])
+def test_null_names_are_not_found_as_none(people, query):
+    assert PeopleIndex(people).substring(query) == []
+
+def test_lookups_match_a_scan(people):
+    index = PeopleIndex(people)
+    assert len(index) == 6
+    assert index.exact("anne smith") == [0, 2]
+    assert index.exact("STRASSE") == [5]
+    assert index.prefix("ann") == [0, 2]
+    assert index.substring("e s") == [0, 2]
+    assert index.substring("") == [0, 1, 2, 4, 5, 6]
+    assert index.contained_in("hi jonas!") == [1, 4, 6]
+
+def test_large_lists_use_wide_arrays():
+    assert _array_type(2 ** 32 - 1) == 'I'
+    assert _array_type(2 ** 32) == 'Q'
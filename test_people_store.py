@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the columnar people store
+"""
+
+import json
+
+import pytest
+
+from people_store import PeopleStore, import_people
+from person_record import parse_age
+
+pytest.importorskip('pyarrow')
+
+PEOPLE = [
+    {"name": "Ann", "age": "34", "city": "Oslo", "email": "ann@example.com"},
+    {"name": "Bob", "age": 67, "city": "Lima"},
+    {"name": "Cy", "age": "old", "city": "Oslo"},
+    {"name": "Di", "city": "Pune"},
+    {"name": "Ed", "age": "99999999999999999999", "city": "Kyiv"},
+    {"name": "Flo", "age": 12},
+    {"name": "Gus", "age": 40000, "city": "Lima"},
+    {"name": "Hal", "age": 5, "city": "Rome"},
+]
+
+def write_jsonl(path, people):
+    path.write_text("".join(json.dumps(person) + "\n" for person in people), encoding='utf-8')
+    return str(path)
+
+@pytest.mark.parametrize("extension", [".parquet", ".arrow"])
+@pytest.mark.parametrize("batch_size", [1, 3, 100])
+def test_round_trip_over_several_batches(tmp_path, extension, batch_size):
+    # Every batch of 3 has different cities, so the city dictionary grows between batches
+    source = write_jsonl(tmp_path / 'people.jsonl', PEOPLE)
+    target = str(tmp_path / f'people{extension}')
+    assert import_people(source, target, batch_size=batch_size) == len(PEOPLE)
+
+    store = PeopleStore(target)
+    rows = store.query(columns=['name', 'age', 'city', 'email'])
+    assert rows == [{"name": person["name"], "age": parse_age(person.get("age", 0)),
+                     "city": person.get("city"), "email": person.get("email")} for person in PEOPLE]
+    assert [row["name"] for row in store.query() if row["city"] == "Lima"] == ["Bob", "Gus"]
+    assert [row["name"] for row in store.age_range(0, 40)] == ["Ann", "Di", "Flo", "Hal"]
+    # "old", the huge age and 40000 are stored without an age
+    assert store.invalid_ages() == 3
+    assert store.statistics().count == len(PEOPLE) - 3
+
+def test_failed_import_removes_the_target(tmp_path):
+    source = tmp_path / 'people.jsonl'
+    source.write_text(json.dumps(PEOPLE[0]) + "\n{broken\n", encoding='utf-8')
+    target = tmp_path / 'people.arrow'
+    with pytest.raises(ValueError):
+        import_people(str(source), str(target), batch_size=1)
+    assert not target.exists()
+
+def test_target_must_be_columnar(tmp_path):
+    source = write_jsonl(tmp_path / 'people.jsonl', PEOPLE)
+    with pytest.raises(ValueError):
+        import_people(source, str(tmp_path / 'people.csv'))
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Tests for Person records and the people file loader
+"""
+
+import json
+
+import pytest
+
+from person_record import Person, load_people_file
+
+PEOPLE = [
+    {"name": "Ann", "age": 34, "city": "Oslo", "email": "ann@example.com"},
+    {"name": "Bob", "age": "41", "city": "Oslo"},
+    {"name": "Cy", "age": "old", "team": "red"},
+    {"name": "Di"},
+    {"age": 7},
+]
+
+@pytest.mark.parametrize("document", [PEOPLE, {"people": PEOPLE, "source": "test"}])
+def test_records_read_back_as_loaded(tmp_path, document):
+    path = tmp_path / 'people.json'
+    path.write_text(json.dumps(document, indent=2), encoding='utf-8')
+    data = load_people_file(str(path))
+    people = data if isinstance(data, list) else data['people']
+    assert all(isinstance(person, Person) for person in people)
+    assert [person.to_dict() for person in people] == PEOPLE
+    assert [person.age for person in people] == [34, 41, None, 0, 7]
+    assert 'age' not in people[3] and people[2]['team'] == "red"
+
+@pytest.mark.parametrize("text", ['{"people": [{"name": "Ann"},]}', '[{"a": 1}] x', '{"people" []}'])
+def test_invalid_json_raises_like_json_load(tmp_path, text):
+    path = tmp_path / 'people.json'
+    path.write_text(text, encoding='utf-8')
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(text)
+    with pytest.raises(json.JSONDecodeError):
+        load_people_file(str(path))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the temperature aggregation engine
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from csv_schema import TEMPERATURE_SCHEMA, read_typed_csv
+from temperature_stats import (STAT_COLUMNS, TemperatureAccumulator, analyze_temperature_file,
+                               analyze_temperatures)
+
+CONDITIONS = ['Sunny', 'Cloudy', 'Partly Cloudy', 'Rainy']
+
+@pytest.fixture
+def temperature_file(tmp_path):
+    """A year of readings in the generate_temperature_data.py layout"""
+    rng = np.random.default_rng(7)
+    days = 365
+    high = rng.integers(50, 95, days)
+    low = high - rng.integers(5, 30, days)
+    avg = (high + low) / 2
+    df = pd.DataFrame({
+        'Date': pd.date_range('2025-01-01', periods=days).strftime('%Y-%m-%d'),
+        'High_Temp_F': high,
+        'Low_Temp_F': low,
+        'Condition': rng.choice(CONDITIONS, days),
+        'Humidity_%': rng.integers(30, 100, days),
+        'Avg_Temp_F': avg,
+        'Temp_Range_F': high - low,
+        'High_Temp_C': np.round((high - 32) * 5 / 9, 1),
+        'Low_Temp_C': np.round((low - 32) * 5 / 9, 1),
+        'Avg_Temp_C': np.round((avg - 32) * 5 / 9, 1),
+    })
+    path = tmp_path / 'temperature_data.csv'
+    df.to_csv(path, index=False)
+    return str(path)
+
+def test_in_memory_analysis_matches_pandas(temperature_file):
+    df = read_typed_csv(temperature_file, TEMPERATURE_SCHEMA)
+    result = analyze_temperatures(df)
+    for column in STAT_COLUMNS:
+        values = df[column].astype('float64')
+        assert result.mean[column] == pytest.approx(values.mean(), rel=1e-12)
+        assert result.std[column] == pytest.approx(values.std(), rel=1e-9)
+    assert result.hottest['High_Temp_F'] == df['High_Temp_F'].max()
+    assert result.hottest['Date'] == df.loc[df['High_Temp_F'].idxmax(), 'Date'].date()
+    assert result.hot_days == int((df['High_Temp_F'] >= 75).sum())
+    assert result.high_humidity_days == int(result.humid_mask.sum())
+
+def assert_same_analysis(result, expected):
+    assert result.rows == expected.rows
+    assert (result.first_date, result.last_date) == (expected.first_date, expected.last_date)
+    for column in STAT_COLUMNS:
+        assert result.mean[column] == pytest.approx(expected.mean[column], rel=1e-12)
+        assert result.std[column] == pytest.approx(expected.std[column], rel=1e-9)
+        assert result.min[column] == expected.min[column]
+        assert result.max[column] == expected.max[column]
+    assert result.hottest == expected.hottest
+    assert result.coldest == expected.coldest
+    assert result.condition_counts == expected.condition_counts
+    assert list(result.condition_counts) == list(expected.condition_counts)
+    assert (result.hot_days, result.high_humidity_days, result.large_range_days, result.rainy_days) == \
+        (expected.hot_days, expected.high_humidity_days, expected.large_range_days, expected.rainy_days)
+    assert result.high_humidity_avg_temp == pytest.approx(expected.high_humidity_avg_temp, rel=1e-12)
+
+@pytest.mark.parametrize("chunk_rows", [1, 7, 100, 1000])
+def test_chunked_file_matches_in_memory(temperature_file, tmp_path, chunk_rows):
+    df = read_typed_csv(temperature_file, TEMPERATURE_SCHEMA)
+    expected = analyze_temperatures(df)
+    hot_output = tmp_path / 'hot_days.csv'
+    result, head = analyze_temperature_file(temperature_file, chunk_rows, hot_output=str(hot_output))
+    assert_same_analysis(result, expected)
+    assert len(head) == 5
+    assert len(pd.read_csv(hot_output)) == expected.hot_days
+
+@pytest.mark.parametrize("split", [1, 100, 200, 364])
+def test_merged_parts_match_one_pass(temperature_file, split):
+    df = read_typed_csv(temperature_file, TEMPERATURE_SCHEMA)
+    first, second = TemperatureAccumulator(), TemperatureAccumulator()
+    first.update(df.iloc[:split])
+    second.update(df.iloc[split:])
+    assert_same_analysis(first.merge(second).result(), analyze_temperatures(df))
+
+def test_merging_empty_accumulators(temperature_file):
+    df = read_typed_csv(temperature_file, TEMPERATURE_SCHEMA)
+    merged = TemperatureAccumulator().merge(TemperatureAccumulator())
+    merged.update(df)
+    merged.merge(TemperatureAccumulator())
+    assert_same_analysis(merged.result(), analyze_temperatures(df))
+
+def test_load_and_analyze_returns_the_frame(temperature_file, tmp_path, monkeypatch):
+    pytest.importorskip('matplotlib')
+    import analyze_temperature_data
+
+    monkeypatch.chdir(tmp_path)
+    df = analyze_temperature_data.load_and_analyze_temperature_data()
+    assert isinstance(df, pd.DataFrame) and len(df) == 365
+    loaded_df, results = analyze_temperature_data.load_temperature_analysis()
+    assert loaded_df.equals(df) and results.rows == 365